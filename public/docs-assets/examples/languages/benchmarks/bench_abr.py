@@ -0,0 +1,80 @@
+# Benchmark: fixed best-quality audio vs bandwidth-adaptive bitrate
+# A simulated player walks Surah Ya-Sin (time-compressed, as in
+# bench_audio_prefetch.py) while the mock's bandwidth drops from fast to slow
+# and back again. It runs once with the fixed choice of get_best_audio_format
+# (ogg-192) and once with an AbrSelector, and reports stall time, the
+# average bitrate delivered and how often the selector switched formats.
+#
+# Usage: python benchmarks/bench_abr.py
+
+import tempfile
+import time
+
+from mock_server import QURAN_LIST, MockQuranServer, audio_duration
+
+from globalquran import DiskCache, QuranClient
+from globalquran.abr import AbrSelector, format_bitrate
+from globalquran.audio import AudioPrefetcher
+
+SURAH = 36
+RECITOR = 'ar.alafasy'
+MEDIA_INFO = QURAN_LIST[RECITOR]['media']
+TIME_SCALE = 0.02            # 1s of audio plays in 20ms
+LATENCY = 0.01               # seconds before the server starts sending
+STALL = 0.005                # waits longer than this count as a stall
+# (fraction of the surah played, bytes/sec per connection from then on)
+PHASES = [(0.0, 4 * 1024 * 1024), (0.3, 256 * 1024), (0.7, 4 * 1024 * 1024)]
+
+
+def bandwidth_at(progress):
+    return [bandwidth for start, bandwidth in PHASES if progress >= start][-1]
+
+
+def play(prefetcher, mock):
+    waited, stalls = 0.0, 0
+    phase_stalls = [0.0] * len(PHASES)
+    for position, index in enumerate(prefetcher.indices):
+        progress = position / len(prefetcher.indices)
+        mock.bandwidth = bandwidth_at(progress)
+        before = time.perf_counter()
+        prefetcher.fetch(position)
+        wait = time.perf_counter() - before
+        waited += wait
+        stalls += wait > STALL
+        phase_stalls[sum(progress >= start for start, _ in PHASES) - 1] += wait
+        time.sleep(audio_duration(index) * TIME_SCALE)
+    return waited, stalls, phase_stalls
+
+
+def main():
+    fixed = AbrSelector(MEDIA_INFO).formats[0]
+    print(f"Surah {SURAH}, bandwidth per connection "
+          + " -> ".join(f"{bandwidth / 1024:.0f}KB/s" for _, bandwidth in PHASES)
+          + f", playback {1 / TIME_SCALE:.0f}x real time")
+    with tempfile.TemporaryDirectory() as directory, \
+            MockQuranServer(latency=LATENCY) as mock:
+        client = QuranClient(api_key='bench', base_url=mock.base_url)
+        runs = [(f"fixed {fixed['type']}-{fixed['kbs']}", None),
+                ('adaptive', AbrSelector(MEDIA_INFO, speed=1 / TIME_SCALE))]
+        for label, selector in runs:
+            cache = DiskCache(tempfile.mkdtemp(dir=directory), max_bytes=64 * 1024 * 1024)
+            with AudioPrefetcher.for_unit(RECITOR, fixed, 'surah', SURAH, client=client,
+                                          cache=cache, base_url=mock.base_url,
+                                          selector=selector) as prefetcher:
+                waited, stalls, phase_stalls = play(prefetcher, mock)
+                stats = prefetcher.stats()
+                played = prefetcher.formats_used.items()
+                seconds = sum(audio_duration(index) for index, _ in played)
+                bits = sum(format_bitrate(media_format) * audio_duration(index)
+                           for index, media_format in played)
+                print(f"{label:<14} stalled {waited * 1000:6.0f}ms in {stalls:2d} of "
+                      f"{len(prefetcher.indices)} ayahs (per phase: "
+                      + ", ".join(f"{stall * 1000:.0f}ms" for stall in phase_stalls)
+                      + f")  avg {bits / seconds / 1000:5.1f}kbps  "
+                      f"{stats['bytes_downloaded'] / 1024 / 1024:.1f}MB  "
+                      f"switches {stats['switches']}  formats {stats['formats']}")
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
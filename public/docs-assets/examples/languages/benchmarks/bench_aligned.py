@@ -0,0 +1,64 @@
+# Benchmark: side-by-side editions, per-edition fetch + key zipping vs AlignedTable
+# Fetches Al-Baqarah (286 ayahs) in four editions from the mock three ways:
+# one request per edition in turn (what the examples did), one request per
+# edition sent concurrently, and one comma-separated request. It then times
+# rendering every row many times, by zipping the per-edition responses on
+# their string verse keys against iterating the AlignedTable.
+#
+# Usage: python benchmarks/bench_aligned.py
+
+from bench_utils import timed
+from mock_server import MockQuranServer
+
+from globalquran import QuranClient
+from globalquran.aligned import fetch_aligned
+
+EDITIONS = ['quran-simple', 'en.sahih', 'en.pickthall', 'ur.jalandhry']
+SURAH = 2
+LATENCY = 0.03
+RENDERS = 200
+
+
+def fetch_each(client):
+    return [client.get_json(f'/v1/surah/{SURAH}/{quran_id}') for quran_id in EDITIONS]
+
+
+def render_zipped(responses):
+    editions = [data['quran'][quran_id] for data, quran_id in zip(responses, EDITIONS)]
+    rows = []
+    for key, first in editions[0].items():
+        texts = tuple(edition[key]['verse'] for edition in editions)
+        rows.append((first['surah'], first['ayah'], texts))
+    return rows
+
+
+def render_table(table):
+    return [(surah, ayah, texts) for _, surah, ayah, texts in table]
+
+
+def main():
+    with MockQuranServer(latency=LATENCY) as mock:
+        client = QuranClient(api_key='bench', base_url=mock.base_url)
+        print(f"Surah {SURAH} in {len(EDITIONS)} editions, {LATENCY * 1000:.0f}ms per request")
+
+        responses, sequential = timed(fetch_each, client)
+        print(f"  fetch one edition at a time   {sequential * 1000:7.1f}ms")
+        mock.reset_counters()
+        concurrent_table, concurrent = timed(fetch_aligned, EDITIONS, 'surah', SURAH,
+                                             client=client, combined=False)
+        print(f"  fetch_aligned, concurrent     {concurrent * 1000:7.1f}ms  ({mock.requests} requests)")
+        mock.reset_counters()
+        table, combined = timed(fetch_aligned, EDITIONS, 'surah', SURAH, client=client)
+        print(f"  fetch_aligned, comma-joined   {combined * 1000:7.1f}ms  ({mock.requests} request)")
+
+        assert render_zipped(responses) == render_table(table) == render_table(concurrent_table)
+        _, zipped = timed(lambda: [render_zipped(responses) for _ in range(RENDERS)])
+        _, aligned = timed(lambda: [render_table(table) for _ in range(RENDERS)])
+        print(f"Render {len(table)} rows x{RENDERS}")
+        print(f"  zip responses by verse key    {zipped / RENDERS * 1000:7.3f}ms/render")
+        print(f"  iterate AlignedTable          {aligned / RENDERS * 1000:7.3f}ms/render")
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
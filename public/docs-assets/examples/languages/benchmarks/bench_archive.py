@@ -0,0 +1,121 @@
+# Benchmark: bulk recitation download, throughput and crash recovery
+# Part 1 downloads the first juz of a recitation from the mock (per-connection
+# bandwidth, fixed latency) one file at a time and with a worker pool.
+# Part 2 stops a download partway (leaving .part files), starts a fresh
+# AudioArchive on the same directory as a restarted process would, and
+# reports what was skipped, resumed by Range and downloaded again. It then
+# corrupts a finished file and shows verify() catching it. Part 3 cuts 20%
+# of connections mid-body and counts the bytes the retries re-sent.
+#
+# Usage: python benchmarks/bench_archive.py
+
+import os
+import tempfile
+import threading
+import time
+
+from mock_server import MockQuranServer, audio_body
+
+from globalquran import QuranClient
+from globalquran.archive import AudioArchive, file_sha256
+from globalquran.metadata import unit_range
+from globalquran.retry import RetryPolicy
+
+RECITOR = 'ar.alafasy'
+MEDIA_FORMAT = {'type': 'mp3', 'kbs': '128'}
+INDICES = list(unit_range('juz', 1))    # 148 files
+LATENCY = 0.02
+BANDWIDTH = 2 * 1024 * 1024              # bytes/sec per connection
+WORKERS = 8
+STOP_AT = 0.4                            # Fraction of bytes before the "crash"
+DROP_RATE = 0.2
+
+
+def total_bytes():
+    return sum(len(audio_body(f"/{RECITOR}/mp3/128kbs/{index + 1}.mp3")) for index in INDICES)
+
+
+def archive(mock, directory, workers=WORKERS, **kwargs):
+    client = QuranClient(api_key='bench', base_url=mock.base_url, pool_maxsize=workers,
+                         retry=RetryPolicy(backoff_base=0.01))
+    return AudioArchive(RECITOR, MEDIA_FORMAT, directory, indices=INDICES, client=client,
+                        workers=workers, base_url=mock.base_url, **kwargs)
+
+
+def throughput(mock, size):
+    print(f"Part 1: {len(INDICES)} files, {size / 1024 / 1024:.1f}MB, "
+          f"{BANDWIDTH / 1024 / 1024:.0f}MB/s per connection, {LATENCY * 1000:.0f}ms latency")
+    for workers in (1, WORKERS):
+        with tempfile.TemporaryDirectory() as directory, \
+                archive(mock, directory, workers=workers) as downloader:
+            start = time.perf_counter()
+            stats = downloader.run()
+            elapsed = time.perf_counter() - start
+            assert stats['completed'] == len(INDICES) and not stats['failed']
+            print(f"  {workers} worker{'s' if workers > 1 else ' '}  {elapsed:6.2f}s  "
+                  f"{size / elapsed / 1024 / 1024:5.1f}MB/s")
+
+
+def crash_and_resume(mock, size):
+    print(f"Part 2: stop after {STOP_AT:.0%} of the bytes, then restart")
+    with tempfile.TemporaryDirectory() as directory:
+        with archive(mock, directory) as first:
+            def crash():
+                while first.stats()['bytes_downloaded'] < STOP_AT * size:
+                    time.sleep(0.005)
+                first.stop()
+            watcher = threading.Thread(target=crash)
+            watcher.start()
+            stats = first.run()
+            watcher.join()
+        parts = sum(name.endswith('.part') for name in os.listdir(directory))
+        print(f"  first run   {stats['completed']} files finished, {parts} .part files left, "
+              f"{stats['bytes_downloaded'] / 1024 / 1024:.1f}MB")
+
+        mock.reset_counters()
+        with archive(mock, directory) as second:
+            stats = second.run()
+        total = first.bytes_downloaded + stats['bytes_downloaded']
+        print(f"  second run  {stats['skipped']} skipped, {stats['resumed']} resumed "
+              f"({stats['bytes_resumed'] / 1024:.0f}KB kept), {stats['completed']} downloaded, "
+              f"{mock.ranged} Range requests")
+        print(f"  both runs   {total / 1024 / 1024:.2f}MB for {size / 1024 / 1024:.2f}MB of "
+              f"files ({total / size - 1:+.1%})")
+
+        with archive(mock, directory) as checker:
+            victim = checker.path(INDICES[10])
+            with open(victim, 'r+b') as f:
+                f.seek(100)
+                f.write(b'\x00' * 16)
+            bad = checker.verify()
+            stats = checker.run()
+            print(f"  verify      {len(bad)} corrupted file found, re-downloaded "
+                  f"{stats['completed']}; hash ok={file_sha256(victim) == checker.journal.get(os.path.basename(victim))['sha256']}")
+
+
+def flaky(mock, size):
+    print(f"Part 3: {DROP_RATE:.0%} of responses cut off halfway")
+    mock.reset_counters()
+    mock.drop_rate = DROP_RATE
+    with tempfile.TemporaryDirectory() as directory, archive(mock, directory) as downloader:
+        start = time.perf_counter()
+        stats = downloader.run()
+        elapsed = time.perf_counter() - start
+    mock.drop_rate = 0.0
+    print(f"  {stats['completed']} files in {elapsed:.2f}s, {mock.dropped} connections cut, "
+          f"{stats['resumed']} resumed, {len(stats['failed'])} failed; "
+          f"sent {mock.bytes_sent / size - 1:+.1%} over the file sizes")
+
+
+def main():
+    size = total_bytes()
+    with MockQuranServer(latency=LATENCY, bandwidth=BANDWIDTH, seed=3) as mock:
+        throughput(mock, size)
+        print("=" * 60)
+        crash_and_resume(mock, size)
+        print("=" * 60)
+        flaky(mock, size)
+
+
+if __name__ == "__main__":
+    main()
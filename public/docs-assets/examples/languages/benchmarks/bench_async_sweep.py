@@ -0,0 +1,60 @@
+# Benchmark: sequential page loop vs AsyncQuranClient sweeps
+# Every request to the local stand-in server takes `latency` seconds, so the
+# sequential loop is latency-bound while the async sweep scales with the
+# concurrency knob.
+#
+# Usage: python benchmarks/bench_async_sweep.py [latency_ms]
+
+import asyncio
+import sys
+
+from bench_utils import load_example, timed
+from mock_server import MockQuranServer
+
+from globalquran import QuranClient
+from globalquran.aio import AsyncQuranClient
+from globalquran.metadata import TOTAL_PAGES
+
+QURAN_IDS = ['quran-simple', 'quran-uthmani', 'en.sahih']
+
+
+def sequential(fetcher, quran_id: str) -> int:
+    for page in range(1, TOTAL_PAGES + 1):
+        if fetcher.fetch_page(page, quran_id) is None:
+            raise RuntimeError(f"Page {page} failed")
+    return TOTAL_PAGES
+
+
+async def concurrent(base_url: str, concurrency: int) -> int:
+    client = QuranClient(api_key='bench', base_url=base_url, pool_maxsize=concurrency)
+    async with AsyncQuranClient(client, concurrency=concurrency) as aio:
+        sweep = await aio.sweep_pages(QURAN_IDS)
+    client.close()
+    pages = [page for pages in sweep.values() for page in pages]
+    if any(page is None for page in pages):
+        raise RuntimeError("Sweep incomplete")
+    return len(pages)
+
+
+def main():
+    latency = float(sys.argv[1]) / 1000 if len(sys.argv) > 1 else 0.02
+    page_example = load_example('quran-by-page')
+
+    with MockQuranServer(latency=latency) as mock:
+        print(f"Page sweeps with {latency * 1000:.0f}ms server latency")
+        print("=" * 50)
+
+        client = QuranClient(api_key='bench', base_url=mock.base_url)
+        fetcher = page_example.QuranPageFetcher('bench', client=client)
+        count, elapsed = timed(sequential, fetcher, QURAN_IDS[0])
+        print(f"sequential fetch_page, 1 edition:  {elapsed:6.2f}s  {count / elapsed:7.1f} pages/s")
+        client.close()
+
+        for concurrency in (8, 32, 64):
+            count, elapsed = timed(asyncio.run, concurrent(mock.base_url, concurrency))
+            print(f"async sweep, {len(QURAN_IDS)} editions, c={concurrency:<3}  "
+                  f"{elapsed:6.2f}s  {count / elapsed:7.1f} pages/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+# Benchmark: stalls between ayahs with on-demand vs prefetched audio
+# A simulated player walks Surah Ya-Sin (83 ayahs plus the Bismillah),
+# "playing" each file for its synthetic duration (time-compressed) before
+# asking for the next one. It runs once downloading each file when needed,
+# once with the next files prefetched, and once more from the warm cache.
+# Stall time is how long the player waited for a file.
+#
+# Usage: python benchmarks/bench_audio_prefetch.py
+
+import tempfile
+import time
+
+from mock_server import MockQuranServer, audio_duration
+
+from globalquran import DiskCache, QuranClient
+from globalquran.audio import AudioPrefetcher
+
+SURAH = 36
+MEDIA_FORMAT = {'type': 'mp3', 'kbs': '128'}
+TIME_SCALE = 0.02            # 1s of audio plays in 20ms
+LATENCY = 0.03               # seconds before the server starts sending
+BANDWIDTH = 1024 * 1024      # bytes/sec per connection
+STALL = 0.005                # waits longer than this count as a stall
+
+
+def play(prefetcher):
+    waited, stalls = 0.0, 0
+    start = time.perf_counter()
+    for position, index in enumerate(prefetcher.indices):
+        before = time.perf_counter()
+        prefetcher.fetch(position)
+        wait = time.perf_counter() - before
+        waited += wait
+        stalls += wait > STALL
+        time.sleep(audio_duration(index) * TIME_SCALE)
+    return time.perf_counter() - start, waited, stalls
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory, \
+            MockQuranServer(latency=LATENCY, bandwidth=BANDWIDTH) as mock:
+        client = QuranClient(api_key='bench', base_url=mock.base_url)
+        runs = [('on demand', dict(prefetch=0, workers=1), 'cold'),
+                ('prefetch 5, 3 workers', dict(prefetch=5, workers=3), 'cold'),
+                ('replay from cache', dict(prefetch=5, workers=3), 'warm')]
+        cache = None
+        for label, options, state in runs:
+            if state == 'cold':
+                cache = DiskCache(tempfile.mkdtemp(dir=directory), max_bytes=64 * 1024 * 1024)
+            with AudioPrefetcher.for_unit('ar.alafasy', MEDIA_FORMAT, 'surah', SURAH,
+                                          client=client, cache=cache, base_url=mock.base_url,
+                                          **options) as prefetcher:
+                mock.reset_counters()
+                elapsed, waited, stalls = play(prefetcher)
+                audio = sum(audio_duration(index) for index in prefetcher.indices) * TIME_SCALE
+                stats = prefetcher.stats()
+                print(f"{label:<22} {elapsed:6.2f}s for {audio:.2f}s of audio  "
+                      f"stalled {waited * 1000:6.0f}ms in {stalls:2d} of {len(prefetcher.indices)} ayahs  "
+                      f"{stats['downloads']} downloads, {stats['bytes_downloaded'] / 1024 / 1024:.1f}MB, "
+                      f"{mock.requests} requests")
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# Benchmark: catalog filters as list scans vs the indexed Catalog
+# Builds synthetic v2 catalogs (the live one has ~150 entries; the larger
+# size shows how each approach scales) and times the example filters
+# (filter_by_language, get_default_formats, get_formats_by_type) on the
+# plain entry list against the same calls on a Catalog, plus a compound
+# query (language + type + default) and a recitor media query. The Catalog
+# is built once; its build time is reported separately, with the memory
+# held by its CatalogRecords against a decoded copy of the raw JSON.
+#
+# Usage: python benchmarks/bench_catalog_index.py
+
+import json
+import random
+import tracemalloc
+
+from bench_utils import load_example, timed
+
+from globalquran.catalog import Catalog, parse_catalog
+
+SIZES = (150, 20000)
+REPEATS = 2000
+LANGUAGES = ['ar', 'en', 'ur', 'id', 'tr', 'fr', 'de', 'ru', 'bn', 'fa', 'ms', 'es', 'zh', 'sw']
+MEDIA = [('mp3', '32'), ('mp3', '64'), ('mp3', '128'), ('mp3', '192'), ('ogg', '64'), ('ogg', '192')]
+
+
+def synthetic_list(size, seed=0):
+    rng = random.Random(seed)
+    entries = {}
+    for number in range(size):
+        language = rng.choice(LANGUAGES)
+        kind = rng.choices(['translation', 'quran', 'versebyverse', 'tafsir'], [6, 1, 2, 1])[0]
+        entry = {'name': f'Edition {number}', 'english_name': f'Edition {number}',
+                 'native_name': f'Edition {number} ({language})', 'language_code': language,
+                 'type': kind, 'format': 'audio' if kind == 'versebyverse' else 'text',
+                 'source': 'Tanzil.net', 'default': rng.random() < 0.05,
+                 'supported_version': '2.0'}
+        if kind == 'versebyverse':
+            entry['media'] = {f'{media}-{kbs}': {'type': media, 'kbs': kbs}
+                              for media, kbs in rng.sample(MEDIA, 3)}
+        entries[f'{language}.edition{number}'] = entry
+    return {'list': entries}
+
+
+def allocated(func):
+    tracemalloc.start()
+    result = func()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def per_call(func):
+    _, elapsed = timed(lambda: [func() for _ in range(REPEATS)])
+    return elapsed / REPEATS * 1e6
+
+
+def main():
+    example = load_example('quran-v2-quran-list')
+    for size in SIZES:
+        data = synthetic_list(size)
+        entries = list(data['list'].values())
+        catalog, build = timed(Catalog.from_response, data)
+        payload = json.dumps(data)
+        _, raw_bytes = allocated(lambda: json.loads(payload))
+        _, record_bytes = allocated(lambda: parse_catalog(json.loads(payload)))
+        print(f"{size} entries (Catalog built once in {build * 1000:.2f}ms; records "
+              f"{record_bytes / 1024:.0f}KB vs raw dicts {raw_bytes / 1024:.0f}KB)")
+        queries = [
+            ('language = en', lambda source: example.filter_by_language(source, 'en')),
+            ('default', lambda source: example.get_default_formats(source)),
+            ('type = translation', lambda source: example.get_formats_by_type(source, 'translation')),
+        ]
+        for label, query in queries:
+            assert query(entries) == [record.to_dict() for record in query(catalog)]
+            scan, indexed = per_call(lambda: query(entries)), per_call(lambda: query(catalog))
+            print(f"  {label:<34} scan {scan:9.1f}us  index {indexed:8.1f}us  "
+                  f"x{scan / indexed:6.1f}  ({len(query(catalog))} results)")
+
+        def compound_scan():
+            return [e for e in entries if e.get('language_code') == 'ur'
+                    and e.get('type') == 'translation' and e.get('default') == True]
+
+        def media_scan():
+            return [e for e in entries if any(
+                m.get('type') == 'ogg' and m.get('kbs') == '192' for m in e.get('media', {}).values())]
+
+        compound = [
+            ('ur + translation + default', compound_scan,
+             lambda: catalog.query(language_code='ur', type='translation', default=True)),
+            ('recitors with ogg-192', media_scan, lambda: catalog.query(media='ogg-192')),
+        ]
+        for label, scan_query, index_query in compound:
+            assert scan_query() == [record.to_dict() for record in index_query()]
+            scan, indexed = per_call(scan_query), per_call(index_query)
+            print(f"  {label:<34} scan {scan:9.1f}us  index {indexed:8.1f}us  "
+                  f"x{scan / indexed:6.1f}  ({len(index_query())} results)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+# Benchmark: repeated catalog lookups with and without the in-memory memo
+# Also checks single-flight: many threads asking for a cold catalog at once
+# must produce exactly one upstream request.
+#
+# Usage: python benchmarks/bench_catalog_memo.py
+
+import threading
+
+from bench_utils import load_example, timed
+from mock_server import MockQuranServer
+
+from globalquran import configure_client
+from globalquran.memo import catalog_cache
+
+UNCACHED_CALLS = 200
+MEMOIZED_CALLS = 100000
+THREADS = 50
+
+
+def main():
+    translations = load_example('quran-v2-translations')
+
+    with MockQuranServer(latency=0.01) as mock:
+        configure_client(base_url=mock.base_url, api_key='bench')
+        translations.API_BASE = f"{mock.base_url}/v2"
+        fetch = translations.fetch_translations
+
+        print("Catalog lookups")
+        print("=" * 50)
+        _, elapsed = timed(lambda: [fetch.__wrapped__('bench') for _ in range(UNCACHED_CALLS)])
+        print(f"uncached x{UNCACHED_CALLS}:     {elapsed / UNCACHED_CALLS * 1e6:10.1f}us/call  "
+              f"requests={mock.requests}")
+        mock.reset_counters()
+
+        _, elapsed = timed(lambda: [fetch('bench') for _ in range(MEMOIZED_CALLS)])
+        print(f"memoized x{MEMOIZED_CALLS}:  {elapsed / MEMOIZED_CALLS * 1e6:10.1f}us/call  "
+              f"requests={mock.requests}")
+        mock.reset_counters()
+
+        catalog_cache.invalidate()
+        barrier = threading.Barrier(THREADS)
+        results = []
+
+        def worker():
+            barrier.wait()
+            results.append(fetch('bench'))
+
+        threads = [threading.Thread(target=worker) for _ in range(THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        same = all(result is results[0] for result in results)
+        print(f"\n{THREADS} concurrent cold lookups: requests={mock.requests}, "
+              f"shared result={same}")
+        print(f"stats: {catalog_cache.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# Benchmark: bare requests.get vs the shared pooled client
+# Walks all 604 pages against the local stand-in server. The mock sleeps on
+# every new connection to stand in for the TCP+TLS handshake of the live API.
+#
+# Usage: python benchmarks/bench_client_pool.py [handshake_ms]
+
+import sys
+
+import requests
+
+from bench_utils import load_example, timed
+from mock_server import MockQuranServer
+
+from globalquran import configure_client
+from globalquran.metadata import TOTAL_PAGES
+
+
+def sweep_bare(base_url: str) -> int:
+    """One requests.get (and one new connection) per page"""
+    for page in range(1, TOTAL_PAGES + 1):
+        response = requests.get(f"{base_url}/v1/page/{page}/quran-simple?key=bench", timeout=30)
+        response.raise_for_status()
+        response.json()
+    return TOTAL_PAGES
+
+
+def sweep_pooled(fetcher) -> int:
+    """QuranPageFetcher over the shared keep-alive pool"""
+    for page in range(1, TOTAL_PAGES + 1):
+        if fetcher.fetch_page(page) is None:
+            raise RuntimeError(f"Page {page} failed")
+    return TOTAL_PAGES
+
+
+def main():
+    handshake = float(sys.argv[1]) / 1000 if len(sys.argv) > 1 else 0.005
+    page_example = load_example('quran-by-page')
+
+    with MockQuranServer(handshake_delay=handshake) as mock:
+        print(f"Sweeping {TOTAL_PAGES} pages, simulated handshake {handshake * 1000:.1f}ms")
+        print("=" * 50)
+
+        count, elapsed = timed(sweep_bare, mock.base_url)
+        print(f"requests.get:   {count / elapsed:8.1f} req/s  "
+              f"({elapsed:.2f}s, {mock.connections} connections)")
+        mock.reset_counters()
+
+        client = configure_client(base_url=mock.base_url, api_key='bench')
+        fetcher = page_example.QuranPageFetcher('bench', client=client)
+        count, elapsed = timed(sweep_pooled, fetcher)
+        print(f"pooled client:  {count / elapsed:8.1f} req/s  "
+              f"({elapsed:.2f}s, {mock.connections} connections)")
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# Benchmark: one request per ayah lookup vs coalesced page/surah requests
+# Simulates concurrent readers, each opening a view of consecutive ayahs in
+# Arabic and a translation (all lookups of a view fire at once), against a
+# mock API with per-request latency.
+# Reports HTTP requests sent and wall time with and without AyahBatcher.
+#
+# Usage: python benchmarks/bench_coalescing.py
+
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+from bench_utils import load_example, timed
+from mock_server import MockQuranServer
+
+from globalquran import QuranClient
+from globalquran.batching import AyahBatcher
+from globalquran.metadata import TOTAL_AYAHS, ayah_reference
+
+READERS = 32
+AYAHS_PER_READER = 10
+QURAN_IDS = ('quran-simple', 'en.sahih')
+LATENCY = 0.02
+
+
+def reader_lookups(seed):
+    rng = random.Random(seed)
+    start = rng.randrange(TOTAL_AYAHS - AYAHS_PER_READER)
+    return ['%d:%d' % ayah_reference(index) for index in range(start, start + AYAHS_PER_READER)]
+
+
+def run(api, lookups):
+    calls = [(reference, quran_id) for references in lookups
+             for reference in references for quran_id in QURAN_IDS]
+    with ThreadPoolExecutor(max_workers=len(calls)) as pool:
+        return list(pool.map(lambda call: api.fetch_ayah(*call), calls))
+
+
+def main():
+    ayah_example = load_example('quran-by-ayah')
+    lookups = [reader_lookups(seed) for seed in range(READERS)]
+    total = READERS * AYAHS_PER_READER * len(QURAN_IDS)
+    print(f"{READERS} readers x {AYAHS_PER_READER} ayahs x {len(QURAN_IDS)} editions "
+          f"= {total} lookups, {LATENCY * 1000:.0f}ms latency")
+    print("=" * 60)
+
+    with MockQuranServer(latency=LATENCY) as mock:
+        client = QuranClient(api_key='bench', base_url=mock.base_url, pool_maxsize=64)
+
+        api = ayah_example.GlobalQuranAPI('bench', client=client)
+        plain, elapsed = timed(run, api, lookups)
+        print(f"per-ayah requests:  {mock.requests:5d} requests  {elapsed * 1000:7.0f}ms")
+
+        mock.reset_counters()
+        with AyahBatcher(client, window=0.01) as batcher:
+            api = ayah_example.GlobalQuranAPI('bench', client=client, batcher=batcher)
+            batched, elapsed = timed(run, api, lookups)
+        print(f"coalesced:          {mock.requests:5d} requests  {elapsed * 1000:7.0f}ms")
+
+        mock.reset_counters()
+        api = ayah_example.GlobalQuranAPI('bench', client=client)
+        results, elapsed = timed(api.fetch_ayahs, [ref for refs in lookups for ref in refs], QURAN_IDS)
+        print(f"fetch_ayahs batch:  {mock.requests:5d} requests  {elapsed * 1000:7.0f}ms")
+        client.close()
+
+    assert plain == batched
+    assert all(verse is not None for verse in results.values())
+
+
+if __name__ == "__main__":
+    main()
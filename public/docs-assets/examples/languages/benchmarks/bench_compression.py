@@ -0,0 +1,106 @@
+# Benchmark: compressed transfer and storage of complete editions
+# Fetches complete editions and one /all juz response from the mock (with
+# a per-connection bandwidth cap) once per content coding the client can
+# negotiate, reporting the bytes on the wire and the fetch time (after a
+# warm-up request, so the mock's own compression is not counted). It then
+# stores each edition's body in a DiskCache per codec and as edition files
+# (plain and compressed bundles), reporting the disk footprint and the time
+# to get the data back: decompress + json.loads for cache entries, and
+# opening the file and reading every verse for bundles.
+#
+# Usage: python benchmarks/bench_compression.py
+
+import json
+import os
+import tempfile
+
+from bench_utils import timed
+from mock_server import MockQuranServer
+
+from globalquran import DiskCache, QuranClient, VerseStore
+from globalquran.bundle import QuranBundle, write_bundle
+from globalquran.compression import IDENTITY, accept_encoding, available_codecs
+
+EDITIONS = ['quran-simple', 'en.sahih', 'ur.jalandhry']
+PATHS = [f'/v1/quran/{quran_id}' for quran_id in EDITIONS] + ['/v1/all/juz/1/quran-simple,en.sahih']
+BANDWIDTH = 4 * 1024 * 1024    # bytes/sec per connection
+REPEATS = 5
+
+
+def kb(size):
+    return f"{size / 1024:8.0f}KB"
+
+
+def transfer(mock):
+    codings = [IDENTITY] + [name for name in available_codecs()
+                            if accept_encoding((name,)) != IDENTITY]
+    print(f"Transfer at {BANDWIDTH / 1024 / 1024:.0f}MB/s per connection "
+          f"(codings this client can decode: {', '.join(codings)})")
+    bodies = {}
+    for path in PATHS:
+        print(f"  {path}")
+        for coding in codings:
+            with QuranClient(api_key='bench', base_url=mock.base_url,
+                             encodings=() if coding == IDENTITY else (coding,)) as client:
+                client.get_json(path)
+                client.transfer.reset()
+                data, elapsed = timed(client.get_json, path)
+                stats = client.transfer.snapshot()
+            bodies[path] = data
+            print(f"    {coding:<9} wire {kb(stats['wire_bytes'])}  body {kb(stats['body_bytes'])}  "
+                  f"x{stats['ratio']:<5} fetch {elapsed * 1000:6.1f}ms")
+    return bodies
+
+
+def cache_storage(bodies, directory):
+    print("Cached response bodies (DiskCache)")
+    for path in PATHS:
+        payload = json.dumps(bodies[path], ensure_ascii=False).encode('utf-8')
+        print(f"  {path}")
+        for codec in [IDENTITY] + available_codecs():
+            cache = DiskCache(os.path.join(directory, f'cache-{codec}'), compression=codec)
+            key = cache.make_key(path)
+            _, write = timed(cache.put, key, path, payload)
+            entry = cache.get(key)
+            _, read = timed(lambda: [json.loads(entry.read()) for _ in range(REPEATS)])
+            assert json.loads(entry.read()) == bodies[path]
+            print(f"    {codec:<9} disk {kb(entry.size)}  store {write * 1000:6.1f}ms  "
+                  f"read + decode {read / REPEATS * 1000:6.1f}ms")
+
+
+def edition_files(bodies, directory):
+    print("Edition files (bundle.py), open + read all 6,236 verses")
+    for quran_id in EDITIONS:
+        store = VerseStore.from_response(bodies[f'/v1/quran/{quran_id}'], quran_id)
+        expected = [store.verse(index)['verse'] for index in range(len(store))]
+        print(f"  {quran_id}")
+        for codec in [IDENTITY] + available_codecs():
+            path = os.path.join(directory, f'{quran_id}.{codec}.gqb')
+            write_bundle(path, [store], compression=codec)
+
+            def load():
+                with QuranBundle(path) as bundle:
+                    edition = bundle.edition(quran_id)
+                    verses = [edition.verse(index)['verse'] for index in range(len(edition))]
+                    del edition
+                return verses
+
+            verses, _ = timed(load)
+            assert verses == expected
+            _, elapsed = timed(lambda: [load() for _ in range(REPEATS)])
+            print(f"    {codec:<9} disk {kb(os.path.getsize(path))}  "
+                  f"load {elapsed / REPEATS * 1000:6.1f}ms")
+
+
+def main():
+    with MockQuranServer(bandwidth=BANDWIDTH, compression=True) as mock:
+        bodies = transfer(mock)
+    print("=" * 60)
+    with tempfile.TemporaryDirectory() as directory:
+        cache_storage(bodies, directory)
+        print("=" * 60)
+        edition_files(bodies, directory)
+
+
+if __name__ == "__main__":
+    main()
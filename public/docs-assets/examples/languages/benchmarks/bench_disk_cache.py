@@ -0,0 +1,60 @@
+# Benchmark: complete-Quran downloads with and without the disk cache
+# Shows a cold download, a warm start served from disk with zero requests,
+# TTL expiry revalidated with a 304, and LRU eviction under a byte budget.
+#
+# Usage: python benchmarks/bench_disk_cache.py
+
+import tempfile
+
+from bench_utils import load_example, timed
+from mock_server import MockQuranServer
+
+from globalquran import QuranClient
+from globalquran.cache import DiskCache
+
+
+def main():
+    complete_example = load_example('quran-complete')
+
+    with MockQuranServer(latency=0.05) as mock, tempfile.TemporaryDirectory() as directory:
+        client = QuranClient(api_key='bench', base_url=mock.base_url)
+
+        def fetch(cache, quran_id='quran-simple'):
+            fetcher = complete_example.CompleteQuranFetcher('bench', client=client, cache=cache)
+            return fetcher.fetch_complete_quran(quran_id)
+
+        print("Complete Quran fetch timings")
+        print("=" * 50)
+        _, elapsed = timed(fetch, None)
+        print(f"no cache:            {elapsed * 1000:8.1f}ms  requests={mock.requests}")
+        mock.reset_counters()
+
+        cache = DiskCache(directory)
+        _, elapsed = timed(fetch, cache)
+        print(f"cold cache (miss):   {elapsed * 1000:8.1f}ms  requests={mock.requests}")
+        mock.reset_counters()
+
+        # A new DiskCache instance stands in for a fresh process start
+        restarted = DiskCache(directory)
+        _, elapsed = timed(fetch, restarted)
+        print(f"warm start (hit):    {elapsed * 1000:8.1f}ms  requests={mock.requests}")
+        mock.reset_counters()
+
+        expired = DiskCache(directory, ttl=0)
+        _, elapsed = timed(fetch, expired)
+        print(f"ttl expired (304):   {elapsed * 1000:8.1f}ms  requests={mock.requests} "
+              f"not_modified={mock.not_modified}")
+        print(f"stats: {expired.stats()}")
+
+        print("\nLRU eviction with a budget of two editions")
+        print("-" * 30)
+        entry_size = cache.stats()['bytes']
+        bounded = DiskCache(directory, max_bytes=int(entry_size * 2.5))
+        for quran_id in ('quran-uthmani', 'en.sahih', 'en.pickthall'):
+            fetch(bounded, quran_id)
+        print(f"stats: {bounded.stats()}")
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+# Benchmark: response.json() vs decoding.loads() on each installed backend
+# Records one response per endpoint shape from the mock (/v1/quran/<id>,
+# /v1/page/<n>/<ids>, /v2/list/<type>), or loads recorded bodies from a
+# directory of <name>.json files captured from the live API, then times
+# parsing each body: response.json() as the fetchers did, and loads() on
+# the raw bytes with every backend importable here (orjson, ujson, json).
+# The last line scales the complete-edition time to a 50-translation sweep.
+#
+# Usage: python benchmarks/bench_json_decoding.py [fixture_dir]
+
+import os
+import sys
+
+import requests
+
+from bench_utils import timed
+from mock_server import MockQuranServer
+
+from globalquran import QuranClient
+from globalquran.decoding import available_backends, loads, use_backend
+
+PATHS = {
+    'quran/quran-simple': '/v1/quran/quran-simple',
+    'quran/en.sahih': '/v1/quran/en.sahih',
+    'page/1/quran-simple': '/v1/page/1/quran-simple',
+    'page/300/3 editions': '/v1/page/300/quran-simple,en.sahih,ur.jalandhry',
+    'v2/list/translation': '/v2/list/translation',
+    'v2/list/recitor': '/v2/list/recitor',
+    'v2/list/quran': '/v2/list/quran',
+}
+TRANSLATIONS = 50
+TARGET_SECONDS = 0.5   # Time spent per measurement, repeated to reach it
+
+
+def record_fixtures():
+    """Responses as fetched, keyed by fixture name"""
+    with MockQuranServer() as mock, QuranClient(api_key='bench', base_url=mock.base_url) as client:
+        responses = {}
+        for name, path in PATHS.items():
+            response = client.get(path)
+            response.raise_for_status()
+            responses[name] = response
+        return responses
+
+
+def load_fixtures(directory):
+    """Recorded bodies as responses, so response.json() runs as it would live"""
+    responses = {}
+    for file_name in sorted(os.listdir(directory)):
+        if file_name.endswith('.json'):
+            response = requests.Response()
+            with open(os.path.join(directory, file_name), 'rb') as f:
+                response._content = f.read()
+            response.status_code = 200
+            responses[file_name[:-len('.json')]] = response
+    return responses
+
+
+def per_call(func):
+    _, once = timed(func)
+    repeats = max(3, int(TARGET_SECONDS / max(once, 1e-6)))
+    total = 0.0
+    for _ in range(repeats):  # Each result is dropped before the next parse
+        total += timed(func)[1]
+    return total / repeats
+
+
+def main():
+    responses = load_fixtures(sys.argv[1]) if len(sys.argv) > 1 else record_fixtures()
+    backends = available_backends()
+    print(f"Backends installed: {', '.join(backends)}")
+    header = f"{'payload':<22}{'size':>9}  {'response.json()':>16}" + ''.join(
+        f"{'loads/' + name:>14}" for name in backends)
+    print(header)
+    complete = {}
+    for name, response in responses.items():
+        expected = response.json()
+        baseline = per_call(response.json)
+        row = f"{name:<22}{len(response.content) / 1024:8.1f}K  {baseline * 1000:14.2f}ms"
+        for backend in backends:
+            previous = use_backend(backend)
+            assert loads(response.content) == expected
+            elapsed = per_call(lambda: loads(response.content))
+            use_backend(previous)
+            row += f"{elapsed * 1000:12.2f}ms"
+            if name == 'quran/en.sahih':
+                complete[backend] = elapsed
+        print(row)
+        if name == 'quran/en.sahih':
+            complete['response.json()'] = baseline
+    if complete:
+        print(f"{TRANSLATIONS} complete translations: " + ', '.join(
+            f"{label} {seconds * TRANSLATIONS:.2f}s" for label, seconds in complete.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# Benchmark: eager vs lazy decoding of all-in-one (/v1/all) responses
+# Takes /v1/all bodies of a short surah, Al-Baqarah and juz 30 in three
+# editions from the mock and runs three consumers over json.loads (what
+# fetch_all_data returned) and over lazy_json (fetch_all_data(lazy=True)):
+# reading the first ayah, the first three ayahs of each edition,
+# display_all_data from the example (which also counts every edition's
+# ayahs) and reading every verse. Times include
+# parsing; memory is what the result holds afterwards (the lazy one keeps
+# the body) and the peak while consuming, from tracemalloc.
+#
+# Usage: python benchmarks/bench_lazy_response.py
+
+import contextlib
+import io
+import json
+import tracemalloc
+from itertools import islice
+
+from bench_utils import load_example, timed
+from mock_server import MockQuranServer
+
+from globalquran import QuranClient
+from globalquran.lazy import lazy_json
+
+EDITIONS = 'quran-simple,en.sahih,ur.jalandhry'
+PATHS = [f'/v1/all/surah/112/{EDITIONS}', f'/v1/all/surah/2/{EDITIONS}', f'/v1/all/juz/30/{EDITIONS}']
+REPEATS = 20
+
+
+def first_ayah(data):
+    return next(iter(next(iter(data['quran'].values())).values()))['verse']
+
+
+def first_three(data):
+    return [verse['verse'] for edition in data['quran'].values()
+            for verse in islice(edition.values(), 3)]
+
+
+def every_verse(data):
+    return [verse['verse'] for edition in data['quran'].values() for verse in edition.values()]
+
+
+def main():
+    example = load_example('quran-all-in-one-request')
+
+    def display(data):
+        with contextlib.redirect_stdout(io.StringIO()):
+            example.display_all_data(data)
+
+    consumers = [('first ayah', first_ayah), ('first 3 per edition', first_three),
+                 ('display_all_data', display), ('every verse', every_verse)]
+    parsers = [('json.loads', json.loads), ('lazy_json', lazy_json)]
+    with MockQuranServer() as mock, QuranClient(api_key='bench', base_url=mock.base_url) as client:
+        bodies = [client.get(path).content for path in PATHS]
+
+    for path, body in zip(PATHS, bodies):
+        assert every_verse(lazy_json(body)) == every_verse(json.loads(body))
+        print(f"{path} ({len(body) / 1024:.0f}KB)")
+        for label, consume in consumers:
+            row = f"  {label:<20}"
+            for name, parse in parsers:
+                def run():
+                    data = parse(bytes(bytearray(body)))  # A fresh body, as from the network
+                    consume(data)
+                    return data
+
+                _, elapsed = timed(lambda: [run() for _ in range(REPEATS)])
+                tracemalloc.start()
+                data = run()
+                held, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                del data
+                row += (f"  {name} {elapsed / REPEATS * 1000:7.3f}ms "
+                        f"held {held / 1024:6.0f}KB peak {peak / 1024:6.0f}KB")
+            print(row)
+
+
+if __name__ == "__main__":
+    main()
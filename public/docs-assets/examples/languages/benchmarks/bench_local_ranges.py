@@ -0,0 +1,68 @@
+# Benchmark: page/juz/surah requests vs slicing a cached complete edition
+# Downloads one edition with fetch_complete_quran into a shared EditionLibrary,
+# then reads every page and juz through the example fetchers and every surah
+# through the client, once without the library (one API request each) and
+# once with it.
+#
+# Usage: python benchmarks/bench_local_ranges.py
+
+from bench_utils import load_example, timed
+from mock_server import MockQuranServer
+
+from globalquran import QuranClient
+from globalquran.library import EditionLibrary
+from globalquran.metadata import TOTAL_JUZ, TOTAL_PAGES, TOTAL_SURAHS, UNIT_STARTS
+
+LATENCY = 0.02  # seconds per request
+QURAN_ID = 'quran-simple'
+
+
+def read_everything(page_fetcher, juz_fetcher, client, library):
+    pages = [page_fetcher.fetch_page(page, QURAN_ID) for page in range(1, TOTAL_PAGES + 1)]
+    juzs = [juz_fetcher.fetch_juz(juz, QURAN_ID) for juz in range(1, TOTAL_JUZ + 1)]
+    surahs = [(library and library.surah(surah, QURAN_ID))
+              or client.get_json(f'/v1/surah/{surah}/{QURAN_ID}')
+              for surah in range(1, TOTAL_SURAHS + 1)]
+    return pages, juzs, surahs
+
+
+def main():
+    page_example = load_example('quran-by-page')
+    juz_example = load_example('quran-by-juz')
+    complete_example = load_example('quran-complete')
+
+    with MockQuranServer(latency=LATENCY) as mock:
+        client = QuranClient(api_key='bench', base_url=mock.base_url)
+
+        online, online_time = timed(
+            read_everything, page_example.QuranPageFetcher('bench', client=client),
+            juz_example.QuranJuzFetcher('bench', client=client), client, None)
+        online_requests = mock.requests
+
+        library = EditionLibrary()
+        complete = complete_example.CompleteQuranFetcher('bench', client=client, library=library)
+        mock.reset_counters()
+        _, download_time = timed(complete.fetch_complete_quran, QURAN_ID)
+        local, local_time = timed(
+            read_everything, page_example.QuranPageFetcher('bench', client=client, library=library),
+            juz_example.QuranJuzFetcher('bench', client=client, library=library),
+            client, library)
+        assert online == local
+
+        _, unit_time = timed(lambda: [library.unit(unit, number, QURAN_ID)
+                                      for unit, starts in UNIT_STARTS.items()
+                                      for number in range(1, len(starts) + 1)])
+        units = sum(len(starts) for starts in UNIT_STARTS.values())
+        reads = TOTAL_PAGES + TOTAL_JUZ + TOTAL_SURAHS
+        print(f"{reads} page/juz/surah reads over API:  {online_time * 1000:7.0f}ms "
+              f"({online_requests} requests)")
+        print(f"fetch_complete_quran once:           {download_time * 1000:7.0f}ms "
+              f"({mock.requests} request)")
+        print(f"{reads} reads sliced from the edition: {local_time * 1000:7.0f}ms "
+              f"({mock.requests - 1} more requests)")
+        print(f"All {units} units (surah..ruku, page):  {unit_time * 1000:7.0f}ms")
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+# Benchmark: worker memory with parsed vs memory-mapped editions
+# Several worker processes each hold the same editions and serve every page
+# of them. "json" workers parse saved /v1/quran/{quranId} responses into
+# dicts; "mapped" workers open per-edition files through EditionLibrary.
+# Memory is read from /proc/self/smaps_rollup: PSS splits shared pages between
+# the processes mapping them, so mapped text counts once across all workers.
+#
+# Usage: python benchmarks/bench_mapped_editions.py
+
+import json
+import multiprocessing
+import os
+import tempfile
+
+from bench_utils import load_example, timed
+from mock_server import MockQuranServer
+
+from globalquran import QuranClient, VerseStore
+from globalquran.library import EditionLibrary
+from globalquran.metadata import TOTAL_PAGES, page_range
+
+WORKERS = 4
+
+
+def memory_kb():
+    """(RSS, PSS, USS) of this process in kB, or None off Linux"""
+    try:
+        with open('/proc/self/smaps_rollup') as f:
+            fields = {line.split(':')[0]: int(line.split()[1]) for line in f if line.endswith('kB\n')}
+    except OSError:
+        return None
+    uss = fields['Private_Clean'] + fields['Private_Dirty']
+    return fields['Rss'], fields['Pss'], uss
+
+
+def json_worker(paths, quran_ids, barrier, results):
+    editions = {}
+    for path in paths:
+        with open(path, encoding='utf-8') as f:
+            editions.update(json.load(f)['quran'])
+    served = 0
+    for quran_id in quran_ids:
+        verses = editions[quran_id]
+        for page in range(1, TOTAL_PAGES + 1):
+            served += len({str(index + 1): verses[str(index + 1)] for index in page_range(page)})
+    barrier.wait()  # Every worker holds its editions while memory is read
+    results.put((served, memory_kb()))
+    barrier.wait()
+
+
+def mapped_worker(directory, quran_ids, barrier, results):
+    library = EditionLibrary(directory)
+    served = 0
+    for quran_id in quran_ids:
+        for page in range(1, TOTAL_PAGES + 1):
+            served += len(library.page(page, quran_id)['quran'][quran_id])
+    barrier.wait()
+    results.put((served, memory_kb()))
+    barrier.wait()
+    library.close()
+
+
+def run_workers(target, args):
+    barrier = multiprocessing.Barrier(WORKERS)
+    results = multiprocessing.Queue()
+    workers = [multiprocessing.Process(target=target, args=args + (barrier, results))
+               for _ in range(WORKERS)]
+    for worker in workers:
+        worker.start()
+    reports = [results.get() for _ in workers]
+    for worker in workers:
+        worker.join()
+    return reports
+
+
+def report(label, reports):
+    served = reports[0][0]
+    if reports[0][1] is None:
+        print(f"{label:<8} {served:,} verses per worker (no /proc/self/smaps_rollup here)")
+        return
+    rss, pss, uss = (sum(memory[i] for _, memory in reports) / 1024 for i in range(3))
+    print(f"{label:<8} RSS {rss:7.1f}MB  PSS {pss:7.1f}MB  USS {uss:7.1f}MB  "
+          f"({WORKERS} workers, {served:,} verses served each)")
+
+
+def main():
+    page_example = load_example('quran-by-page')
+    with tempfile.TemporaryDirectory() as directory, MockQuranServer() as mock:
+        client = QuranClient(api_key='bench', base_url=mock.base_url)
+        listing = client.get_json('/v1/quran')['quranList']
+        quran_ids = [q for q, info in listing.items() if info.get('format') == 'text']
+
+        library = EditionLibrary(os.path.join(directory, 'editions'))
+        json_paths = []
+        for quran_id in quran_ids:
+            data = client.get_json(f'/v1/quran/{quran_id}')
+            json_paths.append(os.path.join(directory, f'{quran_id}.json'))
+            with open(json_paths[-1], 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            library.save(VerseStore.from_response(data, quran_id), listing[quran_id])
+
+        api_fetcher = page_example.QuranPageFetcher('bench', client=client)
+        local_fetcher = page_example.QuranPageFetcher('bench', client=client, library=library)
+        pages = range(1, TOTAL_PAGES + 1)
+        mock.reset_counters()
+        online, online_time = timed(lambda: [api_fetcher.fetch_page(p, quran_ids[0]) for p in pages])
+        requests = mock.requests
+        mock.reset_counters()
+        local, local_time = timed(lambda: [local_fetcher.fetch_page(p, quran_ids[0]) for p in pages])
+        assert [page['quran'] for page in online] == [page['quran'] for page in local]
+        print(f"fetch_page x{TOTAL_PAGES} over API:       {online_time * 1000:7.0f}ms ({requests} requests)")
+        print(f"fetch_page x{TOTAL_PAGES} from mapped file: {local_time * 1000:5.0f}ms "
+              f"({mock.requests} requests)")
+        library.close()
+        client.close()
+
+        print("=" * 60)
+        print(f"{len(quran_ids)} editions per worker")
+        report('json', run_workers(json_worker, (json_paths, quran_ids)))
+        report('mapped', run_workers(mapped_worker, (library.directory, quran_ids)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+# Benchmark: building an offline mirror and serving editions from it
+# Mirrors every text edition from a high-latency mock API, then compares
+# fetching complete editions over the API with reading them from the bundle.
+#
+# Usage: python benchmarks/bench_mirror.py
+
+import os
+import tempfile
+
+from bench_utils import load_example, timed
+from mock_server import MockQuranServer
+
+from globalquran import QuranClient
+from globalquran.bundle import QuranBundle
+from globalquran.metadata import TOTAL_AYAHS
+
+LATENCY = 0.3  # seconds per request, as seen far from the API
+
+
+def main():
+    complete_example = load_example('quran-complete')
+    with tempfile.TemporaryDirectory() as directory, MockQuranServer(latency=LATENCY) as mock:
+        path = os.path.join(directory, 'quran.gqb')
+        client = QuranClient(api_key='bench', base_url=mock.base_url)
+        fetcher = complete_example.CompleteQuranFetcher('bench', client=client)
+
+        summary, elapsed = timed(fetcher.build_mirror, path)
+        print(f"Mirror: {len(summary['editions'])} editions, {summary['bytes'] / 1024 / 1024:.1f}MB, "
+              f"{mock.requests} requests, {elapsed:.2f}s at {LATENCY * 1000:.0f}ms latency")
+        print("=" * 60)
+
+        quran_ids = summary['editions']
+        mock.reset_counters()
+        online, online_time = timed(lambda: [fetcher.fetch_complete_quran(q) for q in quran_ids])
+
+        with QuranBundle(path) as bundle:
+            offline_fetcher = complete_example.CompleteQuranFetcher('bench', client=client,
+                                                                    bundle=bundle)
+            mock.reset_counters()
+            _, open_time = timed(lambda: [offline_fetcher.fetch_verse_store(q) for q in quran_ids])
+            offline, offline_time = timed(
+                lambda: [offline_fetcher.fetch_complete_quran(q) for q in quran_ids])
+            assert online == offline
+            assert all(bundle.verify(q) for q in quran_ids)
+            store = bundle.edition(quran_ids[0])
+            _, lookup_time = timed(lambda: [store.text(i) for i in range(TOTAL_AYAHS)])
+            print(f"fetch_complete_quran x{len(quran_ids)} over API:  {online_time * 1000:8.0f}ms")
+            print(f"fetch_complete_quran x{len(quran_ids)} from bundle: {offline_time * 1000:7.0f}ms "
+                  f"({mock.requests} requests)")
+            print(f"fetch_verse_store x{len(quran_ids)} from bundle:    {open_time * 1000:7.2f}ms")
+            print(f"6,236 verse lookups on a mapped edition: {lookup_time * 1000:7.2f}ms")
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# Benchmark: hedged requests for tail latency, circuit breaker for outages
+# Part 1 sends fetch_ayah lookups to a mock whose responses are fast except
+# for a slow 3% tail, with and without a Hedger, and reports latency
+# percentiles and the extra requests hedging cost. Part 2 switches the mock
+# into an outage (every request slow and failing) and compares how long a
+# batch of lookups takes with and without a CircuitBreaker, then lets the
+# breaker probe its way closed once the mock recovers.
+#
+# Usage: python benchmarks/bench_resilience.py
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from bench_utils import load_example, timed
+from mock_server import MockQuranServer
+
+from globalquran import QuranClient
+from globalquran.circuit import CircuitBreaker
+from globalquran.hedging import Hedger
+from globalquran.metadata import ayah_reference
+from globalquran.retry import RetryPolicy
+
+WORKERS = 8
+LOOKUPS = 800
+LATENCY = 0.005
+SLOW_RATE = 0.03
+SLOW_LATENCY = 0.3
+OUTAGE_LATENCY = 1.0
+OUTAGE_LOOKUPS = 80
+REFERENCES = ['%d:%d' % ayah_reference(index) for index in range(7, 7 + LOOKUPS)]
+
+
+def percentile(samples, q):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def timed_lookups(api, references):
+    def lookup(reference):
+        start = time.perf_counter()
+        data = api.fetch_ayah(reference)
+        return time.perf_counter() - start, data
+
+    with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+        return list(pool.map(lookup, references))
+
+
+def tail_latency(ayah_example):
+    print(f"Part 1: {LOOKUPS} lookups, {WORKERS} threads, {LATENCY * 1000:.0f}ms latency, "
+          f"{SLOW_RATE:.0%} take +{SLOW_LATENCY * 1000:.0f}ms")
+    for label, hedger in (('plain', None), ('hedged at p95', Hedger())):
+        with MockQuranServer(latency=LATENCY, slow_rate=SLOW_RATE,
+                             slow_latency=SLOW_LATENCY, seed=1) as mock:
+            client = QuranClient(api_key='bench', base_url=mock.base_url,
+                                 pool_maxsize=WORKERS * 2, hedger=hedger)
+            api = ayah_example.GlobalQuranAPI('bench', client=client)
+            results = timed_lookups(api, REFERENCES[:LOOKUPS])
+            latencies = [seconds for seconds, _ in results]
+            assert all(data is not None for _, data in results)
+            extra = mock.requests - LOOKUPS
+            print(f"  {label:<14} p50 {percentile(latencies, 0.5) * 1000:6.1f}ms  "
+                  f"p95 {percentile(latencies, 0.95) * 1000:6.1f}ms  "
+                  f"p99 {percentile(latencies, 0.99) * 1000:6.1f}ms  "
+                  f"max {max(latencies) * 1000:6.1f}ms  extra requests {extra} "
+                  f"({extra / LOOKUPS:.1%})")
+            client.close()
+            if hedger is not None:
+                hedger.close()
+
+
+def outage(ayah_example):
+    print(f"Part 2: {OUTAGE_LOOKUPS} lookups during an outage "
+          f"(every request {OUTAGE_LATENCY * 1000:.0f}ms then 503), one retry each")
+    for label, breaker in (('no breaker', None),
+                           ('circuit breaker', CircuitBreaker(failure_threshold=5,
+                                                              reset_timeout=0.5))):
+        with MockQuranServer(latency=OUTAGE_LATENCY, error_rate=1.0) as mock:
+            client = QuranClient(api_key='bench', base_url=mock.base_url, pool_maxsize=WORKERS,
+                                 retry=RetryPolicy(max_retries=1, backoff_base=0.05),
+                                 breaker=breaker)
+            api = ayah_example.GlobalQuranAPI('bench', client=client)
+            results, elapsed = timed(timed_lookups, api, REFERENCES[:OUTAGE_LOOKUPS])
+            failed = sum(data is None for _, data in results)
+            line = (f"  {label:<16} {elapsed:6.2f}s  {failed} failed  "
+                    f"{mock.requests} requests reached the API")
+            if breaker is not None:
+                line += f"  ({breaker.stats()['rejected']} refused while open)"
+                mock.latency, mock.error_rate = LATENCY, 0.0  # The API recovers
+                time.sleep(breaker.reset_timeout)
+                recovered = api.fetch_ayah('1:1') is not None
+                line += f"; after recovery: {breaker.state}, lookup ok={recovered}"
+            print(line)
+            client.close()
+
+
+def main():
+    ayah_example = load_example('quran-by-ayah')
+    ayah_example.print = lambda *args, **kwargs: None  # Silence per-lookup error lines
+    tail_latency(ayah_example)
+    print("=" * 60)
+    outage(ayah_example)
+
+
+if __name__ == "__main__":
+    main()
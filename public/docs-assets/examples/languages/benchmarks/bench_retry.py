@@ -0,0 +1,57 @@
+# Benchmark: a 604-page sweep against a flaky, rate-limited API
+# The mock answers 3% of requests with 503 and anything over its per-second
+# limit with 429 + Retry-After. The sweep runs with retries off, with retries
+# only, and with retries plus a client-side token bucket set just under the
+# server's limit, reporting dropped pages, wall time and retry metrics.
+#
+# Usage: python benchmarks/bench_retry.py
+
+from concurrent.futures import ThreadPoolExecutor
+
+from bench_utils import load_example, timed
+from mock_server import MockQuranServer
+
+from globalquran import QuranClient
+from globalquran.metadata import TOTAL_PAGES
+from globalquran.retry import RateLimiter, RetryPolicy
+
+LATENCY = 0.02     # seconds per request
+SERVER_LIMIT = 60  # requests per second before the mock answers 429
+ERROR_RATE = 0.03
+WORKERS = 8
+
+
+def sweep(page_example, client):
+    fetcher = page_example.QuranPageFetcher('bench', client=client)
+    with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+        return list(pool.map(fetcher.fetch_page, range(1, TOTAL_PAGES + 1)))
+
+
+def main():
+    page_example = load_example('quran-by-page')
+    page_example.print = lambda *args, **kwargs: None  # Silence per-page error lines
+    setups = [
+        ('no retries', RetryPolicy(max_retries=0), None),
+        ('retries', RetryPolicy(backoff_base=0.1), None),
+        ('retries + token bucket', RetryPolicy(backoff_base=0.1),
+         RateLimiter(rate=SERVER_LIMIT * 0.9, burst=WORKERS)),
+    ]
+    print(f"{TOTAL_PAGES} pages, {WORKERS} threads, server limit {SERVER_LIMIT}/s, "
+          f"{ERROR_RATE:.0%} 503s, {LATENCY * 1000:.0f}ms latency")
+    print("=" * 60)
+    for label, policy, limiter in setups:
+        with MockQuranServer(latency=LATENCY, error_rate=ERROR_RATE,
+                             rate_limit=SERVER_LIMIT) as mock:
+            client = QuranClient(api_key='bench', base_url=mock.base_url, pool_maxsize=WORKERS,
+                                 retry=policy, rate_limiter=limiter)
+            pages, elapsed = timed(sweep, page_example, client)
+            dropped = sum(page is None for page in pages)
+            metrics = client.metrics.snapshot()
+            print(f"{label:<24} {elapsed:6.2f}s  {TOTAL_PAGES / elapsed:5.1f} pages/s  "
+                  f"dropped {dropped:3d}  429s {mock.throttled:4d}  503s {mock.errors:3d}  "
+                  f"retries {metrics['retries']:4d}  throttled {metrics['throttle_seconds']:.1f}s")
+            client.close()
+
+
+if __name__ == "__main__":
+    main()
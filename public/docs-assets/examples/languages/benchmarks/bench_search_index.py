@@ -0,0 +1,75 @@
+# Benchmark: linear search_verses scan vs the inverted SearchIndex
+# Reports index build time once, then queries/sec for the scan and for the
+# index's substring, term, prefix and phrase queries. The vocabulary pass of
+# a substring query is also timed on its own, as a scan over every token vs
+# the n-gram index. The Arabic-normalized index is checked against a scan
+# that normalizes every verse per query.
+#
+# Usage: python benchmarks/bench_search_index.py
+
+import json
+
+from bench_utils import load_example, timed
+from mock_server import MockQuranServer
+
+from globalquran import QuranClient
+from globalquran.arabic import normalize_arabic
+
+QUERIES = ['رحمة', 'الرحيم', 'النَّاسِ', 'لِلَّهِ رَبِّ']
+# Bare-letter queries that only match once tashkeel and ta marbuta are folded
+NORMALIZED_QUERIES = ['رحمه', 'الرحمن', 'امنوا', 'لله رب', 'علي']
+
+
+def rate(func, queries, rounds):
+    _, elapsed = timed(lambda: [func(q) for _ in range(rounds) for q in queries])
+    return len(queries) * rounds / elapsed
+
+
+def main():
+    complete_example = load_example('quran-complete')
+    with MockQuranServer() as mock:
+        client = QuranClient(api_key='bench', base_url=mock.base_url)
+        data = json.loads(client.get('/v1/quran/quran-simple').content)
+        client.close()
+
+    fetcher = complete_example.CompleteQuranFetcher('bench', client=client)
+    index, elapsed = timed(fetcher.build_search_index, data, normalize=False)
+    print(f"Index build: {elapsed * 1000:.0f}ms, {len(index.vocabulary):,} distinct tokens")
+    normalized, elapsed = timed(fetcher.build_search_index, data)
+    print(f"Normalized index build: {elapsed * 1000:.0f}ms, "
+          f"{len(normalized.vocabulary):,} distinct tokens")
+    print("=" * 50)
+
+    for query in QUERIES:
+        scan = fetcher.search_verses(data, query)
+        indexed = fetcher.search_verses(data, query, index=index)
+        assert [(v['surah'], v['ayah']) for v in scan] == \
+               [(v['surah'], v['ayah']) for v in indexed], query
+
+    def normalizing_scan(query):
+        query = normalize_arabic(query)
+        return [(v['surah'], v['ayah']) for surah in data['quran'].values()
+                for v in surah.values() if query in normalize_arabic(v['verse'])]
+
+    for query in NORMALIZED_QUERIES:
+        hits = [(v['surah'], v['ayah']) for v in normalized.verses(normalized.contains(query))]
+        assert hits == normalizing_scan(query), query
+        assert hits, query
+
+    words = [index.tokenize(query)[0] for query in QUERIES]
+    for query in words:
+        assert index.substring_tokens(query) == [t for t in index.vocabulary if query in t]
+    print(f"vocabulary scan:        {rate(lambda q: [t for t in index.vocabulary if q in t], words, 200):10.1f} q/s")
+    print(f"vocabulary n-grams:     {rate(index.substring_tokens, words, 200):10.1f} q/s")
+    print(f"search_verses scan:     {rate(lambda q: fetcher.search_verses(data, q), QUERIES, 5):10.1f} q/s")
+    print(f"index.contains:         {rate(index.contains, QUERIES, 50):10.1f} q/s")
+    print(f"index.term:             {rate(index.term, ['النَّاسِ', 'الرَّحِيمِ'], 2000):10.1f} q/s")
+    print(f"index.prefix:           {rate(index.prefix, ['الرَّ', 'وَ'], 200):10.1f} q/s")
+    print(f"index.phrase:           {rate(index.phrase, ['لِلَّهِ رَبِّ', 'هُوَ النَّاسِ'], 200):10.1f} q/s")
+    print("-" * 50)
+    print(f"normalizing scan:       {rate(normalizing_scan, NORMALIZED_QUERIES, 2):10.1f} q/s")
+    print(f"normalized contains:    {rate(normalized.contains, NORMALIZED_QUERIES, 50):10.1f} q/s")
+
+
+if __name__ == "__main__":
+    main()
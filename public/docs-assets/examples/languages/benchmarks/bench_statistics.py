@@ -0,0 +1,77 @@
+# Benchmark: per-verse statistics loop vs the single-pass stats engine
+# Loads every text edition from the mock API into VerseStores, then times the
+# original split()/len() loop over verse dicts against edition_statistics()
+# with NumPy (when installed) and with the pure-Python fallback.
+#
+# Usage: python benchmarks/bench_statistics.py
+
+import json
+
+from bench_utils import timed
+from mock_server import QURAN_LIST, MockQuranServer
+
+from globalquran import QuranClient, VerseStore
+from globalquran import stats as stats_module
+from globalquran.metadata import juz_of, page_of, global_ayah_index
+from globalquran.responses import iter_editions
+
+ROUNDS = 3
+
+
+def loop_statistics(verses):
+    """The dict-per-verse loop the engine replaces, extended to juz and page"""
+    totals = {'surah': {}, 'juz': {}, 'page': {}}
+    for verse in verses:
+        index = global_ayah_index(verse['surah'], verse['ayah'])
+        words, characters = len(verse['verse'].split()), len(verse['verse'])
+        for unit, number in (('surah', verse['surah']), ('juz', juz_of(index)),
+                             ('page', page_of(index))):
+            counts = totals[unit].setdefault(number, [0, 0, 0])
+            counts[0] += 1
+            counts[1] += words
+            counts[2] += characters
+    return totals
+
+
+def as_dicts(result):
+    return {unit: {number + 1: [int(counts.verses[number]), int(counts.words[number]),
+                                int(counts.characters[number])]
+                   for number in range(len(counts.verses)) if counts.verses[number]}
+            for unit, counts in result.items()}
+
+
+def main():
+    text_ids = [quran_id for quran_id, info in QURAN_LIST.items() if info['format'] == 'text']
+    with MockQuranServer() as mock:
+        client = QuranClient(api_key='bench', base_url=mock.base_url)
+        data = json.loads(client.get(f"/v1/quran/{','.join(text_ids)}").content)
+        client.close()
+    editions = dict(iter_editions(data))
+    stores = list(VerseStore.editions_from_response(data).values())
+    print(f"{len(stores)} editions, {sum(len(s) for s in stores):,} verses, "
+          f"{sum(len(s.buffer) for s in stores) / 1024 / 1024:.1f}MB of text")
+    print("=" * 50)
+
+    expected, loop_time = timed(lambda: [[loop_statistics(editions[s.quran_id]) for s in stores]
+                                         for _ in range(ROUNDS)])
+    print(f"dict loop:          {loop_time / ROUNDS * 1000:8.1f}ms per sweep")
+
+    numpy = stats_module.np
+    for label, backend in (('numpy', numpy), ('pure python', None)):
+        if label == 'numpy' and numpy is None:
+            print("numpy:              not installed")
+            continue
+        stats_module.np = backend
+        try:
+            result, elapsed = timed(lambda: [stats_module.batch_statistics(stores)
+                                             for _ in range(ROUNDS)])
+        finally:
+            stats_module.np = numpy
+        for store, loop_result in zip(stores, expected[0]):
+            assert as_dicts(result[0][store.quran_id]) == loop_result, (label, store.quran_id)
+        print(f"{label + ':':<19} {elapsed / ROUNDS * 1000:8.1f}ms per sweep "
+              f"({loop_time / elapsed:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
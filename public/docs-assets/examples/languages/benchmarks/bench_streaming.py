@@ -0,0 +1,76 @@
+# Benchmark: response.json() vs streaming the complete-Quran payload
+# Downloads one edition over a bandwidth-limited mock API and compares peak
+# Python heap, time to the first verse and time to finished statistics. The
+# server runs in a child process so its own allocations are not traced.
+#
+# Usage: python benchmarks/bench_streaming.py
+
+import multiprocessing
+import time
+import tracemalloc
+
+from bench_utils import load_example
+from mock_server import MockQuranServer
+
+from globalquran import QuranClient
+
+BANDWIDTH = 8 * 1024 * 1024  # bytes/sec
+
+
+def serve(ready, stop):
+    with MockQuranServer(bandwidth=BANDWIDTH) as mock:
+        ready.put(mock.base_url)
+        stop.wait()
+
+
+def measure(label, fetch_verses, fetcher):
+    """Time one untraced run, then trace a second run for peak heap"""
+    start = time.perf_counter()
+    first = None
+
+    def timed_verses():
+        nonlocal first
+        for verse in fetch_verses():
+            if first is None:
+                first = time.perf_counter() - start
+            yield verse
+
+    stats = fetcher.get_quran_statistics(timed_verses())
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    fetcher.get_quran_statistics(fetch_verses())
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<12} first verse {first * 1000:7.0f}ms   stats done {elapsed * 1000:7.0f}ms   "
+          f"peak heap {peak / 1024 / 1024:6.2f}MB")
+    return stats
+
+
+def main():
+    complete_example = load_example('quran-complete')
+    ready, stop = multiprocessing.Queue(), multiprocessing.Event()
+    server = multiprocessing.Process(target=serve, args=(ready, stop), daemon=True)
+    server.start()
+    try:
+        client = QuranClient(api_key='bench', base_url=ready.get(timeout=10))
+        fetcher = complete_example.CompleteQuranFetcher('bench', client=client)
+
+        def whole():
+            data = client.get_json('/v1/quran/quran-simple')
+            return (verse for edition in data['quran'].values() for verse in edition.values())
+
+        print(f"One edition at {BANDWIDTH / 1024 / 1024:.0f}MB/s")
+        print("=" * 70)
+        buffered = measure('json()', whole, fetcher)
+        streamed = measure('streaming', fetcher.stream_complete_quran, fetcher)
+        assert buffered == streamed
+        print(f"{streamed['total_verses']:,} verses, {streamed['total_words']:,} words")
+        client.close()
+    finally:
+        stop.set()
+        server.join()
+
+
+if __name__ == "__main__":
+    main()
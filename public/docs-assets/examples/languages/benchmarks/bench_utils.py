@@ -0,0 +1,31 @@
+# Shared helpers for the benchmark scripts
+
+import importlib.util
+import os
+import sys
+import time
+from typing import Any, Callable, Tuple
+
+EXAMPLES_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, EXAMPLES_DIR)
+
+
+def load_example(name: str) -> Any:
+    """
+    Import one of the example scripts (their file names contain dashes)
+
+    Args:
+        name (str): Script name without extension, e.g. 'quran-by-page'
+    """
+    path = os.path.join(EXAMPLES_DIR, f"{name}.py")
+    spec = importlib.util.spec_from_file_location(name.replace('-', '_'), path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def timed(func: Callable, *args, **kwargs) -> Tuple[Any, float]:
+    """Run func and return (result, elapsed seconds)"""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
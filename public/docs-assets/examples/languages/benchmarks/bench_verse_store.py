@@ -0,0 +1,67 @@
+# Benchmark: memory of the nested dict response vs VerseStore
+# Measures what CompleteQuranFetcher keeps alive today (the decoded
+# {"quran": {...}} tree) against a VerseStore holding the same verses,
+# for the Arabic text plus a few translations.
+#
+# Usage: python benchmarks/bench_verse_store.py
+
+import gc
+import json
+import time
+import tracemalloc
+
+from mock_server import MockQuranServer
+
+from globalquran import QuranClient
+from globalquran.metadata import TOTAL_AYAHS
+from globalquran.store import VerseStore
+
+EDITIONS = ['quran-simple', 'en.sahih', 'en.pickthall', 'ur.jalandhry']
+
+
+def retained(build):
+    """Bytes still allocated by the object build() returns"""
+    gc.collect()
+    tracemalloc.start()
+    obj = build()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return obj, size
+
+
+def main():
+    with MockQuranServer() as mock:
+        client = QuranClient(api_key='bench', base_url=mock.base_url)
+        payloads = {quran_id: client.get(f"/v1/quran/{quran_id}").content for quran_id in EDITIONS}
+        client.close()
+
+    print(f"Memory for {len(EDITIONS)} editions x {TOTAL_AYAHS} verses")
+    print("=" * 50)
+    dicts, dict_bytes = retained(lambda: [json.loads(payloads[q]) for q in EDITIONS])
+    print(f"nested dicts:  {dict_bytes / 1e6:8.2f} MB")
+
+    stores, store_bytes = retained(
+        lambda: [VerseStore.from_response(json.loads(payloads[q]), q) for q in EDITIONS])
+    print(f"VerseStore:    {store_bytes / 1e6:8.2f} MB  ({dict_bytes / store_bytes:.1f}x smaller)")
+
+    print("\nLookup speed (all verses, 10 passes)")
+    print("-" * 30)
+    data = dicts[0]['quran']['quran-simple']
+    store = stores[0]
+    start = time.perf_counter()
+    for _ in range(10):
+        for verse_no in range(1, TOTAL_AYAHS + 1):
+            data[str(verse_no)]['verse']
+    dict_time = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(10):
+        for index in range(TOTAL_AYAHS):
+            store.text(index)
+    store_time = time.perf_counter() - start
+    print(f"dict lookup:        {dict_time / (10 * TOTAL_AYAHS) * 1e9:6.0f} ns/verse")
+    print(f"VerseStore.text():  {store_time / (10 * TOTAL_AYAHS) * 1e9:6.0f} ns/verse")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+# Benchmark: cold start of a fetcher process, from the API vs a snapshot
+# Each run starts a fresh interpreter, as a serverless cold start does, that
+# gets the Quran list and one complete edition as a VerseStore and reads a
+# verse. The time is measured from process launch to the answer.
+# - api: imports the client and fetches both from the mock (with a
+#   round-trip latency and a bandwidth cap like a distant API), as
+#   fetch_quran_list and fetch_verse_store do without a snapshot.
+# - example + snapshot: loads quran-complete.py with GLOBALQURAN_SNAPSHOT
+#   set, so its fetcher serves from the snapshot, but the script's own
+#   imports (requests among them) still run.
+# - snapshot only: a handler importing just globalquran.snapshot.
+# The handler's import time and whether requests was loaded are reported
+# as well.
+#
+# Usage: python benchmarks/bench_warm_start.py
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from bench_utils import EXAMPLES_DIR
+from mock_server import MockQuranServer
+
+from globalquran import QuranClient
+from globalquran.snapshot import build_snapshot
+
+QURAN_ID = 'quran-simple'
+LATENCY = 0.1                  # seconds per request
+BANDWIDTH = 4 * 1024 * 1024    # bytes/sec per connection
+RUNS = 5
+
+_PRELUDE = f"""
+import json, os, sys, time
+sys.path.insert(0, {EXAMPLES_DIR!r})
+started = time.perf_counter()
+"""
+_REPORT = """
+print(json.dumps({'imports': imported - started, 'answer': time.perf_counter() - started,
+                  'verse': verse, 'editions': len(listing['quranList']),
+                  'requests': 'requests' in sys.modules}))
+"""
+
+_BARE = """
+imported = time.perf_counter()
+listing, verse = {'quranList': {}}, ''
+"""
+
+HANDLERS = {
+    'api': """
+from globalquran import configure_client
+from globalquran.store import VerseStore
+imported = time.perf_counter()
+client = configure_client(api_key='bench', base_url=os.environ['BENCH_BASE_URL'])
+listing = client.get_json('/v1/quran')
+store = VerseStore.from_response(client.get_json(f'/v1/quran/{QURAN_ID}', timeout=60), QURAN_ID)
+verse = store.verse(0)['verse']
+""",
+    'example + snapshot': """
+import importlib.util
+spec = importlib.util.spec_from_file_location('quran_complete', os.path.join(sys.path[0], 'quran-complete.py'))
+example = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(example)
+from globalquran.snapshot import open_snapshot
+imported = time.perf_counter()
+listing = open_snapshot().list_response('quran')
+verse = example.CompleteQuranFetcher('bench').fetch_verse_store(QURAN_ID).verse(0)['verse']
+""",
+    'snapshot only': """
+from globalquran.snapshot import open_snapshot
+imported = time.perf_counter()
+snapshot = open_snapshot()
+listing = snapshot.list_response('quran')
+verse = snapshot.edition(QURAN_ID).verse(0)['verse']
+""",
+}
+
+
+def run(handler, env):
+    source = _PRELUDE + f"QURAN_ID = {QURAN_ID!r}\n" + handler + _REPORT
+    start = time.perf_counter()
+    output = subprocess.run([sys.executable, '-c', source], env=env, check=True,
+                            capture_output=True, text=True).stdout
+    wall = time.perf_counter() - start
+    return wall, json.loads(output.splitlines()[-1])
+
+
+def main():
+    with MockQuranServer(latency=LATENCY, bandwidth=BANDWIDTH) as mock, \
+            tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'quran.gqs')
+        with QuranClient(api_key='bench', base_url=mock.base_url) as client:
+            summary = build_snapshot(path, [QURAN_ID], client=client)
+        print(f"Snapshot: {summary['bytes'] / 1024:.0f}KB ({', '.join(summary['editions'])} "
+              f"+ Quran list); API latency {LATENCY * 1000:.0f}ms, "
+              f"{BANDWIDTH / 1024 / 1024:.0f}MB/s")
+        env = dict(os.environ, BENCH_BASE_URL=mock.base_url, GLOBALQURAN_SNAPSHOT=path)
+        baseline = statistics.median(run(_BARE, env)[0] for _ in range(RUNS))
+        print(f"Bare interpreter: {baseline * 1000:.0f}ms (median of {RUNS})")
+        print(f"{'handler':<20}{'process':>10}{'imports':>10}{'answer':>10}  requests loaded")
+        expected = None
+        for name, handler in HANDLERS.items():
+            results = [run(handler, env) for _ in range(RUNS)]
+            report = results[-1][1]
+            expected = expected or (report['verse'], report['editions'])
+            assert (report['verse'], report['editions']) == expected
+            print(f"{name:<20}{statistics.median(r[0] for r in results) * 1000:8.0f}ms"
+                  f"{statistics.median(r[1]['imports'] for r in results) * 1000:8.0f}ms"
+                  f"{statistics.median(r[1]['answer'] for r in results) * 1000:8.0f}ms"
+                  f"  {report['requests']}")
+
+
+if __name__ == "__main__":
+    main()
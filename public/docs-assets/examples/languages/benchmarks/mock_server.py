@@ -0,0 +1,468 @@
+# Local stand-in for api.globalquran.com used by the benchmarks
+# Serves deterministic synthetic text in the same response shapes as the
+# real API (and synthetic audio files in the audio.globalquran.com layout),
+# so the helpers can be measured without network access.
+
+import hashlib
+import json
+import os
+import random
+import socket
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from globalquran.compression import CODECS, IDENTITY, compress
+from globalquran.metadata import (SURAH_AYAH_COUNTS, TOTAL_AYAHS, ayah_reference,
+                                  global_ayah_index, juz_range, page_range)
+
+ARABIC_WORDS = [
+    'بِسْمِ', 'اللَّهِ', 'الرَّحْمَٰنِ', 'الرَّحِيمِ', 'الْحَمْدُ', 'لِلَّهِ', 'رَبِّ',
+    'الْعَالَمِينَ', 'رَحْمَةً', 'وَرَحْمَةٌ', 'قُلْ', 'هُوَ', 'النَّاسِ', 'الْكِتَابُ',
+    'هُدًى', 'لِّلْمُتَّقِينَ', 'ۛ', 'إِنَّ', 'الَّذِينَ', 'آمَنُوا', 'وَعَمِلُوا',
+    'الصَّالِحَاتِ', 'يَوْمِ', 'الدِّينِ', 'السَّمَاوَاتِ', 'وَالْأَرْضِ', 'عَلِيمٌ',
+    'حَكِيمٌ', 'ۚ', 'مِن', 'فِي', 'عَلَىٰ', 'إِلَّا', 'لَا', 'مَا', 'كَانَ',
+]
+# Affixes multiply the stems above into a vocabulary of a few thousand tokens
+ARABIC_PREFIXES = ['', '', '', 'وَ', 'فَ', 'بِ', 'لِ', 'وَلِ', 'أَفَ']
+ARABIC_SUFFIXES = ['', '', '', 'هُ', 'هُمْ', 'كُمْ', 'نَا', 'هَا']
+ENGLISH_WORDS = [
+    'in', 'the', 'name', 'of', 'Allah', 'most', 'gracious', 'merciful', 'praise',
+    'be', 'to', 'lord', 'worlds', 'mercy', 'and', 'those', 'who', 'believe',
+    'do', 'righteous', 'deeds', 'day', 'judgement', 'heavens', 'earth', 'is',
+    'knowing', 'wise', 'say', 'he', 'people', 'book', 'guidance', 'for',
+]
+
+
+def verse_text(quran_id: str, index: int) -> str:
+    """Deterministic synthetic text for one ayah of one edition"""
+    rng = random.Random(f"{quran_id}:{index}")
+    count = rng.randint(3, 40)
+    if '.' in quran_id:
+        return ' '.join(rng.choice(ENGLISH_WORDS) for _ in range(count))
+    return ' '.join(rng.choice(ARABIC_PREFIXES) + rng.choice(ARABIC_WORDS) + rng.choice(ARABIC_SUFFIXES)
+                    for _ in range(count))
+
+
+def unit_range(ayahs: range) -> Tuple[int, int]:
+    """Global [start, end) ayah range of a page or juz (Madani boundaries)"""
+    return ayahs.start, ayahs.stop
+
+
+def surah_range(surah: int) -> Tuple[int, int]:
+    start = global_ayah_index(surah, 1)
+    return start, start + SURAH_AYAH_COUNTS[surah - 1]
+
+
+def ayah_range(reference: str) -> Tuple[int, int]:
+    surah, ayah = (int(part) for part in reference.split(':'))
+    start = global_ayah_index(surah, ayah)
+    return start, start + 1
+
+
+def edition_body(quran_id: str, start: int, end: int) -> Dict:
+    """{"verseNo": {...}} body for a range of one edition, keyed by global verse number"""
+    body: Dict[str, Dict] = {}
+    for index in range(start, end):
+        surah, ayah = ayah_reference(index)
+        body[str(index + 1)] = {
+            'surah': surah, 'ayah': ayah, 'verse': verse_text(quran_id, index)
+        }
+    return body
+
+
+def audio_duration(index: int) -> float:
+    """Synthetic recitation length in seconds of a global ayah index (4-16s)"""
+    return 4.0 + (index * 7919 % 13)
+
+
+def audio_body(path: str) -> Optional[bytes]:
+    """
+    Deterministic stand-in for an audio file at /{recitor}/{type}/{kbs}kbs/{n}.{ext}
+
+    The size matches the bitrate and audio_duration, so downloads take as long
+    relative to playback as real files would.
+    """
+    parts = [part for part in urlparse(path).path.split('/') if part]
+    if len(parts) != 4 or not parts[2].endswith('kbs'):
+        return None
+    number, _, extension = parts[3].partition('.')
+    index = int(number) - 1
+    if not 0 <= index < TOTAL_AYAHS or extension not in ('mp3', 'ogg'):
+        return None
+    size = int(int(parts[2][:-3]) * 1000 / 8 * audio_duration(index))
+    pattern = hashlib.sha256(path.encode('utf-8')).digest() * 64
+    return (pattern * (size // len(pattern) + 1))[:size]
+
+
+QURAN_LIST = {
+    'quran-simple': {'english_name': 'Quran Simple', 'native_name': 'القرآن الكريم',
+                     'language_code': 'ar', 'format': 'text', 'type': 'quran'},
+    'quran-uthmani': {'english_name': 'Quran Uthmani', 'native_name': 'القرآن الكريم',
+                      'language_code': 'ar', 'format': 'text', 'type': 'quran'},
+    'en.sahih': {'english_name': 'Sahih International', 'native_name': 'Sahih International',
+                 'language_code': 'en', 'format': 'text', 'type': 'translation'},
+    'en.pickthall': {'english_name': 'Pickthall', 'native_name': 'Pickthall',
+                     'language_code': 'en', 'format': 'text', 'type': 'translation'},
+    'ur.jalandhry': {'english_name': 'Jalandhry', 'native_name': 'جالندہری',
+                     'language_code': 'ur', 'format': 'text', 'type': 'translation'},
+    'ar.alafasy': {'english_name': 'Alafasy', 'native_name': 'مشاري العفاسي',
+                   'language_code': 'ar', 'format': 'audio', 'type': 'versebyverse',
+                   'media': {'mp3-128': {'type': 'mp3', 'kbs': '128'},
+                             'mp3-64': {'type': 'mp3', 'kbs': '64'},
+                             'mp3-32': {'type': 'mp3', 'kbs': '32'},
+                             'ogg-192': {'type': 'ogg', 'kbs': '192'}}},
+}
+
+# The synthetic corpus never changes
+LAST_MODIFIED = 'Mon, 11 Jul 2016 00:00:00 GMT'
+
+
+class MockQuranServer:
+    """A threaded local HTTP server answering GlobalQuran API paths"""
+
+    def __init__(self, latency: float = 0.0, handshake_delay: float = 0.0, port: int = 0,
+                 bandwidth: Optional[int] = None, error_rate: float = 0.0,
+                 rate_limit: Optional[int] = None, slow_rate: float = 0.0,
+                 slow_latency: float = 0.0, drop_rate: float = 0.0, compression: bool = False,
+                 audio_compression: bool = False, seed: int = 0):
+        """
+        Args:
+            latency (float): Seconds to sleep before answering each request
+            handshake_delay (float): Seconds to sleep on every new connection,
+                standing in for the TCP+TLS handshake of the live API
+            port (int): Port to bind on 127.0.0.1 (default: any free port)
+            bandwidth (int): Bytes per second to send bodies at (default: unthrottled)
+            error_rate (float): Fraction of requests answered with a 503
+            rate_limit (int): Requests per second allowed; the rest get a 429
+                with Retry-After: 1 (default: unlimited)
+            slow_rate (float): Fraction of requests delayed by slow_latency
+                on top of latency (a slow upstream tail)
+            slow_latency (float): Extra seconds for the slow requests
+            drop_rate (float): Fraction of audio responses whose connection
+                is cut halfway through the body
+            compression (bool): Compress JSON bodies with the first coding in
+                the request's Accept-Encoding that this process can encode
+            audio_compression (bool): Compress audio bodies the same way,
+                after any Range is applied, as a CDN that content-codes every
+                type does
+            seed (int): Seed for the injected failures and delays
+
+        latency, error_rate, drop_rate and the slow settings may be changed
+        while the server runs, e.g. to simulate an outage. Audio files honour
+        Range (bytes=N- and N-M) and If-Range requests.
+        """
+        self.latency = latency
+        self.handshake_delay = handshake_delay
+        self.bandwidth = bandwidth
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.slow_rate = slow_rate
+        self.slow_latency = slow_latency
+        self.drop_rate = drop_rate
+        self.compression = compression
+        self.audio_compression = audio_compression
+        self.requests = 0
+        self.connections = 0
+        self.not_modified = 0
+        self.errors = 0
+        self.throttled = 0
+        self.ranged = 0
+        self.dropped = 0
+        self.bytes_sent = 0
+        self._random = random.Random(seed)
+        self._window = (0, 0)  # (second, requests seen in it)
+        self._encoded: Dict[Tuple[str, str], bytes] = {}  # (ETag, coding) -> body
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count(self, attribute: str) -> None:
+        with self._lock:
+            setattr(self, attribute, getattr(self, attribute) + 1)
+
+    def reset_counters(self) -> None:
+        with self._lock:
+            self.requests = 0
+            self.connections = 0
+            self.not_modified = 0
+            self.errors = 0
+            self.throttled = 0
+            self.ranged = 0
+            self.dropped = 0
+            self.bytes_sent = 0
+
+    def add_bytes(self, count: int) -> None:
+        with self._lock:
+            self.bytes_sent += count
+
+    def drop(self) -> bool:
+        """Whether to cut the current audio response short"""
+        with self._lock:
+            if self.drop_rate and self._random.random() < self.drop_rate:
+                self.dropped += 1
+                return True
+        return False
+
+    def content_encoding(self, accept: str, enabled: Optional[bool] = None) -> str:
+        """
+        Coding to send a body with, given the request's Accept-Encoding
+
+        enabled defaults to the compression setting (for JSON bodies).
+        """
+        if self.compression if enabled is None else enabled:
+            for token in accept.split(','):
+                name, _, params = token.strip().partition(';')
+                if name in CODECS and name != IDENTITY and params.replace(' ', '') != 'q=0':
+                    return name
+        return IDENTITY
+
+    def encoded(self, payload: bytes, etag: str, encoding: str) -> bytes:
+        """payload compressed with encoding, compressed once per body"""
+        with self._lock:
+            body = self._encoded.get((etag, encoding))
+        if body is None:
+            body = compress(payload, encoding)
+            with self._lock:
+                self._encoded[(etag, encoding)] = body
+        return body
+
+    def extra_delay(self) -> float:
+        """Seconds to add to the current request for the slow tail"""
+        with self._lock:
+            if self.slow_rate and self._random.random() < self.slow_rate:
+                return self.slow_latency
+        return 0.0
+
+    def failure(self) -> Optional[int]:
+        """Status to fail the current request with (429 or 503), if any"""
+        with self._lock:
+            if self.rate_limit is not None:
+                second, seen = self._window
+                now = int(time.monotonic())
+                seen = seen + 1 if now == second else 1
+                self._window = (now, seen)
+                if seen > self.rate_limit:
+                    self.throttled += 1
+                    return 429
+            if self.error_rate and self._random.random() < self.error_rate:
+                self.errors += 1
+                return 503
+        return None
+
+    def start(self) -> 'MockQuranServer':
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> 'MockQuranServer':
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def route(self, path: str) -> Optional[Dict]:
+        """Build the JSON body for an API path, or None for 404"""
+        parts = [part for part in urlparse(path).path.split('/') if part]
+        if len(parts) < 2:
+            return None
+        version, resource, args = parts[0], parts[1], parts[2:]
+
+        if version == 'v2' and resource == 'list' and args:
+            items = {key: value for key, value in QURAN_LIST.items()
+                     if args[0] == 'quran'
+                     or (args[0] == 'translation' and value['type'] == 'translation')
+                     or (args[0] == 'recitor' and value['format'] == 'audio')}
+            return {'list': items}
+        if resource == 'quran' and not args:
+            return {'quranList': {key: dict(value, language=value['language_code'])
+                                  for key, value in QURAN_LIST.items()}}
+
+        ranges = {'ayah': ayah_range, 'surah': lambda n: surah_range(int(n)),
+                  'page': lambda n: unit_range(page_range(int(n))),
+                  'juz': lambda n: unit_range(juz_range(int(n)))}
+        if resource == 'quran' and len(args) == 1:
+            start, end, ids = 0, TOTAL_AYAHS, args[0]
+        elif resource == 'all' and len(args) >= 3 and args[0] in ranges:
+            start, end = ranges[args[0]](args[1])
+            ids = args[2]
+        elif resource in ranges and len(args) == 2:
+            start, end = ranges[resource](args[0])
+            ids = args[1]
+        else:
+            return None
+
+        body: Dict[str, Dict] = {'quran': {}}
+        for quran_id in ids.replace('|', ',').split(','):
+            body['quran'][quran_id] = edition_body(quran_id, start, end)
+        if resource == 'all':
+            body['quranList'] = {key: value for key, value in QURAN_LIST.items()
+                                 if key in body['quran']}
+            body['languageSelected'] = args[3] if len(args) > 3 else 'en'
+        return body
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def setup(self):
+                super().setup()
+                # Headers and body go out in separate writes; without this
+                # keep-alive clients stall on Nagle + delayed ACK
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                server.count('connections')
+                if server.handshake_delay:
+                    time.sleep(server.handshake_delay)
+
+            def do_GET(self):
+                server.count('requests')
+                delay = server.latency + server.extra_delay()
+                if delay:
+                    time.sleep(delay)
+                status = server.failure()
+                if status is not None:
+                    self.send_json(status, {'error': 'Too many requests' if status == 429
+                                            else 'Service unavailable'})
+                    return
+                if not self.path.startswith(('/v1/', '/v2/')):
+                    try:
+                        audio = audio_body(self.path)
+                    except ValueError:
+                        audio = None
+                    if audio is not None:
+                        self.send_audio(audio)
+                        return
+                try:
+                    body = server.route(self.path)
+                except (ValueError, IndexError):
+                    body = None
+                if body is None:
+                    self.send_json(404, {'error': 'Not found'})
+                else:
+                    self.send_json(200, body)
+
+            def send_json(self, status: int, body: Dict) -> None:
+                payload = json.dumps(body, ensure_ascii=False).encode('utf-8')
+                digest = hashlib.sha1(payload).hexdigest()
+                encoding = server.content_encoding(self.headers.get('Accept-Encoding', ''))
+                if encoding != IDENTITY:
+                    payload = server.encoded(payload, digest, encoding)
+                    digest += '-' + encoding  # Each representation has its own ETag
+                etag = '"%s"' % digest
+                if status == 200 and self.headers.get('If-None-Match') == etag:
+                    server.count('not_modified')
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                self.send_response(status)
+                if status == 429:
+                    self.send_header('Retry-After', '1')
+                self.send_header('Content-Type', 'application/json; charset=utf-8')
+                self.send_header('Content-Length', str(len(payload)))
+                if encoding != IDENTITY:
+                    self.send_header('Content-Encoding', encoding)
+                if server.compression:
+                    self.send_header('Vary', 'Accept-Encoding')
+                if status == 200:
+                    self.send_header('ETag', etag)
+                    self.send_header('Last-Modified', LAST_MODIFIED)
+                self.end_headers()
+                self.send_body(payload)
+
+            def byte_range(self, total: int) -> Optional[Tuple[int, int]]:
+                """(first, last) byte of a satisfiable single Range, else None"""
+                header = self.headers.get('Range', '')
+                if_range = self.headers.get('If-Range')
+                if not header.startswith('bytes=') or ',' in header or \
+                        (if_range is not None and if_range != LAST_MODIFIED):
+                    return None
+                first, _, last = header[len('bytes='):].partition('-')
+                if not first.isdigit() or (last and not last.isdigit()):
+                    return None
+                first, last = int(first), min(int(last) if last else total - 1, total - 1)
+                return (first, last) if first <= last else (first, -1)
+
+            def send_audio(self, payload: bytes) -> None:
+                content_type = 'audio/ogg' if self.path.endswith('.ogg') else 'audio/mpeg'
+                total = len(payload)
+                span = self.byte_range(total)
+                if span is not None and span[1] < 0:
+                    self.send_response(416)
+                    self.send_header('Content-Range', f'bytes */{total}')
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                if span is not None:
+                    server.count('ranged')
+                    payload = payload[span[0]:span[1] + 1]
+                    self.send_response(206)
+                    self.send_header('Content-Range', f'bytes {span[0]}-{span[1]}/{total}')
+                else:
+                    self.send_response(200)
+                encoding = server.content_encoding(self.headers.get('Accept-Encoding', ''),
+                                                   server.audio_compression)
+                if encoding != IDENTITY:
+                    # Range counted in the file's bytes, Content-Length in the coded ones
+                    payload = compress(payload, encoding)
+                    self.send_header('Content-Encoding', encoding)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(payload)))
+                self.send_header('Accept-Ranges', 'bytes')
+                self.send_header('Last-Modified', LAST_MODIFIED)
+                self.end_headers()
+                if server.drop():
+                    # Half the body, then a dead connection
+                    self.send_body(payload[:len(payload) // 2])
+                    self.close_connection = True
+                    return
+                self.send_body(payload)
+
+            def send_body(self, payload: bytes) -> None:
+                server.add_bytes(len(payload))
+                try:
+                    if not server.bandwidth:
+                        self.wfile.write(payload)
+                        return
+                    # Trickle the body out in 16KB slices at the configured rate
+                    step = 16 * 1024
+                    for offset in range(0, len(payload), step):
+                        self.wfile.write(payload[offset:offset + step])
+                        self.wfile.flush()
+                        time.sleep(step / server.bandwidth)
+                except (BrokenPipeError, ConnectionResetError):
+                    # The client hung up (e.g. a stopped download)
+                    self.close_connection = True
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+if __name__ == "__main__":
+    with MockQuranServer() as mock:
+        print(f"Mock GlobalQuran API listening on {mock.base_url} (Ctrl+C to stop)")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
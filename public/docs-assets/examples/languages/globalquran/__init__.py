@@ -0,0 +1,42 @@
+# GlobalQuran Python Helpers
+# Shared building blocks used by the Python examples in this folder.
+# Run the examples from this folder (or add it to PYTHONPATH) so that
+# `import globalquran` resolves.
+#
+# The names below are imported on first access, so importing a submodule
+# such as globalquran.snapshot does not also load requests and asyncio
+# (about 100ms of a cold start) for a process that never uses the API.
+
+import importlib
+from typing import Any
+
+_EXPORTS = {
+    'AsyncQuranClient': '.aio',
+    'DiskCache': '.cache',
+    'QuranClient': '.client',
+    'VerseStore': '.store',
+    'configure_client': '.client',
+    'get_client': '.client',
+}
+
+__all__ = [
+    'AsyncQuranClient',
+    'DiskCache',
+    'QuranClient',
+    'VerseStore',
+    'configure_client',
+    'get_client',
+]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,161 @@
+# GlobalQuran Python Helpers: Adaptive Audio Bitrate
+# get_best_audio_format always picks the richest file a recitor offers
+# (ogg-192 first), which on a slow connection downloads slower than it
+# plays. AbrSelector estimates throughput from the audio pipeline's recent
+# downloads and picks the highest bitrate in the recitor's media map that
+# still downloads faster than real time with headroom for prefetching. It
+# steps down as soon as the estimate drops and back up only after the faster
+# estimate has held for a few downloads, so quality does not flap.
+
+import threading
+from typing import Any, Dict, List, Optional
+
+DEFAULT_HEADROOM = 1.5     # Download this many times faster than playback
+DEFAULT_SAFETY = 0.8       # Budget only this fraction of measured throughput
+DEFAULT_UP_SAMPLES = 3     # Downloads the higher estimate must hold before switching up
+FAST_HALF_LIFE = 2.0       # Downloads; reacts quickly to drops
+SLOW_HALF_LIFE = 8.0       # Downloads; smooths out spikes
+
+# Tie-break between formats of equal bitrate (lower is preferred)
+TYPE_PREFERENCE = {'ogg': 0, 'mp3': 1}
+
+
+def format_bitrate(media_format: Dict[str, Any]) -> int:
+    """Bits per second of a media map entry ({'type', 'kbs'})"""
+    return int(media_format['kbs']) * 1000
+
+
+def ranked_formats(media_info: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Known formats of a media map, highest bitrate first (ogg before mp3 on ties)"""
+    formats = [details for details in (media_info or {}).values()
+               if isinstance(details, dict) and details.get('type') in TYPE_PREFERENCE
+               and str(details.get('kbs', '')).isdigit()]
+    return sorted(formats, key=lambda details: (-format_bitrate(details),
+                                                TYPE_PREFERENCE[details['type']]))
+
+
+class ThroughputEstimator:
+    """
+    Throughput from recent downloads, as the lower of a fast and a slow EWMA
+
+    Each sample is one whole file (bytes over the time from request to last
+    byte), so per-request latency counts against small files just as it
+    does during playback.
+    """
+
+    def __init__(self, fast_half_life: float = FAST_HALF_LIFE,
+                 slow_half_life: float = SLOW_HALF_LIFE):
+        self._fast_alpha = 1 - 0.5 ** (1 / fast_half_life)
+        self._slow_alpha = 1 - 0.5 ** (1 / slow_half_life)
+        self._fast: Optional[float] = None
+        self._slow: Optional[float] = None
+        self.samples = 0
+        self._lock = threading.Lock()
+
+    def record(self, size: int, seconds: float) -> None:
+        """Add one completed download"""
+        if size <= 0 or seconds <= 0:
+            return
+        rate = size * 8 / seconds
+        with self._lock:
+            if self._fast is None:
+                self._fast = self._slow = rate
+            else:
+                self._fast += self._fast_alpha * (rate - self._fast)
+                self._slow += self._slow_alpha * (rate - self._slow)
+            self.samples += 1
+
+    def estimate(self) -> Optional[float]:
+        """Bits per second, or None before the first sample"""
+        with self._lock:
+            if self._fast is None:
+                return None
+            return min(self._fast, self._slow)
+
+
+def choose_format(media_info: Dict[str, Any], throughput: Optional[float],
+                  headroom: float = DEFAULT_HEADROOM, safety: float = DEFAULT_SAFETY,
+                  speed: float = 1.0) -> Optional[Dict[str, Any]]:
+    """
+    Highest-bitrate format that the given throughput sustains
+
+    Args:
+        media_info (dict): The recitor's media map
+        throughput (float): Measured bits per second (None: no measurement yet,
+            returns the highest bitrate)
+        headroom (float): Required ratio of download speed to playback speed
+        safety (float): Fraction of the throughput to rely on
+        speed (float): Playback speed (1.5 plays 1.5x faster and needs 1.5x the rate)
+
+    Returns:
+        dict: Media map entry, the lowest bitrate if none is sustainable, or
+            None if the map lists no known format
+    """
+    formats = ranked_formats(media_info)
+    if not formats:
+        return None
+    if throughput is None:
+        return formats[0]
+    budget = throughput * safety
+    for details in formats:
+        if format_bitrate(details) * headroom * speed <= budget:
+            return details
+    return formats[-1]
+
+
+class AbrSelector:
+    """Picks a recitor's audio format per download from measured throughput"""
+
+    def __init__(self, media_info: Dict[str, Any], estimator: Optional[ThroughputEstimator] = None,
+                 headroom: float = DEFAULT_HEADROOM, safety: float = DEFAULT_SAFETY,
+                 speed: float = 1.0, up_samples: int = DEFAULT_UP_SAMPLES,
+                 initial: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            media_info (dict): The recitor's media map
+            estimator (ThroughputEstimator): Shared estimator (default: a new one)
+            headroom (float): Required ratio of download speed to playback speed
+            safety (float): Fraction of measured throughput to rely on
+            speed (float): Playback speed multiplier
+            up_samples (int): Downloads a higher choice must persist before switching up
+            initial (dict): Format before any measurement (default: the middle
+                of the ladder, a compromise until the first download finishes)
+        """
+        self.media_info = media_info
+        self.formats = ranked_formats(media_info)
+        if not self.formats:
+            raise ValueError("Media map lists no known audio format")
+        self.estimator = estimator or ThroughputEstimator()
+        self.headroom = headroom
+        self.safety = safety
+        self.speed = speed
+        self.up_samples = up_samples
+        self.current = initial or self.formats[len(self.formats) // 2]
+        self.switches = 0
+        self._up_since: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def record(self, size: int, seconds: float) -> None:
+        """Feed one completed download into the estimator"""
+        self.estimator.record(size, seconds)
+
+    def select(self) -> Dict[str, Any]:
+        """Format to use for the next download"""
+        target = choose_format(self.media_info, self.estimator.estimate(),
+                               self.headroom, self.safety, self.speed)
+        samples = self.estimator.samples
+        with self._lock:
+            if not samples or target == self.current:
+                self._up_since = None
+                return self.current
+            if format_bitrate(target) >= format_bitrate(self.current):
+                # Count downloads measured, not calls: a prefetch burst
+                # selects several files before any new sample arrives
+                if self._up_since is None:
+                    self._up_since = samples
+                if samples - self._up_since < self.up_samples:
+                    return self.current
+            self._up_since = None
+            self.current = target
+            self.switches += 1
+            return target
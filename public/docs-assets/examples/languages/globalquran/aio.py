@@ -0,0 +1,170 @@
+# GlobalQuran Python Helpers: Asyncio Client
+# Bounded-concurrency variant of the fetchers for bulk sweeps (all 604 pages,
+# 114 surahs or 30 juz for several Quran IDs). Requests run on the pooled
+# QuranClient in a worker pool sized to the concurrency limit, so sockets are
+# still reused while up to `concurrency` requests are in flight.
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
+
+import requests
+
+from .client import QuranClient, get_client
+from .metadata import TOTAL_JUZ, TOTAL_PAGES, TOTAL_SURAHS
+
+DEFAULT_CONCURRENCY = 16
+
+
+class AsyncQuranClient:
+    """Asyncio client for the GlobalQuran API with a concurrency semaphore"""
+
+    def __init__(self, client: Optional[QuranClient] = None,
+                 concurrency: int = DEFAULT_CONCURRENCY,
+                 timeout: float = 30.0):
+        """
+        Args:
+            client (QuranClient): Client to send requests with (default: a new
+                client with the shared client's settings and a pool large
+                enough for `concurrency` connections)
+            concurrency (int): Maximum number of requests in flight
+            timeout (float): Per-attempt timeout in seconds; retries are
+                bounded by the client's RetryPolicy
+        """
+        if client is None:
+            shared = get_client()
+            client = QuranClient(api_key=shared.api_key, base_url=shared.base_url,
+                                 pool_maxsize=max(concurrency, shared.pool_maxsize),
+                                 timeout=timeout, retry=shared.retry,
+                                 rate_limiter=shared.rate_limiter,
+                                 breaker=shared.breaker, hedger=shared.hedger)
+            self._owns_client = True
+        else:
+            self._owns_client = False
+        self.client = client
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=concurrency,
+                                            thread_name_prefix='globalquran')
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def get_json(self, path: str) -> Optional[Any]:
+        """
+        Fetch and decode one API path
+
+        Args:
+            path (str): API path, e.g. '/v1/page/1/quran-simple'
+
+        Returns:
+            Decoded JSON, or None on error or timeout
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        loop = asyncio.get_running_loop()
+
+        async with self._semaphore:
+            try:
+                # Each attempt has its own timeout; an overall deadline would
+                # cut off retries the client is still backing off for
+                deadline = self.timeout if self.client.retry.max_retries == 0 else None
+                return await asyncio.wait_for(
+                    loop.run_in_executor(self._executor, self.client.get_json,
+                                         path, None, self.timeout),
+                    timeout=deadline)
+            except asyncio.TimeoutError:
+                print(f"Request timed out after {self.timeout}s: {path}")
+                return None
+            except requests.exceptions.RequestException as e:
+                print(f"Request error: {e}")
+                return None
+            except ValueError as e:
+                print(f"JSON decode error: {e}")
+                return None
+
+    async def fetch_ayah(self, ayah_reference: str, quran_id: str = 'quran-simple') -> Optional[Dict]:
+        """Fetch one ayah ('surah:ayah')"""
+        return await self.get_json(f"/v1/ayah/{ayah_reference}/{quran_id}")
+
+    async def fetch_page(self, page_number: int, quran_id: str = 'quran-simple') -> Optional[Dict]:
+        """Fetch one page (1-604)"""
+        return await self.get_json(f"/v1/page/{page_number}/{quran_id}")
+
+    async def fetch_surah(self, surah_number: int, quran_id: str = 'quran-simple') -> Optional[Dict]:
+        """Fetch one surah (1-114)"""
+        return await self.get_json(f"/v1/surah/{surah_number}/{quran_id}")
+
+    async def fetch_juz(self, juz_number: int, quran_id: str = 'quran-simple') -> Optional[Dict]:
+        """Fetch one juz (1-30)"""
+        return await self.get_json(f"/v1/juz/{juz_number}/{quran_id}")
+
+    async def fetch_all_data(self, data_in: str = 'surah', data_in_no: Any = 1,
+                             quran_id: str = 'quran-simple', lang_code: str = 'en') -> Optional[Dict]:
+        """Fetch an all-in-one response (surah, ayah, page or juz)"""
+        return await self.get_json(f"/v1/all/{data_in}/{data_in_no}/{quran_id}/{lang_code}")
+
+    async def sweep(self, paths: Iterable[str]) -> AsyncIterator[Tuple[str, Optional[Any]]]:
+        """
+        Fetch many paths concurrently and yield results in request order
+
+        All requests are scheduled up front (bounded by the semaphore); each
+        result is yielded as soon as it and every earlier one has arrived.
+
+        Yields:
+            tuple: (path, decoded JSON or None)
+        """
+        paths = list(paths)
+        tasks = [asyncio.ensure_future(self.get_json(path)) for path in paths]
+        try:
+            for path, task in zip(paths, tasks):
+                yield path, await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def fetch_many(self, paths: Iterable[str]) -> List[Optional[Any]]:
+        """Fetch many paths concurrently, returning results in request order"""
+        return [data async for _, data in self.sweep(paths)]
+
+    async def fetch_pages(self, quran_id: str = 'quran-simple',
+                          pages: Optional[Iterable[int]] = None) -> List[Optional[Dict]]:
+        """Fetch pages (default: all 604) of one edition, in page order"""
+        pages = range(1, TOTAL_PAGES + 1) if pages is None else pages
+        return await self.fetch_many(f"/v1/page/{page}/{quran_id}" for page in pages)
+
+    async def fetch_surahs(self, quran_id: str = 'quran-simple',
+                           surahs: Optional[Iterable[int]] = None) -> List[Optional[Dict]]:
+        """Fetch surahs (default: all 114) of one edition, in surah order"""
+        surahs = range(1, TOTAL_SURAHS + 1) if surahs is None else surahs
+        return await self.fetch_many(f"/v1/surah/{surah}/{quran_id}" for surah in surahs)
+
+    async def fetch_juzs(self, quran_id: str = 'quran-simple',
+                         juzs: Optional[Iterable[int]] = None) -> List[Optional[Dict]]:
+        """Fetch juz (default: all 30) of one edition, in juz order"""
+        juzs = range(1, TOTAL_JUZ + 1) if juzs is None else juzs
+        return await self.fetch_many(f"/v1/juz/{juz}/{quran_id}" for juz in juzs)
+
+    async def sweep_pages(self, quran_ids: Iterable[str]) -> Dict[str, List[Optional[Dict]]]:
+        """
+        Fetch all 604 pages for several editions at once
+
+        Returns:
+            dict: quran_id -> list of 604 page responses (None where a page failed)
+        """
+        quran_ids = list(quran_ids)
+        paths = [f"/v1/page/{page}/{quran_id}"
+                 for quran_id in quran_ids for page in range(1, TOTAL_PAGES + 1)]
+        results = await self.fetch_many(paths)
+        return {quran_id: results[i * TOTAL_PAGES:(i + 1) * TOTAL_PAGES]
+                for i, quran_id in enumerate(quran_ids)}
+
+    async def close(self) -> None:
+        """Stop the worker pool and close the client if we created it"""
+        self._executor.shutdown(wait=False)
+        if self._owns_client:
+            self.client.close()
+
+    async def __aenter__(self) -> 'AsyncQuranClient':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
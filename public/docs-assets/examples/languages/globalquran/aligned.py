@@ -0,0 +1,186 @@
+# GlobalQuran Python Helpers: Verse-Parallel Tables
+# Reading the Arabic beside a few translations used to mean one fetch per
+# edition and then zipping the nested responses by string keys on every
+# render. fetch_aligned gets N editions of a surah, page or juz at once:
+# either in one comma-separated request or with one request per edition sent
+# concurrently. Editions already in an EditionLibrary are taken from it. The
+# result is an AlignedTable, one column per edition over a global-ayah row
+# range. Each column is a VerseStore plus an integer shift worked out once;
+# the first read decodes every column into a list, so rendering a row is
+# list indexing rather than dict lookups by verse key.
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import requests
+
+from .client import QuranClient, get_client
+from .library import EditionLibrary
+from .metadata import ayah_reference, unit_range
+from .store import VerseStore
+
+# Units the API serves as /v1/{unit}/{number}/{quranIds}
+API_UNITS = ('surah', 'page', 'juz')
+DEFAULT_CONCURRENCY = 8   # Per-edition requests sent in parallel
+
+
+class AlignedTable:
+    """Several editions' verses side by side, one row per global ayah index"""
+
+    def __init__(self, indices: range, columns: Dict[str, VerseStore],
+                 missing: Sequence[str] = ()):
+        """
+        Args:
+            indices (range): Global ayah indices of the rows
+            columns (dict): VerseStore per Quran ID, in column order; a store
+                may cover only part of the rows (its other cells are None)
+            missing (sequence): Quran IDs asked for but not obtained
+        """
+        self.indices = indices
+        self.quran_ids = list(columns)
+        self.columns = columns
+        self.missing = list(missing)
+        # Per column: (buffer, offsets, shift, first row, end row), where a
+        # row's local position in the store is row + shift
+        self._layout = []
+        for store in columns.values():
+            shift = indices.start - store.start
+            first = max(0, -shift)
+            end = max(first, min(len(indices), len(store) - shift))
+            self._layout.append((store.buffer, store.offsets, shift, first, end))
+        # Decoded on first read: surah and ayah per row, and one list of
+        # texts per column, so rendering is zipping lists
+        self._references: Optional[Tuple[List[int], List[int]]] = None
+        self._texts: Optional[List[List[Optional[str]]]] = None
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def _decode(self, column: int) -> List[Optional[str]]:
+        buffer, offsets, shift, first, end = self._layout[column]
+        return ([None] * first
+                + [str(buffer[offsets[local]:offsets[local + 1]], 'utf-8')
+                   for local in range(first + shift, end + shift)]
+                + [None] * (len(self.indices) - end))
+
+    def texts(self) -> List[List[Optional[str]]]:
+        """One list per column of every row's text (None where an edition has no verse)"""
+        if self._texts is None:
+            self._texts = [self._decode(column) for column in range(len(self.quran_ids))]
+        return self._texts
+
+    def references(self) -> Tuple[List[int], List[int]]:
+        """(surah numbers, ayah numbers) of the rows"""
+        if self._references is None:
+            pairs = [ayah_reference(index) for index in self.indices]
+            self._references = ([surah for surah, _ in pairs], [ayah for _, ayah in pairs])
+        return self._references
+
+    def _row(self, index: int) -> int:
+        row = index - self.indices.start
+        if not 0 <= row < len(self.indices):
+            raise IndexError(f"Global ayah index {index} is not in this table")
+        return row
+
+    def row(self, index: int) -> Tuple[Optional[str], ...]:
+        """Texts of every column at a 0-based global ayah index"""
+        row = self._row(index)
+        return tuple(column[row] for column in self.texts())
+
+    def cell(self, index: int, quran_id: str) -> Optional[str]:
+        """One edition's text at a 0-based global ayah index"""
+        return self.texts()[self.quran_ids.index(quran_id)][self._row(index)]
+
+    def column(self, quran_id: str) -> List[Optional[str]]:
+        """Every row's text for one edition"""
+        return list(self.texts()[self.quran_ids.index(quran_id)])
+
+    def __iter__(self) -> Iterator[Tuple[int, int, int, Tuple[Optional[str], ...]]]:
+        """Yield (global index, surah, ayah, texts in column order) for every row"""
+        surahs, ayahs = self.references()
+        return zip(self.indices, surahs, ayahs, zip(*self.texts()))
+
+    def __repr__(self) -> str:
+        return (f"AlignedTable({len(self)} rows x {self.quran_ids}"
+                + (f", missing {self.missing}" if self.missing else "") + ")")
+
+
+def _fetch_stores(client: QuranClient, unit: str, number: int,
+                  quran_ids: List[str]) -> Dict[str, VerseStore]:
+    """Stores of one /v1/{unit}/{number}/{ids} request ({} on error)"""
+    try:
+        data = client.get_json(f"/v1/{unit}/{number}/{','.join(quran_ids)}")
+    except requests.exceptions.RequestException as e:
+        print(f"Request error: {e}")
+        return {}
+    except ValueError as e:
+        print(f"JSON decode error: {e}")
+        return {}
+    try:
+        stores = VerseStore.editions_from_response(data)
+    except ValueError as e:  # Verses that are not one contiguous range
+        print(f"Unexpected response: {e}")
+        return {}
+    if None in stores:
+        # Surah-keyed responses carry no ID, so their text belongs to an
+        # edition only when exactly one was asked for; otherwise ask for
+        # each edition on its own
+        if len(quran_ids) != 1:
+            fetched: Dict[str, VerseStore] = {}
+            for quran_id in quran_ids:
+                fetched.update(_fetch_stores(client, unit, number, [quran_id]))
+            return fetched
+        stores[quran_ids[0]] = stores.pop(None)
+    return {quran_id: store for quran_id, store in stores.items() if len(store)}
+
+
+def fetch_aligned(quran_ids: Iterable[str], unit: str = 'surah', number: int = 1,
+                  client: Optional[QuranClient] = None,
+                  library: Optional[EditionLibrary] = None, combined: bool = True,
+                  concurrency: int = DEFAULT_CONCURRENCY) -> AlignedTable:
+    """
+    Fetch several editions of one surah, page or juz as an AlignedTable
+
+    Args:
+        quran_ids (iterable): Quran IDs in column order, e.g.
+            ['quran-simple', 'en.sahih', 'ur.jalandhry']
+        unit (str): 'surah', 'page' or 'juz'
+        number (int): 1-based unit number
+        client (QuranClient): Client to fetch with (default: shared client)
+        library (EditionLibrary): Locally held editions to use first
+        combined (bool): One comma-separated request for every edition not
+            held locally; False sends one request per edition concurrently
+        concurrency (int): Parallel requests when combined is False
+
+    Returns:
+        AlignedTable: Columns in the order asked; editions that could not be
+            fetched are listed in .missing
+
+    Raises:
+        ValueError: If unit is not one the API serves or number is out of range
+    """
+    if unit not in API_UNITS:
+        raise ValueError(f"Unit must be one of {API_UNITS}, not {unit!r}")
+    indices = unit_range(unit, int(number))
+    quran_ids = list(dict.fromkeys(quran_ids))
+    stores: Dict[str, VerseStore] = {}
+    if library is not None:
+        for quran_id in quran_ids:
+            store = library.edition(quran_id)
+            if store is not None and indices.start in store and indices[-1] in store:
+                stores[quran_id] = store
+
+    remaining = [quran_id for quran_id in quran_ids if quran_id not in stores]
+    if remaining:
+        client = client or get_client()
+        if combined or len(remaining) == 1:
+            stores.update(_fetch_stores(client, unit, number, remaining))
+        else:
+            with ThreadPoolExecutor(max_workers=min(concurrency, len(remaining))) as pool:
+                for fetched in pool.map(lambda quran_id: _fetch_stores(client, unit, number,
+                                                                       [quran_id]), remaining):
+                    stores.update(fetched)
+
+    columns = {quran_id: stores[quran_id] for quran_id in quran_ids if quran_id in stores}
+    return AlignedTable(indices, columns,
+                        missing=[quran_id for quran_id in quran_ids if quran_id not in stores])
@@ -0,0 +1,51 @@
+# GlobalQuran Python Helpers: Arabic Text Normalization
+# Quran editions differ in how much tashkeel they carry, and readers type
+# queries without it. Normalizing both sides to bare letters lets "رحمة"
+# match "رَحْمَةً". The mapping is a single str.translate table, so a whole
+# edition is normalized in one pass when a search index is built.
+
+from typing import Dict, Iterable, Optional
+
+# Removed: Quranic signs above letters, harakat and small hamza, superscript
+# alef, tatweel, Quranic annotation marks (waqf signs such as ۛ and ۚ, small
+# high letters, rub el hizb, sajdah) and the extended-A combining marks.
+_REMOVED_RANGES = (
+    (0x0610, 0x061A),
+    (0x064B, 0x065F),
+    (0x0670, 0x0670),
+    (0x0640, 0x0640),
+    (0x06D6, 0x06ED),
+    (0x08D3, 0x08FF),
+)
+
+# Folded: alef variants to bare alef, hamza carriers to their letter, alef
+# maqsura and Farsi yeh to yeh, ta marbuta to ha
+_FOLDED = {
+    'أ': 'ا', 'إ': 'ا', 'آ': 'ا', 'ٱ': 'ا', 'ٲ': 'ا', 'ٳ': 'ا', 'ٵ': 'ا',
+    'ؤ': 'و',
+    'ئ': 'ي', 'ى': 'ي', 'ی': 'ي',
+    'ة': 'ه',
+}
+
+
+def _build_table(removed: Iterable[tuple], folded: Dict[str, str]) -> Dict[int, Optional[str]]:
+    table: Dict[int, Optional[str]] = {}
+    for first, last in removed:
+        for code_point in range(first, last + 1):
+            table[code_point] = None
+    table.update((ord(source), target) for source, target in folded.items())
+    return table
+
+
+NORMALIZE_TABLE = _build_table(_REMOVED_RANGES, _FOLDED)
+
+
+def normalize_arabic(text: str) -> str:
+    """
+    Reduce Arabic text to bare letters for searching
+
+    Strips harakat, tatweel and Quranic annotation marks and folds
+    alef/hamza/ta-marbuta variants, then collapses the whitespace left
+    around standalone waqf marks. Non-Arabic letters pass through unchanged.
+    """
+    return ' '.join(text.translate(NORMALIZE_TABLE).split())
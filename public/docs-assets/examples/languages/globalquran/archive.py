@@ -0,0 +1,350 @@
+# GlobalQuran Python Helpers: Resumable Bulk Audio Downloads
+# A whole recitation is 6,236 files. Fetching them one at a time takes hours,
+# and a script that dies halfway starts again from zero. AudioArchive
+# downloads a recitor's files with a pool of workers. Each file streams into
+# a .part file and is renamed into place only once it is complete and its
+# SHA-256 checks out. Every finished file is appended to a JSON-lines journal
+# (manifest.jsonl) in the target directory. A restarted run skips journaled
+# files and resumes .part files with HTTP Range requests. The files' Last-Modified
+# validator is sent as If-Range, so a file changed upstream restarts cleanly.
+# Files are requested with Accept-Encoding: identity, so Range offsets and
+# Content-Length count the same bytes that are written to disk.
+
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import requests
+
+from .audio import AUDIO_BASE, AUDIO_HEADERS, audio_url
+from .client import QuranClient, get_client
+from .compression import IDENTITY
+from .metadata import TOTAL_AYAHS
+
+JOURNAL_NAME = 'manifest.jsonl'
+PART_SUFFIX = '.part'
+DEFAULT_ARCHIVE_WORKERS = 8
+DEFAULT_ATTEMPTS = 5   # Tries per file, each resuming where the last one stopped
+DEFAULT_ARCHIVE_CHUNK_SIZE = 16 * 1024  # A cut connection loses the chunk being read
+HASH_BLOCK = 1024 * 1024
+
+
+def file_sha256(path: str) -> str:
+    """Hex SHA-256 of a file on disk"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class DownloadJournal:
+    """
+    Append-only JSON-lines log of per-file download state
+
+    Each line updates one file's entry: its validator once a download starts,
+    and size and sha256 once it is complete. Lines are flushed as they are
+    written, so after a crash the journal holds every file finished up to
+    that moment; a torn last line is ignored on load. compact() rewrites it
+    with one line per file.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        break
+                    name = record.pop('file')
+                    self.entries.setdefault(name, {}).update(record)
+        self._file = open(path, 'a', encoding='utf-8')
+
+    def get(self, name: str) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self.entries.get(name, {}))
+
+    def complete(self, name: str) -> bool:
+        with self._lock:
+            return self.entries.get(name, {}).get('sha256') is not None
+
+    def record(self, name: str, **fields: Any) -> None:
+        """Update a file's entry and append the change to the journal"""
+        with self._lock:
+            self.entries.setdefault(name, {}).update(fields)
+            self._file.write(json.dumps(dict(file=name, **fields)) + '\n')
+            self._file.flush()
+
+    def forget(self, name: str) -> None:
+        """Mark a file as not downloaded (e.g. after it failed verification)"""
+        with self._lock:
+            self.entries.pop(name, None)
+            self._file.write(json.dumps({'file': name, 'sha256': None}) + '\n')
+            self._file.flush()
+
+    def compact(self) -> None:
+        """Rewrite the journal with one line per file, atomically"""
+        with self._lock:
+            temp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                for name, entry in sorted(self.entries.items()):
+                    fields = {key: value for key, value in entry.items() if value is not None}
+                    f.write(json.dumps(dict(file=name, **fields)) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+            self._file.close()
+            os.replace(temp_path, self.path)
+            self._file = open(self.path, 'a', encoding='utf-8')
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+class AudioArchive:
+    """Downloads a recitor's audio files into a directory, resumably"""
+
+    def __init__(self, recitor_id: str, media_format: Dict[str, Any], directory: str,
+                 indices: Optional[Iterable[int]] = None, client: Optional[QuranClient] = None,
+                 workers: int = DEFAULT_ARCHIVE_WORKERS, attempts: int = DEFAULT_ATTEMPTS,
+                 chunk_size: int = DEFAULT_ARCHIVE_CHUNK_SIZE, base_url: str = AUDIO_BASE,
+                 checksums: Optional[Dict[int, str]] = None):
+        """
+        Args:
+            recitor_id (str): Recitor ID, e.g. 'ar.alafasy'
+            media_format (dict): Entry of the recitor's media map to download
+            directory (str): Where files and the journal are kept (created if missing)
+            indices (iterable): Global ayah indices to fetch (default: all 6,236)
+            client (QuranClient): Client to download with (default: shared
+                client; its API rate limiter and breaker skip the audio host)
+            workers (int): Concurrent downloads
+            attempts (int): Tries per file before it is reported as failed
+            chunk_size (int): Bytes read per chunk while streaming a file
+            base_url (str): Audio host
+            checksums (dict): Expected hex SHA-256 per global index, if known;
+                without it the journal's hashes guard against later corruption
+        """
+        self.recitor_id = recitor_id
+        self.media_format = media_format
+        self.directory = directory
+        self.indices = list(range(TOTAL_AYAHS) if indices is None else indices)
+        self.client = client or get_client()
+        self.workers = workers
+        self.attempts = attempts
+        self.chunk_size = chunk_size
+        self.base_url = base_url
+        self.checksums = checksums or {}
+        os.makedirs(directory, exist_ok=True)
+        self.journal = DownloadJournal(os.path.join(directory, JOURNAL_NAME))
+        self.completed = 0
+        self.skipped = 0
+        self.resumed = 0
+        self.restarted = 0            # Partial files that had to start over
+        self.bytes_downloaded = 0
+        self.bytes_resumed = 0        # Bytes of .part files not downloaded again
+        self.failed: Dict[int, str] = {}
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+    def path(self, index: int) -> str:
+        """Local path of a global ayah index's file"""
+        return os.path.join(self.directory, os.path.basename(self.url(index)))
+
+    def url(self, index: int) -> str:
+        return audio_url(self.recitor_id, self.media_format, index, self.base_url)
+
+    def _count(self, attribute: str, amount: int = 1) -> None:
+        with self._lock:
+            setattr(self, attribute, getattr(self, attribute) + amount)
+
+    def _expected(self, index: int, digest: str) -> bool:
+        expected = self.checksums.get(index)
+        return expected is None or expected.lower() == digest
+
+    def pending(self) -> List[int]:
+        """
+        Indices still to download
+
+        A finished file missing from the journal (the process died between
+        the rename and the journal write) is hashed and journaled here.
+        """
+        todo = []
+        for index in self.indices:
+            path = self.path(index)
+            name = os.path.basename(path)
+            if not os.path.exists(path):
+                todo.append(index)
+                continue
+            if not self.journal.complete(name):
+                digest = file_sha256(path)
+                if not self._expected(index, digest):
+                    os.remove(path)
+                    todo.append(index)
+                    continue
+                self.journal.record(name, size=os.path.getsize(path), sha256=digest)
+        return todo
+
+    def verify(self) -> List[int]:
+        """
+        Re-hash every journaled file; corrupted or missing ones are removed
+        from the journal (and disk) so the next run downloads them again
+
+        Returns:
+            list: Global indices that failed verification
+        """
+        bad = []
+        for index in self.indices:
+            path = self.path(index)
+            entry = self.journal.get(os.path.basename(path))
+            if entry.get('sha256') is None:
+                continue
+            if not os.path.exists(path) or file_sha256(path) != entry['sha256'] \
+                    or not self._expected(index, entry['sha256']):
+                bad.append(index)
+                self.journal.forget(os.path.basename(path))
+                if os.path.exists(path):
+                    os.remove(path)
+        return bad
+
+    def _download(self, index: int) -> Optional[str]:
+        """Fetch one file, resuming its .part file; returns the hex digest"""
+        path = self.path(index)
+        name = os.path.basename(path)
+        part = path + PART_SUFFIX
+        error: Optional[Exception] = None
+        for attempt in range(self.attempts):
+            if self._stop.is_set():
+                return None
+            if attempt:
+                time.sleep(self.client.retry.backoff(attempt - 1))
+            partial = offset = os.path.getsize(part) if os.path.exists(part) else 0
+            validator = self.journal.get(name).get('validator')
+            headers = dict(AUDIO_HEADERS)
+            if offset and validator:
+                headers.update({'Range': f'bytes={offset}-', 'If-Range': validator})
+            try:
+                response = self.client.get(self.url(index), stream=True, headers=headers)
+                try:
+                    if response.status_code == 416:
+                        # The .part file is longer than the file now is
+                        error = IOError(f"{name}: {offset} bytes on disk is past the end "
+                                        f"of the file (416), starting over")
+                        os.remove(part)
+                        self._count('restarted')
+                        continue
+                    response.raise_for_status()
+                    if offset and not response.headers.get('Content-Range', '').startswith(
+                            f'bytes {offset}-'):
+                        # Range ignored or If-Range failed: the body is the whole file
+                        offset = 0
+                    if offset:
+                        self._count('resumed')
+                        self._count('bytes_resumed', offset)
+                    elif partial:
+                        self._count('restarted')
+                    if not offset:
+                        self.journal.record(name, validator=response.headers.get(
+                            'Last-Modified') or response.headers.get('ETag'))
+                    length = response.headers.get('Content-Length')
+                    if response.headers.get('Content-Encoding', IDENTITY) != IDENTITY:
+                        length = None  # Coded anyway: the length is not the file's
+                    expected_size = offset + int(length) if length is not None else None
+
+                    digest = hashlib.sha256()
+                    if offset:
+                        with open(part, 'rb') as f:
+                            for block in iter(lambda: f.read(HASH_BLOCK), b''):
+                                digest.update(block)
+                    with open(part, 'ab' if offset else 'wb') as f:
+                        for chunk in response.iter_content(chunk_size=self.chunk_size):
+                            f.write(chunk)
+                            digest.update(chunk)
+                            self._count('bytes_downloaded', len(chunk))
+                            if self._stop.is_set():
+                                return None
+                finally:
+                    response.close()
+            except requests.exceptions.RequestException as e:
+                error = e
+                status = getattr(e.response, 'status_code', None)
+                if status is not None and status < 500 and status != 429:
+                    break  # 404 and friends will not get better
+                continue
+
+            size = os.path.getsize(part)
+            if expected_size is not None and size != expected_size:
+                error = IOError(f"{name}: got {size} of {expected_size} bytes")
+                continue
+            hex_digest = digest.hexdigest()
+            if not self._expected(index, hex_digest):
+                error = IOError(f"{name}: checksum mismatch")
+                os.remove(part)
+                continue
+            os.replace(part, path)
+            self.journal.record(name, size=size, sha256=hex_digest)
+            self._count('completed')
+            return hex_digest
+
+        with self._lock:
+            self.failed[index] = str(error)
+        return None
+
+    def run(self, progress: Optional[Callable[[int, int], None]] = None) -> Dict[str, Any]:
+        """
+        Download every pending file
+
+        Args:
+            progress (callable): Called as progress(done, total) after each file
+
+        Returns:
+            dict: stats() after the run; files that kept failing are listed
+                under 'failed' and are retried by the next run
+        """
+        self._stop.clear()
+        todo = self.pending()
+        with self._lock:
+            self.skipped += len(self.indices) - len(todo)
+        with ThreadPoolExecutor(max_workers=self.workers,
+                                thread_name_prefix='globalquran-archive') as pool:
+            futures = [pool.submit(self._download, index) for index in todo]
+            try:
+                for done, future in enumerate(as_completed(futures), 1):
+                    future.result()
+                    if progress is not None:
+                        progress(done, len(todo))
+            except BaseException:
+                self.stop()
+                raise
+        if not self._stop.is_set():
+            self.journal.compact()
+        return self.stats()
+
+    def stop(self) -> None:
+        """Ask running downloads to stop; their .part files are kept for resuming"""
+        self._stop.set()
+
+    def stats(self) -> Dict[str, Any]:
+        """Files completed, skipped, resumed and failed, and bytes transferred"""
+        with self._lock:
+            return {'completed': self.completed, 'skipped': self.skipped,
+                    'resumed': self.resumed, 'restarted': self.restarted,
+                    'bytes_downloaded': self.bytes_downloaded,
+                    'bytes_resumed': self.bytes_resumed, 'failed': dict(self.failed)}
+
+    def close(self) -> None:
+        """Close the journal"""
+        self.journal.close()
+
+    def __enter__(self) -> 'AudioArchive':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,219 @@
+# GlobalQuran Python Helpers: Audio Prefetch Pipeline
+# Recitations are one audio file per ayah, and a player that fetches each
+# file when the previous one ends stalls between ayahs. AudioPrefetcher walks
+# an ayah range (a surah, page, juz or any other unit in metadata.py) and
+# keeps the next few files downloading in the background, streamed in chunks
+# into a size-bounded DiskCache, so the following ayah is usually on disk
+# before playback reaches it. Replaying a range is served from the cache.
+# With an AbrSelector (abr.py) each file's bitrate follows measured throughput.
+
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .abr import AbrSelector
+from .cache import DEFAULT_CACHE_DIR, DiskCache
+from .client import DEFAULT_CHUNK_SIZE, QuranClient, get_client
+from .compression import IDENTITY
+from .metadata import SURAH_OFFSETS, unit_range
+
+AUDIO_BASE = 'https://audio.globalquran.com'
+AUDIO_CACHE_DIR = os.path.join(DEFAULT_CACHE_DIR, 'audio')
+DEFAULT_AUDIO_CACHE_BYTES = 256 * 1024 * 1024
+DEFAULT_PREFETCH = 5   # Ayahs downloaded ahead of the one playing
+DEFAULT_WORKERS = 3    # Concurrent downloads
+# Audio is already compressed, and Range offsets and Content-Length only
+# describe the file's own bytes when no content-coding is applied on top
+AUDIO_HEADERS = {'Accept-Encoding': IDENTITY}
+
+# Surahs whose recitation does not open with the Bismillah of Al-Fatiha 1:1
+NO_BISMILLAH = {1, 9}
+
+
+def audio_url(recitor_id: str, media_format: Dict[str, Any], index: int,
+              base_url: str = AUDIO_BASE) -> str:
+    """
+    URL of one ayah's audio file
+
+    Args:
+        recitor_id (str): Recitor ID, e.g. 'ar.alafasy'
+        media_format (dict): One entry of the recitor's media map ({'type', 'kbs'})
+        index (int): 0-based global ayah index (the file is named index + 1)
+        base_url (str): Audio host (default: 'https://audio.globalquran.com')
+    """
+    extension = 'ogg' if media_format['type'] == 'ogg' else 'mp3'
+    return (f"{base_url.rstrip('/')}/{recitor_id}/{media_format['type']}/"
+            f"{media_format['kbs']}kbs/{index + 1}.{extension}")
+
+
+def recitation_order(indices: Iterable[int], bismillah: bool = True) -> List[int]:
+    """
+    Global indices in playback order, with 1:1 (the Bismillah) played before
+    the first ayah of every surah except Al-Fatiha and At-Tawbah
+    """
+    order = []
+    for index in indices:
+        if bismillah and index in SURAH_OFFSETS:
+            surah = SURAH_OFFSETS.index(index) + 1
+            if surah not in NO_BISMILLAH:
+                order.append(0)
+        order.append(index)
+    return order
+
+
+class AudioPrefetcher:
+    """Plays through an ayah range with the next files downloading ahead"""
+
+    def __init__(self, recitor_id: str, media_format: Dict[str, Any],
+                 indices: Sequence[int], client: Optional[QuranClient] = None,
+                 cache: Optional[DiskCache] = None, prefetch: int = DEFAULT_PREFETCH,
+                 workers: int = DEFAULT_WORKERS, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 base_url: str = AUDIO_BASE, selector: Optional[AbrSelector] = None):
+        """
+        Args:
+            recitor_id (str): Recitor ID
+            media_format (dict): Entry of the recitor's media map to play
+                (ignored for new downloads when a selector is given)
+            indices (sequence): Global ayah indices in playback order, e.g.
+                recitation_order(unit_range('surah', 36))
+            client (QuranClient): Client to download with (default: shared
+                client; its API rate limiter and breaker skip the audio host,
+                so reading ahead never spends the API's request budget)
+            cache (DiskCache): Where files are kept (default: a 256MB LRU cache
+                under ~/.cache/globalquran/audio)
+            prefetch (int): Files kept downloading ahead of the current one
+            workers (int): Concurrent downloads
+            chunk_size (int): Bytes read per chunk while streaming a file
+            base_url (str): Audio host
+            selector (AbrSelector): Picks each download's format from measured
+                throughput; files already cached in any format are reused
+        """
+        self.recitor_id = recitor_id
+        self.media_format = media_format
+        self.indices = list(indices)
+        self.client = client or get_client()
+        self.cache = cache if cache is not None else DiskCache(
+            AUDIO_CACHE_DIR, max_bytes=DEFAULT_AUDIO_CACHE_BYTES)
+        self.prefetch = prefetch
+        self.chunk_size = chunk_size
+        self.base_url = base_url
+        self.selector = selector
+        self.formats_used: Dict[int, Dict[str, Any]] = {}  # Index -> format played
+        self.downloads = 0
+        self.bytes_downloaded = 0
+        # (bytes, seconds) of recent downloads, for throughput estimates
+        self.transfers: Deque[Tuple[int, float]] = deque(maxlen=32)
+        self._executor = ThreadPoolExecutor(max_workers=workers,
+                                            thread_name_prefix='globalquran-audio')
+        self._inflight: Dict[int, Future] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_unit(cls, recitor_id: str, media_format: Dict[str, Any], unit: str, number: int,
+                 bismillah: bool = True, **kwargs) -> 'AudioPrefetcher':
+        """Prefetcher for a surah, page, juz (or any unit in metadata.UNIT_STARTS)"""
+        return cls(recitor_id, media_format,
+                   recitation_order(unit_range(unit, number), bismillah), **kwargs)
+
+    def url(self, index: int, media_format: Optional[Dict[str, Any]] = None) -> str:
+        """Audio URL of a global ayah index (default: the fixed media_format)"""
+        return audio_url(self.recitor_id, media_format or self.media_format, index, self.base_url)
+
+    def _download(self, index: int, media_format: Dict[str, Any]) -> str:
+        url = self.url(index, media_format)
+        start = time.monotonic()
+        entry = self.cache.put_stream(DiskCache.make_key(url), url,
+                                      self.client.iter_content(url, chunk_size=self.chunk_size,
+                                                               headers=AUDIO_HEADERS))
+        elapsed = time.monotonic() - start
+        self.cache.record_miss()
+        if self.selector is not None:
+            self.selector.record(entry.size, elapsed)
+        with self._lock:
+            self.downloads += 1
+            self.bytes_downloaded += entry.size
+            self.transfers.append((entry.size, elapsed))
+        return entry.path
+
+    def _cached(self, index: int) -> Optional[str]:
+        """Path of index if it is on disk in a playable format, marking it recently used"""
+        candidates = self.selector.formats if self.selector is not None else [self.media_format]
+        for media_format in candidates:
+            entry = self.cache.get(DiskCache.make_key(self.url(index, media_format)))
+            if entry is not None:
+                with self._lock:
+                    self.formats_used[index] = media_format
+                return entry.path
+        return None
+
+    def _schedule(self, index: int) -> Union[str, Future]:
+        """Cached path of index, or the future of its (possibly new) download"""
+        with self._lock:
+            future = self._inflight.get(index)
+            if future is not None:
+                return future
+        path = self._cached(index)
+        if path is not None:
+            return path
+        media_format = self.selector.select() if self.selector is not None else self.media_format
+        with self._lock:
+            future = self._inflight.get(index)
+            if future is not None:
+                return future
+            future = self._executor.submit(self._download, index, media_format)
+            self._inflight[index] = future
+            self.formats_used[index] = media_format
+        # Outside the lock: a download that already finished runs this at once
+        future.add_done_callback(lambda _, index=index: self._finished(index))
+        return future
+
+    def _finished(self, index: int) -> None:
+        with self._lock:
+            self._inflight.pop(index, None)
+
+    def fetch(self, position: int) -> str:
+        """
+        Local path of the file at a playlist position, downloading it if
+        needed, and start prefetching the positions after it
+
+        Raises:
+            requests.RequestException: If the file could not be downloaded
+        """
+        index = self.indices[position]
+        pending = self._schedule(index)
+        for ahead in self.indices[position + 1:position + 1 + self.prefetch]:
+            self._schedule(ahead)
+        if isinstance(pending, Future):
+            return pending.result()
+        self.cache.record_hit()
+        return pending
+
+    def __iter__(self) -> Iterator[Tuple[int, str]]:
+        """Yield (global index, local file path) in playback order"""
+        for position, index in enumerate(self.indices):
+            yield index, self.fetch(position)
+
+    def stats(self) -> Dict[str, Any]:
+        """Files and bytes downloaded, formats played, and the audio cache's counters"""
+        with self._lock:
+            formats: Dict[str, int] = {}
+            for media_format in self.formats_used.values():
+                name = f"{media_format['type']}-{media_format['kbs']}"
+                formats[name] = formats.get(name, 0) + 1
+            return {'downloads': self.downloads, 'bytes_downloaded': self.bytes_downloaded,
+                    'in_flight': len(self._inflight), 'formats': formats,
+                    'switches': self.selector.switches if self.selector is not None else 0,
+                    'cache': self.cache.stats()}
+
+    def close(self) -> None:
+        """Cancel queued downloads and wait for running ones"""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self) -> 'AudioPrefetcher':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,277 @@
+# GlobalQuran Python Helpers: Ayah Request Coalescing
+# A reader view asks for a handful of neighbouring ayahs in two or three
+# editions, and every one of those lookups is a separate /v1/ayah call. The
+# API already serves whole pages and surahs for several comma-separated Quran
+# IDs at once, so lookups arriving within a short window are collected,
+# planned onto the fewest page/surah/ayah requests, and the verses are handed
+# back to each waiting caller.
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import requests
+
+from .client import QuranClient, get_client
+from .metadata import SURAH_OFFSETS, ayah_reference, global_ayah_index, page_of, page_range
+from .responses import Verse, iter_editions
+
+DEFAULT_WINDOW = 0.005       # Seconds to wait for more lookups before sending
+DEFAULT_MAX_PENDING = 256    # Send early once this many lookups are queued
+DEFAULT_CONCURRENCY = 8      # Planned requests sent in parallel per batch
+
+# One planned request: ((kind, number or 'surah:ayah'), Quran IDs, global indices)
+Request = Tuple[Tuple[str, str], List[str], List[int]]
+
+
+def _parse_reference(reference: str) -> int:
+    surah, ayah = (int(part) for part in reference.split(':'))
+    return global_ayah_index(surah, ayah)
+
+
+# A planned unit before Quran IDs are attached: ((kind, number), global indices)
+Unit = Tuple[Tuple[str, str], List[int]]
+
+
+def _downloaded(unit: Tuple[str, str]) -> int:
+    """Ayahs a unit's response holds"""
+    kind, number = unit
+    if kind == 'surah':
+        return SURAH_OFFSETS[int(number)] - SURAH_OFFSETS[int(number) - 1]
+    if kind == 'page':
+        return len(page_range(int(number)))
+    return 1
+
+
+def _cost(units: List[Unit]) -> Tuple[int, int]:
+    """(requests, ayahs downloaded) of a set of units"""
+    return len(units), sum(_downloaded(unit) for unit, _ in units)
+
+
+def _plan_surahs(indices: List[int]) -> List[Unit]:
+    """Cheapest of one surah, its pages, or its ayahs, chosen per surah"""
+    by_surah: Dict[int, List[int]] = {}
+    for index in indices:
+        by_surah.setdefault(ayah_reference(index)[0], []).append(index)
+    units: List[Unit] = []
+    for surah, members in by_surah.items():
+        pages: Dict[int, List[int]] = {}
+        for index in members:
+            pages.setdefault(page_of(index), []).append(index)
+        options = [
+            [(('surah', str(surah)), members)],
+            [(('page', str(page)), on_page) for page, on_page in pages.items()],
+            [(('ayah', '%d:%d' % ayah_reference(index)), [index]) for index in members],
+        ]
+        units.extend(min(options, key=_cost))
+    return units
+
+
+def plan_requests(wanted: Dict[int, Set[str]]) -> List[Request]:
+    """
+    Cover the wanted ayahs with as few requests as possible
+
+    Two plans are compared and the one with fewer requests (then the
+    smaller download) is used: the cheapest of one surah request, one
+    request per page touched, or one request per ayah for each surah on its
+    own; and one request for every page holding wanted ayahs of more than
+    one surah (e.g. 112:1, 113:1 and 114:1, all on page 604), with the rest
+    planned per surah. Each request asks for every Quran ID wanted inside it.
+
+    Args:
+        wanted (dict): Global ayah index -> set of Quran IDs
+
+    Returns:
+        list: ((kind, number), sorted Quran IDs, global indices covered)
+    """
+    indices = sorted(wanted)
+    pages: Dict[int, List[int]] = {}
+    for index in indices:
+        pages.setdefault(page_of(index), []).append(index)
+    shared = {page: members for page, members in pages.items()
+              if ayah_reference(members[0])[0] != ayah_reference(members[-1])[0]}
+
+    options = [_plan_surahs(indices)]
+    if shared:
+        units = [(('page', str(page)), members) for page, members in shared.items()]
+        units += _plan_surahs([index for index in indices if page_of(index) not in shared])
+        options.append(sorted(units, key=lambda unit: unit[1][0]))
+
+    plan: List[Request] = []
+    for unit, members in min(options, key=_cost):
+        quran_ids: Set[str] = set()
+        for index in members:
+            quran_ids |= wanted[index]
+        plan.append((unit, sorted(quran_ids), members))
+    return plan
+
+
+class AyahBatcher:
+    """Coalesces concurrent ayah lookups into page, surah and multi-ID requests"""
+
+    def __init__(self, client: Optional[QuranClient] = None, window: float = DEFAULT_WINDOW,
+                 max_pending: int = DEFAULT_MAX_PENDING,
+                 concurrency: int = DEFAULT_CONCURRENCY):
+        """
+        Args:
+            client (QuranClient): Client to send requests with (default: shared client)
+            window (float): Seconds the first lookup of a batch waits for others
+            max_pending (int): Lookups that trigger sending before the window ends
+            concurrency (int): Planned requests of one batch sent in parallel
+        """
+        self.client = client or get_client()
+        self.window = window
+        self.max_pending = max_pending
+        self.lookups = 0
+        self.requests = 0
+        self._executor = ThreadPoolExecutor(max_workers=concurrency,
+                                            thread_name_prefix='globalquran-batch')
+        self._lock = threading.Lock()
+        self._pending: List[Tuple[int, str, Future]] = []
+        self._timer: Optional[threading.Timer] = None
+
+    def submit(self, ayah_reference: str, quran_id: str = 'quran-simple') -> Future:
+        """
+        Queue one lookup
+
+        Args:
+            ayah_reference (str): 'surah:ayah', e.g. '2:255'
+            quran_id (str): Quran ID
+
+        Returns:
+            Future: Resolves to a verse record, or None if it could not be fetched
+
+        Raises:
+            ValueError: If the reference does not exist
+        """
+        index = _parse_reference(ayah_reference)
+        future: Future = Future()
+        with self._lock:
+            self._pending.append((index, quran_id, future))
+            self.lookups += 1
+            if len(self._pending) >= self.max_pending:
+                batch = self._take_pending()
+            else:
+                batch = None
+                if self._timer is None:
+                    self._timer = threading.Timer(self.window, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+        if batch:
+            # Not on the executor: _send waits on requests it submits there
+            threading.Thread(target=self._send, args=(batch,), daemon=True).start()
+        return future
+
+    def fetch_ayah(self, ayah_reference: str, quran_id: str = 'quran-simple') -> Optional[Dict]:
+        """
+        Look up one ayah, sharing requests with concurrent callers
+
+        Args:
+            ayah_reference (str): 'surah:ayah', e.g. '2:255'
+            quran_id (str): Quran ID, or several separated by commas
+
+        Returns:
+            Dict: Response in the /v1/ayah shape ({"quran": {quranId: {verseNo: verse}}}),
+                or None if error
+        """
+        futures = [(edition_id, self.submit(ayah_reference, edition_id))
+                   for edition_id in quran_id.replace('|', ',').split(',')]
+        verse_number = str(_parse_reference(ayah_reference) + 1)
+        body = {}
+        for edition_id, future in futures:
+            verse = future.result()
+            if verse is not None:
+                body[edition_id] = {verse_number: verse}
+        return {'quran': body} if body else None
+
+    def fetch_many(self, references: Iterable[str],
+                   quran_ids: Iterable[str] = ('quran-simple',)) -> Dict[Tuple[str, str], Optional[Verse]]:
+        """
+        Look up many ayahs in several editions as one batch
+
+        Returns:
+            dict: (ayah reference, Quran ID) -> verse record or None
+        """
+        quran_ids = list(quran_ids)
+        futures = {(reference, quran_id): self.submit(reference, quran_id)
+                   for reference in references for quran_id in quran_ids}
+        self.flush()
+        return {key: future.result() for key, future in futures.items()}
+
+    def flush(self) -> None:
+        """Send every queued lookup now"""
+        with self._lock:
+            batch = self._take_pending()
+        if batch:
+            self._send(batch)
+
+    def _take_pending(self) -> List[Tuple[int, str, Future]]:
+        # Caller holds the lock
+        batch, self._pending = self._pending, []
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        return batch
+
+    def _send(self, batch: List[Tuple[int, str, Future]]) -> None:
+        try:
+            verses = self._collect(batch)
+        except BaseException as e:
+            for _, _, future in batch:
+                future.set_exception(e)
+            raise
+        for index, quran_id, future in batch:
+            future.set_result(verses.get((index, quran_id)))
+
+    def _collect(self, batch: List[Tuple[int, str, Future]]) -> Dict[Tuple[int, str], Verse]:
+        """Plan and send the requests for a batch; (index, Quran ID) -> verse"""
+        wanted: Dict[int, Set[str]] = {}
+        for index, quran_id, _ in batch:
+            wanted.setdefault(index, set()).add(quran_id)
+        plan = plan_requests(wanted)
+        with self._lock:
+            self.requests += len(plan)
+
+        verses: Dict[Tuple[int, str], Verse] = {}
+        futures = [self._executor.submit(self._fetch, unit, quran_ids)
+                   for unit, quran_ids, _ in plan] if len(plan) > 1 else None
+        for position, (unit, quran_ids, _) in enumerate(plan):
+            data = futures[position].result() if futures else self._fetch(unit, quran_ids)
+            for edition_id, records in iter_editions(data):
+                if edition_id is None:
+                    # A surah-keyed response carries no Quran ID; it can only be
+                    # attributed when a single edition was asked for
+                    if len(quran_ids) != 1:
+                        continue
+                    edition_id = quran_ids[0]
+                for verse in records:
+                    index = global_ayah_index(int(verse['surah']), int(verse['ayah']))
+                    verses[(index, edition_id)] = verse
+        return verses
+
+    def _fetch(self, unit: Tuple[str, str], quran_ids: List[str]) -> Optional[Dict]:
+        kind, number = unit
+        try:
+            return self.client.get_json(f"/v1/{kind}/{number}/{','.join(quran_ids)}")
+        except requests.exceptions.RequestException as e:
+            print(f"Request error: {e}")
+            return None
+        except ValueError as e:
+            print(f"JSON decode error: {e}")
+            return None
+
+    def stats(self) -> Dict[str, int]:
+        """Lookups received and HTTP requests sent for them"""
+        with self._lock:
+            return {'lookups': self.lookups, 'requests': self.requests}
+
+    def close(self) -> None:
+        """Send anything queued and stop the worker threads"""
+        self.flush()
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> 'AyahBatcher':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,320 @@
+# GlobalQuran Python Helpers: Offline Edition Bundle
+# A single versioned file holding complete text editions in the VerseStore
+# layout: surah and ayah arrays, an offset table and one UTF-8 blob per
+# edition, each section 8-byte aligned. Opening a bundle maps the file
+# read-only and hands out VerseStores whose arrays are memoryviews into the
+# mapping, so verses are read straight from the OS page cache and every
+# process reading the same bundle shares those pages.
+# A bundle written with a compression codec (format 2) stores each section
+# compressed instead: a fraction of the disk space, at the cost of
+# decompressing an edition into memory the first time it is used.
+#
+# Layout (all integers little-endian):
+#   magic  b'GQBUNDLE'
+#   u32    format version
+#   u32    header length in bytes
+#   header UTF-8 JSON: bundle version, creation time, source, and per edition
+#          its catalog entry, verse count, checksum and section offsets
+#          (format 2 adds the codec and the compressed size of each section),
+#          and optionally whole list responses (see snapshot.py)
+#   ...    sections, each starting on an 8-byte boundary; section offsets in
+#          the header count from the first 8-byte boundary after the header
+
+import json
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+from typing import Any, Dict, Iterable, List, Optional
+
+from .compression import IDENTITY, compress, decompress
+from .metadata import SURAH_AYAH_COUNTS, SURAH_OFFSETS, TOTAL_AYAHS, TOTAL_SURAHS
+from .store import VerseStore
+
+MAGIC = b'GQBUNDLE'
+FORMAT_VERSION = 1
+COMPRESSED_FORMAT_VERSION = 2
+READABLE_VERSIONS = (FORMAT_VERSION, COMPRESSED_FORMAT_VERSION)
+_SECTION_TYPES = {'surahs': 'H', 'ayahs': 'H', 'offsets': 'I', 'text': 'B'}
+_PREAMBLE = struct.Struct('<8sII')
+_ALIGN = 8
+
+
+class BundleError(ValueError):
+    """The file is not a bundle this version can read, is damaged, or an edition is incomplete"""
+
+
+def _padding(size: int) -> bytes:
+    return b'\0' * (-size % _ALIGN)
+
+
+def _little_endian(values: Iterable[int], typecode: str) -> bytes:
+    data = array(typecode, values)
+    if sys.byteorder != 'little':
+        data.byteswap()
+    return data.tobytes()
+
+
+def check_complete(store: VerseStore) -> None:
+    """
+    Verify an edition holds all 114 surahs and 6,236 ayahs in order
+
+    Raises:
+        BundleError: If any verse is missing
+    """
+    if not store.is_complete:
+        raise BundleError(f"{store.quran_id}: {len(store)} of {TOTAL_AYAHS} ayahs")
+    for surah in range(1, TOTAL_SURAHS + 1):
+        first, last = SURAH_OFFSETS[surah - 1], SURAH_OFFSETS[surah] - 1
+        if (store.surahs[first] != surah or store.ayahs[first] != 1
+                or store.surahs[last] != surah or store.ayahs[last] != SURAH_AYAH_COUNTS[surah - 1]):
+            raise BundleError(f"{store.quran_id}: surah {surah} is incomplete")
+
+
+def write_bundle(path: str, editions: Iterable[VerseStore],
+                 catalog: Optional[Dict[str, Dict[str, Any]]] = None,
+                 version: Optional[str] = None, source: Optional[str] = None,
+                 compression: Optional[str] = None,
+                 lists: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """
+    Write complete editions to a bundle file (atomically replacing path)
+
+    Args:
+        path (str): Output file
+        editions (iterable): Complete VerseStores, one per Quran ID
+        catalog (dict): Quran ID -> quranList entry, stored for offline listing
+        version (str): Bundle version label (default: UTC creation date)
+        source (str): Where the editions came from, e.g. the API base URL
+        compression (str): Codec to store the sections with, e.g. 'zstd' or
+            'gzip' (see compression.py); such a bundle is read into memory
+            instead of mapped (default: uncompressed)
+        lists (dict): Whole list responses to store, by name, e.g.
+            {'quran': <the /v1/quran response>} (default: none)
+
+    Returns:
+        dict: The header that was written
+
+    Raises:
+        BundleError: If an edition is incomplete
+        ValueError: If the codec is not available
+    """
+    import hashlib  # Imported here so opening a bundle does not load them
+    import tempfile
+    compression = compression or IDENTITY
+    sections: List[bytes] = []
+    entries: Dict[str, Dict[str, Any]] = {}
+    position = 0
+    for store in editions:
+        check_complete(store)
+        parts = {
+            'surahs': _little_endian(store.surahs, 'H'),
+            'ayahs': _little_endian(store.ayahs, 'H'),
+            'offsets': _little_endian(store.offsets, 'I'),
+            'text': bytes(store.buffer),
+        }
+        entry: Dict[str, Any] = {'info': (catalog or {}).get(store.quran_id, {}),
+                                 'count': len(store),
+                                 'sha256': hashlib.sha256(parts['text']).hexdigest()}
+        if compression != IDENTITY:
+            entry['compression'] = compression
+        for name, data in parts.items():
+            if compression != IDENTITY:
+                data = compress(data, compression)
+                entry[f'{name}_size'] = len(data)
+            entry[name] = position
+            sections.append(data + _padding(len(data)))
+            position += len(data) + len(_padding(len(data)))
+        entry['text_bytes'] = len(parts['text'])
+        entries[store.quran_id] = entry
+
+    format_version = FORMAT_VERSION if compression == IDENTITY else COMPRESSED_FORMAT_VERSION
+    created = time.gmtime()
+    header = {'format': format_version,
+              'version': version or time.strftime('%Y-%m-%d', created),
+              'created': time.strftime('%Y-%m-%dT%H:%M:%SZ', created),
+              'source': source,
+              'editions': entries}
+    if lists:
+        header['lists'] = lists
+    encoded = json.dumps(header, ensure_ascii=False).encode('utf-8')
+    encoded += _padding(_PREAMBLE.size + len(encoded)).replace(b'\0', b' ')
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_PREAMBLE.pack(MAGIC, format_version, len(encoded)))
+            f.write(encoded)
+            for section in sections:
+                f.write(section)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    return header
+
+
+class QuranBundle:
+    """A memory-mapped bundle of complete editions (decompressed on use if compressed)"""
+
+    def __init__(self, path: str):
+        """
+        Map a bundle file read-only
+
+        Raises:
+            BundleError: If the file is not a supported bundle or its header
+                is damaged
+            OSError: If the file cannot be opened
+        """
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, format_version, header_size = _PREAMBLE.unpack_from(self._mmap, 0)
+        except struct.error:
+            magic, format_version, header_size = b'', 0, 0
+        if magic != MAGIC:
+            self._mmap.close()
+            raise BundleError(f"{path} is not a GlobalQuran bundle")
+        if format_version not in READABLE_VERSIONS:
+            self._mmap.close()
+            raise BundleError(f"{path} uses bundle format {format_version}, "
+                              f"expected one of {READABLE_VERSIONS}")
+        try:
+            self.header: Dict[str, Any] = json.loads(
+                self._mmap[_PREAMBLE.size:_PREAMBLE.size + header_size])
+        except ValueError:
+            self._mmap.close()
+            raise BundleError(f"{path} has a damaged header") from None
+        self.version: str = self.header.get('version', '')
+        self._data_start = _PREAMBLE.size + header_size
+        self._view = memoryview(self._mmap)
+        self._stores: Dict[str, VerseStore] = {}
+
+    @property
+    def quran_ids(self) -> List[str]:
+        """Quran IDs held in the bundle"""
+        return list(self.header['editions'])
+
+    def __contains__(self, quran_id: str) -> bool:
+        return quran_id in self.header['editions']
+
+    def _span(self, offset: int, size: int) -> memoryview:
+        start = self._data_start + offset
+        if start + size > len(self._view):
+            raise BundleError(f"{self.path} is truncated")
+        return self._view[start:start + size]
+
+    def _section(self, offset: int, count: int, typecode: str):
+        view = self._span(offset, array(typecode).itemsize * count)
+        if sys.byteorder == 'little' or typecode == 'B':
+            return view.cast(typecode)
+        data = array(typecode, bytes(view))  # Big-endian hosts read a swapped copy
+        data.byteswap()
+        return data
+
+    def _unpacked(self, entry: Dict[str, Any], name: str, count: int):
+        """One section of an edition, decompressed into memory if it was stored compressed"""
+        typecode = _SECTION_TYPES[name]
+        codec = entry.get('compression', IDENTITY)
+        if codec == IDENTITY:
+            return self._section(entry[name], count, typecode)
+        data = decompress(self._span(entry[name], entry[f'{name}_size']), codec)
+        if typecode == 'B':
+            return data
+        values = array(typecode, data)
+        if sys.byteorder != 'little':
+            values.byteswap()
+        return values
+
+    def edition(self, quran_id: str) -> Optional[VerseStore]:
+        """
+        The edition as a VerseStore backed by the mapping (no text is copied;
+        a compressed edition is decompressed into memory once)
+
+        Returns:
+            VerseStore: The edition, or None if the bundle does not hold it
+
+        Raises:
+            BundleError: If the file ends before the edition's sections do
+        """
+        store = self._stores.get(quran_id)
+        if store is not None:
+            return store
+        entry = self.header['editions'].get(quran_id)
+        if entry is None:
+            return None
+        count = entry['count']
+        store = VerseStore(quran_id, 0,
+                           self._unpacked(entry, 'surahs', count),
+                           self._unpacked(entry, 'ayahs', count),
+                           self._unpacked(entry, 'offsets', count + 1),
+                           self._unpacked(entry, 'text', entry['text_bytes']))
+        self._stores[quran_id] = store
+        return store
+
+    def info(self, quran_id: str) -> Dict[str, Any]:
+        """The edition's quranList entry as stored when the bundle was built"""
+        return self.header['editions'][quran_id]['info']
+
+    def quran_list(self) -> Dict[str, Any]:
+        """A /v1/quran style response listing the bundled editions"""
+        return {'quranList': {quran_id: entry['info']
+                              for quran_id, entry in self.header['editions'].items()}}
+
+    def list_response(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        A list response stored whole when the bundle was built
+
+        Args:
+            name (str): The name it was stored under, e.g. 'quran' or 'translation'
+
+        Returns:
+            dict: The response as fetched, or None if the bundle has no such list
+        """
+        return self.header.get('lists', {}).get(name)
+
+    def response(self, quran_id: str) -> Optional[Dict[str, Any]]:
+        """
+        A /v1/quran/{quranId} style response built from the bundle
+
+        Returns:
+            dict: {"quran": {quranId: {verseNo: verse}}}, or None if not bundled
+        """
+        store = self.edition(quran_id)
+        if store is None:
+            return None
+        return {'quran': {quran_id: {str(index + 1): store.verse(index)
+                                     for index in range(len(store))}}}
+
+    def verify(self, quran_id: str) -> bool:
+        """Check an edition's text against the checksum recorded at build time"""
+        import hashlib
+        entry = self.header['editions'][quran_id]
+        text = self._unpacked(entry, 'text', entry['text_bytes'])
+        return hashlib.sha256(text).hexdigest() == entry['sha256']
+
+    def close(self) -> None:
+        """
+        Unmap the file
+
+        VerseStores handed out by edition() must not be used afterwards; if
+        any are still referenced, the mapping lives until they are collected.
+        """
+        self._stores.clear()
+        self._view.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass
+
+    def __enter__(self) -> 'QuranBundle':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"QuranBundle({self.path!r}, version={self.version!r}, {len(self.header['editions'])} editions)"
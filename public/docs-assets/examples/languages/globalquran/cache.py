@@ -0,0 +1,289 @@
+# GlobalQuran Python Helpers: On-Disk Response Cache
+# Quran text does not change, so large responses such as /v1/quran/{quranId}
+# only need to be downloaded once. Entries are revalidated with
+# If-None-Match / If-Modified-Since once their TTL has passed, and the cache
+# directory is kept under a byte budget by evicting least recently used entries.
+# With a compression codec, JSON bodies are stored compressed (a complete
+# edition takes a fraction of the space) and decompressed on read.
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional
+from urllib.parse import parse_qsl, urlencode, urlparse
+
+from .compression import IDENTITY, compressor, decompress
+
+DEFAULT_CACHE_DIR = os.environ.get(
+    'GLOBALQURAN_CACHE_DIR',
+    os.path.join(os.path.expanduser('~'), '.cache', 'globalquran'))
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+# Query parameters that do not change the response body
+IGNORED_PARAMS = {'key'}
+
+
+class CacheEntry:
+    """One cached response body with its revalidation headers"""
+
+    __slots__ = ('key', 'url', 'etag', 'last_modified', 'stored_at', 'size', 'path', 'encoding')
+
+    def __init__(self, key: str, url: str, etag: Optional[str], last_modified: Optional[str],
+                 stored_at: float, size: int, path: str, encoding: str = IDENTITY):
+        self.key = key
+        self.url = url
+        self.etag = etag
+        self.last_modified = last_modified
+        self.stored_at = stored_at
+        self.size = size          # Bytes on disk
+        self.path = path
+        self.encoding = encoding  # Codec the body file is stored with
+
+    def read(self) -> bytes:
+        """Read the cached response body (decompressed)"""
+        with open(self.path, 'rb') as f:
+            data = f.read()
+        return data if self.encoding == IDENTITY else decompress(data, self.encoding)
+
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers for revalidating this entry"""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class DiskCache:
+    """A size-bounded LRU cache of API responses stored on disk"""
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR, ttl: Optional[float] = None,
+                 max_bytes: int = DEFAULT_MAX_BYTES, compression: Optional[str] = None):
+        """
+        Args:
+            directory (str): Cache directory (default: ~/.cache/globalquran or
+                $GLOBALQURAN_CACHE_DIR)
+            ttl (float): Seconds an entry is served without contacting the API;
+                None serves entries until they are evicted
+            max_bytes (int): Total size of cached bodies before LRU eviction
+            compression (str): Codec for bodies stored with put(), e.g. 'zstd'
+                or 'gzip' (see compression.py; default: stored as received).
+                put_stream() bodies such as audio are stored as received, so
+                their paths stay playable files
+        """
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.compression = compression or IDENTITY
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.stores = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._entries: Optional['OrderedDict[str, CacheEntry]'] = None
+        self._total_bytes = 0
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Build a cache key from the endpoint path, Quran IDs and language
+
+        All of these are part of the request path; the API key is ignored so
+        that the same entry is shared by every key.
+        """
+        parsed = urlparse(url)
+        query = [(name, value) for name, value in parse_qsl(parsed.query)
+                 if name not in IGNORED_PARAMS]
+        query += [(name, str(value)) for name, value in (params or {}).items()
+                  if name not in IGNORED_PARAMS]
+        normalized = f"{parsed.netloc}{parsed.path}?{urlencode(sorted(query))}"
+        return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+    def _body_path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.body")
+
+    def _meta_path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.meta")
+
+    def _load_index(self) -> 'OrderedDict[str, CacheEntry]':
+        """Scan the directory once; file mtimes carry LRU order across processes"""
+        if self._entries is not None:
+            return self._entries
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith('.meta'):
+                continue
+            key = name[:-len('.meta')]
+            try:
+                with open(self._meta_path(key), 'r', encoding='utf-8') as f:
+                    meta = json.load(f)
+                body_stat = os.stat(self._body_path(key))
+            except (OSError, ValueError):
+                continue
+            entries.append((body_stat.st_mtime, CacheEntry(
+                key, meta.get('url', ''), meta.get('etag'), meta.get('last_modified'),
+                meta.get('stored_at', body_stat.st_mtime), body_stat.st_size,
+                self._body_path(key), meta.get('encoding', IDENTITY))))
+        entries.sort(key=lambda item: item[0])
+        self._entries = OrderedDict((entry.key, entry) for _, entry in entries)
+        self._total_bytes = sum(entry.size for entry in self._entries.values())
+        return self._entries
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Look up an entry (fresh or stale) and mark it most recently used"""
+        with self._lock:
+            entries = self._load_index()
+            entry = entries.get(key)
+            if entry is None:
+                return None
+            entries.move_to_end(key)
+        try:
+            os.utime(entry.path)
+        except OSError:
+            self._forget(key)
+            return None
+        return entry
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        """True if the entry can be served without revalidation"""
+        return self.ttl is None or time.time() - entry.stored_at < self.ttl
+
+    def put(self, key: str, url: str, body: bytes, etag: Optional[str] = None,
+            last_modified: Optional[str] = None) -> CacheEntry:
+        """
+        Store a response body (compressed with the cache's codec), evicting
+        old entries to stay within max_bytes
+        """
+        return self.put_stream(key, url, (body,), etag, last_modified,
+                               compression=self.compression)
+
+    def put_stream(self, key: str, url: str, chunks: Iterable[bytes],
+                   etag: Optional[str] = None, last_modified: Optional[str] = None,
+                   compression: str = IDENTITY) -> CacheEntry:
+        """
+        Store a body as it downloads (e.g. from QuranClient.iter_content)
+
+        Chunks go straight to a temporary file, so large bodies such as audio
+        are never held in memory; the entry appears only once complete.
+        With a compression codec, chunks are compressed on the way to disk.
+        """
+        if compression != IDENTITY:
+            chunks = self._compressed(chunks, compression)
+        size = self._atomic_write(self._body_path(key), chunks)
+        meta = {'url': url, 'etag': etag, 'last_modified': last_modified,
+                'stored_at': time.time(), 'encoding': compression}
+        self._atomic_write(self._meta_path(key), (json.dumps(meta).encode('utf-8'),))
+        entry = CacheEntry(key, url, etag, last_modified, meta['stored_at'],
+                           size, self._body_path(key), compression)
+        with self._lock:
+            entries = self._load_index()
+            previous = entries.pop(key, None)
+            if previous is not None:
+                self._total_bytes -= previous.size
+            entries[key] = entry
+            self._total_bytes += entry.size
+            self.stores += 1
+            self._evict()
+        return entry
+
+    def refresh(self, key: str) -> None:
+        """Restart an entry's TTL after a 304 Not Modified"""
+        with self._lock:
+            entry = self._load_index().get(key)
+            if entry is None:
+                return
+            entry.stored_at = time.time()
+            self.revalidations += 1
+        meta = {'url': entry.url, 'etag': entry.etag, 'last_modified': entry.last_modified,
+                'stored_at': entry.stored_at, 'encoding': entry.encoding}
+        self._atomic_write(self._meta_path(key), (json.dumps(meta).encode('utf-8'),))
+
+    def discard(self, key: str) -> None:
+        """Drop an entry, e.g. one whose body file another process removed"""
+        self._forget(key)
+
+    def record_hit(self) -> None:
+        with self._lock:
+            self.hits += 1
+
+    def record_miss(self) -> None:
+        with self._lock:
+            self.misses += 1
+
+    def _evict(self) -> None:
+        # Caller holds the lock; never evict the entry that was just stored
+        while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+            key, entry = self._entries.popitem(last=False)
+            self._total_bytes -= entry.size
+            self.evictions += 1
+            self._remove_files(key)
+
+    def _forget(self, key: str) -> None:
+        with self._lock:
+            entry = self._load_index().pop(key, None)
+            if entry is not None:
+                self._total_bytes -= entry.size
+        self._remove_files(key)
+
+    def _remove_files(self, key: str) -> None:
+        for path in (self._body_path(key), self._meta_path(key)):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _compressed(chunks: Iterable[bytes], codec: str) -> Iterable[bytes]:
+        encoder = compressor(codec)
+        for chunk in chunks:
+            yield encoder.compress(chunk)
+        yield encoder.flush()
+
+    def _atomic_write(self, path: str, chunks: Iterable[bytes]) -> int:
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        size = 0
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                for chunk in chunks:
+                    f.write(chunk)
+                    size += len(chunk)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        return size
+
+    def clear(self) -> None:
+        """Remove every cached entry"""
+        with self._lock:
+            keys = list(self._load_index())
+            self._entries.clear()
+            self._total_bytes = 0
+        for key in keys:
+            self._remove_files(key)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Counters and current size, for monitoring
+
+        `hits` counts responses served from disk (including after a 304),
+        `misses` counts bodies downloaded, `revalidations` counts 304s.
+        """
+        with self._lock:
+            entries = self._load_index()
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'revalidations': self.revalidations,
+                'stores': self.stores,
+                'evictions': self.evictions,
+                'entries': len(entries),
+                'bytes': self._total_bytes,
+            }
@@ -0,0 +1,294 @@
+# GlobalQuran Python Helpers: Indexed Catalog
+# The list endpoints come in three shapes: v1 /quran returns quranList with
+# 'language', v1 /list/<type> returns the entries under the type's name, and
+# v2 /list/<type> returns 'list' with 'language_code'. parse_catalog reads any
+# of them into CatalogRecord objects with one set of field names, so callers
+# stop re-keying raw dicts. The list examples also filtered with a list
+# comprehension over every entry on each call (filter_by_language,
+# get_formats_by_type, ...). Catalog is built once from the records and keeps
+# secondary indexes by language, type, format, default flag and audio media
+# format/bitrate. A compound query walks the smallest matching index and
+# checks the others by set membership, so it costs in proportion to the
+# result rather than the catalog.
+
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+# Indexed fields; query() accepts these as keyword arguments
+INDEXED_FIELDS = ('language_code', 'type', 'format', 'default', 'media', 'media_type', 'bitrate')
+CATALOG_MEMO_SIZE = 16
+
+# v1 /list/<type> response keys, and what their entries leave implicit
+V1_LIST_DEFAULTS = {'translation': {'type': 'translation', 'format': 'text'},
+                    'recitor': {'format': 'audio'},
+                    'quran': {'type': 'quran', 'format': 'text'}}
+
+_MISSING = object()
+_EMPTY: Dict[str, Any] = MappingProxyType({})  # Shared by records without media/extras
+
+
+class CatalogRecord:
+    """One edition of a list response (translation, recitation or Quran text)"""
+
+    __slots__ = ('id', 'name', 'english_name', 'native_name', 'language_code', 'type',
+                 'format', 'default', 'source', 'supported_version', 'author', 'media', 'extra')
+
+    # Raw keys read into the named slots ('language' is the v1 spelling)
+    FIELDS = ('name', 'english_name', 'native_name', 'type', 'format', 'source',
+              'supported_version', 'author')
+
+    def __init__(self, id: str, name: Optional[str] = None, english_name: Optional[str] = None,
+                 native_name: Optional[str] = None, language_code: Optional[str] = None,
+                 type: Optional[str] = None, format: Optional[str] = None, default: bool = False,
+                 source: Optional[str] = None, supported_version: Any = None,
+                 author: Optional[str] = None, media: Optional[Dict[str, Dict[str, Any]]] = None,
+                 extra: Optional[Dict[str, Any]] = None):
+        self.id = id
+        self.name = name
+        self.english_name = english_name
+        self.native_name = native_name
+        self.language_code = language_code
+        self.type = type
+        self.format = format
+        self.default = default
+        self.source = source
+        self.supported_version = supported_version
+        self.author = author
+        self.media = media or _EMPTY    # Media map as the API sends it ({'mp3-128': {...}})
+        self.extra = extra or _EMPTY    # Any other keys, e.g. a v1 recitor's 'style'
+
+    @classmethod
+    def from_entry(cls, entry_id: str, entry: Dict[str, Any],
+                   defaults: Optional[Dict[str, Any]] = None) -> 'CatalogRecord':
+        """Record of one raw list entry, v1 or v2"""
+        fields = dict(defaults or {})
+        extra = {}
+        for key, value in entry.items():
+            if key in cls.FIELDS:
+                fields[key] = value
+            elif key not in ('language', 'language_code', 'default', 'media'):
+                extra[key] = value
+        media = entry.get('media')
+        return cls(entry_id, language_code=entry.get('language_code', entry.get('language')),
+                   default=bool(entry.get('default')),
+                   media=media if isinstance(media, dict) else None, extra=extra, **fields)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style access by raw key, so code written for the JSON keeps working"""
+        if key == 'language':
+            key = 'language_code'
+        if key in self.__slots__ and key != 'extra':
+            value = getattr(self, key)
+            if key == 'media':
+                return value or default
+            return default if value is None else value
+        return self.extra.get(key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The record as a v2 list entry"""
+        entry = {key: getattr(self, key) for key in self.FIELDS if getattr(self, key) is not None}
+        if self.language_code is not None:
+            entry['language_code'] = self.language_code
+        entry['default'] = self.default
+        if self.media:
+            entry['media'] = dict(self.media)
+        entry.update(self.extra)
+        return entry
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CatalogRecord):
+            return NotImplemented
+        return self.id == other.id and self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        return f"CatalogRecord({self.id!r}, {self.type!r}, {self.language_code!r})"
+
+
+def parse_catalog(data: Optional[Dict[str, Any]],
+                  list_type: Optional[str] = None) -> Dict[str, CatalogRecord]:
+    """
+    Records of any list response, by ID
+
+    Args:
+        data (dict): A v2 /list/<type> response ('list'), a v1 /quran one
+            ('quranList') or a v1 /list/<type> one (entries under the type)
+        list_type (str): 'translation', 'recitor' or 'quran' for a v1
+            /list/<type> response (default: any of those keys present)
+
+    Returns:
+        dict: CatalogRecord by ID in response order (empty for no data)
+    """
+    if not isinstance(data, dict):
+        return {}
+    defaults = None
+    entries = data.get('list', data.get('quranList'))
+    if not isinstance(entries, dict):
+        for key in ([list_type] if list_type else V1_LIST_DEFAULTS):
+            if isinstance(data.get(key), dict):
+                entries, defaults = data[key], V1_LIST_DEFAULTS.get(key)
+                break
+        else:
+            return {}
+    return {entry_id: CatalogRecord.from_entry(entry_id, entry, defaults)
+            for entry_id, entry in entries.items() if isinstance(entry, dict)}
+
+
+def _index_values(record: CatalogRecord) -> Iterator[Tuple[str, Any]]:
+    """(field, value) pairs a record is indexed under"""
+    for field in ('language_code', 'type', 'format'):
+        value = getattr(record, field)
+        if value is not None:
+            yield field, value
+    yield 'default', record.default
+    for name, details in record.media.items():
+        yield 'media', name
+        if isinstance(details, dict):
+            if details.get('type') is not None:
+                yield 'media_type', details['type']
+            if str(details.get('kbs', '')).isdigit():
+                yield 'bitrate', int(details['kbs'])
+
+
+class Catalog:
+    """Catalog records by ID with secondary indexes for compound queries"""
+
+    def __init__(self, records: Iterable[CatalogRecord] = ()):
+        """
+        Args:
+            records (iterable): CatalogRecords, e.g. parse_catalog(data).values()
+        """
+        self.records: Dict[str, CatalogRecord] = {}
+        self._positions: Dict[str, int] = {}
+        # field -> value -> IDs in catalog order, plus a set of them for
+        # membership tests and the records themselves for one-field queries
+        self._index: Dict[str, Dict[Any, List[str]]] = {field: {} for field in INDEXED_FIELDS}
+        self._sets: Dict[str, Dict[Any, Set[str]]] = {field: {} for field in INDEXED_FIELDS}
+        self._records: Dict[str, Dict[Any, List[CatalogRecord]]] = {
+            field: {} for field in INDEXED_FIELDS}
+        for record in records:
+            self.add(record)
+
+    @classmethod
+    def from_response(cls, data: Optional[Dict[str, Any]],
+                      list_type: Optional[str] = None) -> 'Catalog':
+        """Catalog of any v1 or v2 list response (see parse_catalog)"""
+        return cls(parse_catalog(data, list_type).values())
+
+    def add(self, record: CatalogRecord) -> None:
+        """Add a record (IDs are expected to be unique)"""
+        self._positions[record.id] = len(self.records)
+        self.records[record.id] = record
+        for field, value in _index_values(record):
+            ids = self._index[field].setdefault(value, [])
+            if not ids or ids[-1] != record.id:  # media may repeat a type or bitrate
+                ids.append(record.id)
+                self._sets[field].setdefault(value, set()).add(record.id)
+                self._records[field].setdefault(value, []).append(record)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __contains__(self, record_id: str) -> bool:
+        return record_id in self.records
+
+    def __getitem__(self, record_id: str) -> CatalogRecord:
+        return self.records[record_id]
+
+    def __iter__(self) -> Iterator[CatalogRecord]:
+        return iter(self.records.values())
+
+    def values(self, field: str) -> List[Any]:
+        """Distinct values of an indexed field, e.g. values('language_code')"""
+        return list(self._index[field])
+
+    def count(self, field: str, value: Any) -> int:
+        """Number of records with field == value, in O(1)"""
+        return len(self._index[field].get(value, ()))
+
+    def _postings(self, field: str, wanted: Any) -> List[str]:
+        if field not in self._index:
+            raise ValueError(f"Unknown catalog field: {field}")
+        if isinstance(wanted, (list, tuple, set, frozenset)):
+            # Any of several values: merge back into catalog order
+            ids = {entry_id for value in wanted for entry_id in self._index[field].get(value, ())}
+            return sorted(ids, key=self._positions.__getitem__)
+        return self._index[field].get(wanted, [])
+
+    def _membership(self, field: str, wanted: Any, postings: List[str]) -> Set[str]:
+        if isinstance(wanted, (list, tuple, set, frozenset)):
+            return set(postings)
+        return self._sets[field].get(wanted, set())
+
+    def ids(self, **criteria: Any) -> List[str]:
+        """
+        IDs of the records matching every criterion, in catalog order
+
+        Each keyword is an indexed field (see INDEXED_FIELDS) and a value, or
+        a list/tuple/set of values meaning any of them, e.g.
+        ids(language_code=('en', 'ur'), type='translation', default=True).
+        With no criteria, every ID.
+
+        Raises:
+            ValueError: If a keyword is not an indexed field
+        """
+        if not criteria:
+            return list(self.records)
+        postings = sorted(((self._postings(field, wanted), field, wanted)
+                           for field, wanted in criteria.items()), key=lambda p: len(p[0]))
+        result = postings[0][0]
+        for ids, field, wanted in postings[1:]:
+            if not result:
+                break
+            members = self._membership(field, wanted, ids)
+            result = [entry_id for entry_id in result if entry_id in members]
+        return list(result)
+
+    def query(self, **criteria: Any) -> List[CatalogRecord]:
+        """Records matching every criterion (see ids()), in catalog order"""
+        if len(criteria) == 1:
+            (field, wanted), = criteria.items()
+            if field in self._records and not isinstance(wanted, (list, tuple, set, frozenset)):
+                return list(self._records[field].get(wanted, ()))
+        records = self.records
+        return [records[record_id] for record_id in self.ids(**criteria)]
+
+    def items(self, **criteria: Any) -> List[Tuple[str, CatalogRecord]]:
+        """(ID, record) pairs matching every criterion (see ids())"""
+        return [(record_id, self.records[record_id]) for record_id in self.ids(**criteria)]
+
+
+_memo: 'OrderedDict[Tuple[int, Optional[str]], Tuple[Dict[str, Any], Catalog]]' = OrderedDict()
+_memo_lock = threading.Lock()
+
+
+def catalog_of(data: Dict[str, Any], list_type: Optional[str] = None) -> Catalog:
+    """
+    Catalog for a list response, built once per response object
+
+    The list fetchers are memoized (memo.py) and hand back the same dict on
+    every call, so this builds the indexes once per fetched catalog.
+    """
+    key = (id(data), list_type)
+    with _memo_lock:
+        cached = _memo.get(key)
+        if cached is not None and cached[0] is data:
+            _memo.move_to_end(key)
+            return cached[1]
+    catalog = Catalog.from_response(data, list_type)
+    with _memo_lock:
+        _memo[key] = (data, catalog)  # Holding data keeps its id from being reused
+        _memo.move_to_end(key)
+        while len(_memo) > CATALOG_MEMO_SIZE:
+            _memo.popitem(last=False)
+    return catalog
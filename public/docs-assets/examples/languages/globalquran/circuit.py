@@ -0,0 +1,101 @@
+# GlobalQuran Python Helpers: Circuit Breaker
+# When the API degrades, every worker of a sweep used to sit out the full
+# request timeout, one call after another. The breaker counts consecutive
+# failures (connection errors, timeouts, 5xx); after enough of them it opens
+# and requests fail at once with CircuitOpenError. Once reset_timeout has
+# passed it lets a few probe requests through (half-open), closing again on
+# success and reopening on failure.
+
+import threading
+import time
+from typing import Dict, Optional
+
+import requests
+
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RESET_TIMEOUT = 30.0  # Seconds open before probing again
+DEFAULT_HALF_OPEN_PROBES = 1  # Requests allowed through while half-open
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half-open'
+
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """Raised instead of sending a request while the circuit is open (never retried)"""
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker shared by every thread of a client"""
+
+    def __init__(self, failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+                 reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+                 half_open_probes: int = DEFAULT_HALF_OPEN_PROBES):
+        """
+        Args:
+            failure_threshold (int): Consecutive failures that open the circuit
+            reset_timeout (float): Seconds to stay open before probing
+            half_open_probes (int): Probe requests allowed in flight while half-open
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_probes = half_open_probes
+        self.state = CLOSED
+        self.failures = 0
+        self.opened = 0        # Times the circuit has opened
+        self.rejected = 0      # Requests refused while open
+        self._opened_at = 0.0
+        self._probes = 0
+        self._lock = threading.Lock()
+
+    def before_request(self) -> None:
+        """
+        Admit a request or refuse it
+
+        Raises:
+            CircuitOpenError: If the circuit is open (or half-open with every
+                probe slot taken)
+        """
+        with self._lock:
+            if self.state == OPEN:
+                remaining = self._opened_at + self.reset_timeout - time.monotonic()
+                if remaining > 0:
+                    self.rejected += 1
+                    raise CircuitOpenError(f"Circuit open; retrying the API in {remaining:.1f}s")
+                self.state, self._probes = HALF_OPEN, 0
+            if self.state == HALF_OPEN:
+                if self._probes >= self.half_open_probes:
+                    self.rejected += 1
+                    raise CircuitOpenError("Circuit half-open; waiting for a probe request")
+                self._probes += 1
+
+    def record_success(self) -> None:
+        """A request got an answer from a healthy API (including 4xx and 429)"""
+        with self._lock:
+            if self.state == OPEN:
+                return  # A straggler sent before the circuit opened
+            self.failures = 0
+            self.state = CLOSED
+
+    def record_failure(self) -> None:
+        """A request failed in a way that suggests the API is unhealthy"""
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != OPEN:
+                    self.opened += 1
+                self.state = OPEN
+                self._opened_at = time.monotonic()
+
+    def stats(self) -> Dict[str, object]:
+        """Current state and counters"""
+        with self._lock:
+            return {'state': self.state, 'failures': self.failures,
+                    'opened': self.opened, 'rejected': self.rejected}
+
+    def reset(self, state: Optional[str] = None) -> None:
+        """Force the circuit closed (or into another state)"""
+        with self._lock:
+            self.state = state or CLOSED
+            self.failures = 0
+            self._opened_at = time.monotonic()
@@ -0,0 +1,344 @@
+# GlobalQuran Python Helpers: Shared HTTP Client
+# One pooled requests.Session shared by every example fetcher, so bulk sweeps
+# (604 pages, 6,236 ayahs) reuse keep-alive connections instead of paying a
+# fresh TCP+TLS handshake on every call. Every request goes through the
+# client's retry policy (see retry.py) and optionally request hedging
+# (hedging.py); requests to the API itself are also paced by its rate limiter
+# and guarded by a circuit breaker (circuit.py), which absolute URLs on other
+# hosts, such as audio files on the CDN, bypass. Responses
+# are requested compressed (see compression.py) and decoded transparently.
+
+import threading
+import time
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .cache import CacheEntry, DiskCache
+from .circuit import CircuitBreaker
+from .compression import TransferMetrics, accept_encoding
+from .decoding import loads
+from .hedging import Hedger
+from .retry import RateLimiter, RetryMetrics, RetryPolicy
+
+# Configuration
+API_BASE = 'https://api.globalquran.com'
+API_KEY = 'REPLACE_WITH_YOUR_KEY'  # Replace with your actual API key
+
+DEFAULT_TIMEOUT = 30
+DEFAULT_POOL_CONNECTIONS = 4   # Number of per-host pools kept alive
+DEFAULT_POOL_MAXSIZE = 16      # Keep-alive connections per host
+DEFAULT_CHUNK_SIZE = 64 * 1024 # Bytes read per chunk when streaming a body
+
+
+class QuranClient:
+    """A pooled HTTP client shared by all GlobalQuran fetchers"""
+
+    def __init__(self, api_key: str = API_KEY, base_url: str = API_BASE,
+                 pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+                 pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+                 pool_block: bool = False,
+                 timeout: float = DEFAULT_TIMEOUT,
+                 cache: Optional[DiskCache] = None,
+                 retry: Optional[RetryPolicy] = None,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 breaker: Optional[CircuitBreaker] = None,
+                 hedger: Optional[Hedger] = None,
+                 encodings: Optional[Tuple[str, ...]] = None):
+        """
+        Create a client with its own keep-alive connection pool
+
+        Args:
+            api_key (str): GlobalQuran API key, added to relative paths
+            base_url (str): API base URL (default: 'https://api.globalquran.com')
+            pool_connections (int): Number of hosts to keep a pool for
+            pool_maxsize (int): Maximum keep-alive connections per host
+            pool_block (bool): Block instead of opening extra connections once
+                a host has pool_maxsize connections in use (hard per-host limit)
+            timeout (float): Default request timeout in seconds
+            cache (DiskCache): Response cache used by get_json (default: none)
+            retry (RetryPolicy): When and how long to retry failed requests
+                (default: RetryPolicy(); RetryPolicy(max_retries=0) disables it)
+            rate_limiter (RateLimiter): Paces every request (default: the
+                public API's limit when base_url is the public API, else none)
+            breaker (CircuitBreaker): Fails requests fast while the API is
+                down (default: none; the shared client from get_client() has one)
+            hedger (Hedger): Duplicates requests slower than the recent p95
+                latency (default: none)
+            encodings (tuple): Content codings to accept, most preferred first
+                (default: zstd, br, gzip, deflate, whichever can be decoded);
+                () asks for uncompressed bodies
+        """
+        self.api_key = api_key
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.cache = cache
+        self.pool_maxsize = pool_maxsize
+        self.retry = retry if retry is not None else RetryPolicy()
+        if rate_limiter is None and self.base_url == API_BASE:
+            rate_limiter = RateLimiter()
+        self.rate_limiter = rate_limiter
+        self.breaker = breaker
+        self.hedger = hedger
+        self.metrics = RetryMetrics()
+        self.transfer = TransferMetrics()
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections,
+                              pool_maxsize=pool_maxsize,
+                              pool_block=pool_block)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            'Accept': 'application/json',
+            'Accept-Encoding': accept_encoding(encodings),
+            'User-Agent': 'GlobalQuran-Python-Examples'
+        })
+
+    def build_url(self, path: str) -> str:
+        """
+        Resolve a path such as '/v1/page/1/quran-simple' against the base URL
+
+        Absolute URLs are returned unchanged.
+        """
+        if path.startswith('http://') or path.startswith('https://'):
+            return path
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    def get(self, path: str, params: Optional[Dict[str, Any]] = None,
+            timeout: Optional[float] = None, **kwargs) -> requests.Response:
+        """
+        Send a GET request over the pooled session
+
+        Connection errors, timeouts and retryable statuses (429, 5xx) are
+        retried per the client's RetryPolicy; a 429 also pauses the rate
+        limiter for every other thread. Once retries run out the last
+        response is returned (or the last error raised) as usual. While the
+        circuit breaker is open, CircuitOpenError is raised without sending.
+        The rate limiter and circuit breaker apply to API URLs only; other
+        hosts (the audio CDN) are neither paced nor counted against the API.
+
+        Args:
+            path (str): API path or absolute URL
+            params (dict): Query parameters; the API key is added for relative
+                paths unless one is already given
+            timeout (float): Timeout per attempt (default: client timeout)
+
+        Returns:
+            requests.Response: The raw response
+        """
+        url = self.build_url(path)
+        api = url.startswith(self.base_url)
+        if api and 'key=' not in url:
+            params = dict(params or {})
+            params.setdefault('key', self.api_key)
+        timeout = timeout if timeout is not None else self.timeout
+        rate_limiter = self.rate_limiter if api else None
+        breaker = self.breaker if api else None
+
+        retry = 0
+        while True:
+            throttled = rate_limiter.acquire() if rate_limiter is not None else 0.0
+            self.metrics.record_request(throttled)
+            try:
+                response = self._send(url, params, timeout, kwargs, breaker)
+            except requests.exceptions.RequestException as e:
+                if not self.retry.retryable_error(e):
+                    raise
+                if retry >= self.retry.max_retries:
+                    self.metrics.record_giveup()
+                    raise
+                reason, delay = type(e).__name__, self.retry.backoff(retry)
+            else:
+                if response.status_code not in self.retry.statuses:
+                    return response
+                delay = self.retry.response_delay(response, retry)
+                if delay is None or retry >= self.retry.max_retries:
+                    self.metrics.record_giveup()
+                    return response
+                reason = str(response.status_code)
+                if response.status_code == 429 and rate_limiter is not None:
+                    rate_limiter.pause(delay)
+                response.close()
+            self.metrics.record_retry(reason, delay)
+            time.sleep(delay)
+            retry += 1
+
+    def _send(self, url: str, params: Optional[Dict[str, Any]], timeout: float,
+              kwargs: Dict[str, Any], breaker: Optional[CircuitBreaker]) -> requests.Response:
+        """One attempt: ask the circuit breaker, then send (hedged if configured)"""
+        if breaker is not None:
+            breaker.before_request()
+
+        def send() -> requests.Response:
+            return self.session.get(url, params=params, timeout=timeout, **kwargs)
+
+        try:
+            response = send() if self.hedger is None else self.hedger.run(send)
+        except requests.exceptions.RequestException as e:
+            if breaker is not None:
+                if self.retry.retryable_error(e):
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+            raise
+        if breaker is not None:
+            if response.status_code >= 500:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+        if not kwargs.get('stream'):
+            self._record_transfer(response)
+        return response
+
+    def _record_transfer(self, response: requests.Response) -> None:
+        """Count a read body's size on the wire and decoded"""
+        body_bytes = len(response.content)
+        try:
+            wire_bytes = response.raw.tell()  # Bytes read off the socket, before decoding
+        except (AttributeError, OSError):
+            wire_bytes = body_bytes
+        self.transfer.record(response.headers.get('Content-Encoding', 'identity'),
+                             wire_bytes or body_bytes, body_bytes)
+
+    def get_json(self, path: str, params: Optional[Dict[str, Any]] = None,
+                 timeout: Optional[float] = None, cache: Optional[DiskCache] = None,
+                 **kwargs) -> Any:
+        """
+        GET a path and decode the JSON body (from its bytes, see decoding.py)
+
+        With a cache, fresh entries are served without any request, and stale
+        ones are revalidated with a conditional request (304 keeps the entry).
+
+        Args:
+            path (str): API path or absolute URL
+            params (dict): Query parameters
+            timeout (float): Request timeout (default: client timeout)
+            cache (DiskCache): Cache for this call (default: the client's cache)
+
+        Raises:
+            requests.RequestException: If the request fails
+            ValueError: If the response is not valid JSON
+        """
+        cache = cache if cache is not None else self.cache
+        if cache is None:
+            response = self.get(path, params=params, timeout=timeout, **kwargs)
+            response.raise_for_status()
+            return loads(response.content)
+
+        url = self.build_url(path)
+        key = cache.make_key(url, params)
+        entry = cache.get(key)
+        if entry is not None and cache.is_fresh(entry):
+            body = self._read_cached(cache, entry)
+            if body is not None:
+                cache.record_hit()
+                return loads(body)
+            entry = None
+
+        headers = dict(kwargs.pop('headers', None) or {})
+        if entry is not None:
+            headers.update(entry.validators())
+        response = self.get(path, params=params, timeout=timeout, headers=headers, **kwargs)
+        if entry is not None and response.status_code == 304:
+            body = self._read_cached(cache, entry)
+            if body is not None:
+                cache.refresh(key)
+                cache.record_hit()
+                return loads(body)
+            # The body went away after the conditional request was sent (e.g.
+            # evicted by another process): fetch it again unconditionally
+            for name in entry.validators():
+                headers.pop(name, None)
+            response = self.get(path, params=params, timeout=timeout, headers=headers, **kwargs)
+
+        response.raise_for_status()
+        cache.record_miss()
+        data = loads(response.content)
+        cache.put(key, url, response.content, response.headers.get('ETag'),
+                  response.headers.get('Last-Modified'))
+        return data
+
+    @staticmethod
+    def _read_cached(cache: DiskCache, entry: CacheEntry) -> Optional[bytes]:
+        """A cached body, or None (and the entry dropped) if it can't be read"""
+        try:
+            return entry.read()
+        except OSError:
+            cache.discard(entry.key)
+            return None
+
+    def iter_content(self, path: str, params: Optional[Dict[str, Any]] = None,
+                     timeout: Optional[float] = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                     **kwargs) -> Iterator[bytes]:
+        """
+        GET a path and yield the body in chunks as it arrives
+
+        The connection goes back to the pool once the body is exhausted or
+        the generator is closed.
+
+        Args:
+            path (str): API path or absolute URL
+            params (dict): Query parameters
+            timeout (float): Timeout for connecting and for each read
+            chunk_size (int): Maximum bytes per chunk
+
+        Raises:
+            requests.RequestException: If the request fails
+        """
+        response = self.get(path, params=params, timeout=timeout, stream=True, **kwargs)
+        try:
+            response.raise_for_status()
+            yield from response.iter_content(chunk_size=chunk_size)
+        finally:
+            response.close()
+
+    def close(self) -> None:
+        """Close every pooled connection"""
+        self.session.close()
+
+    def __enter__(self) -> 'QuranClient':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+_default_client: Optional[QuranClient] = None
+_default_lock = threading.Lock()
+
+
+def get_client() -> QuranClient:
+    """
+    Return the process-wide client shared by all fetchers
+
+    Returns:
+        QuranClient: The shared client, created on first use
+    """
+    global _default_client
+    if _default_client is None:
+        with _default_lock:
+            if _default_client is None:
+                _default_client = QuranClient(breaker=CircuitBreaker())
+    return _default_client
+
+
+def configure_client(**kwargs) -> QuranClient:
+    """
+    Replace the shared client, e.g. to change the pool size or API key
+
+    Args:
+        **kwargs: Arguments passed to QuranClient (a CircuitBreaker is added
+            unless breaker is given)
+
+    Returns:
+        QuranClient: The new shared client
+    """
+    global _default_client
+    with _default_lock:
+        if _default_client is not None:
+            _default_client.close()
+        kwargs.setdefault('breaker', CircuitBreaker())
+        _default_client = QuranClient(**kwargs)
+    return _default_client
@@ -0,0 +1,178 @@
+# GlobalQuran Python Helpers: Compressed Transfer and Storage
+# A complete edition or an /all response is megabytes of JSON in which the
+# keys "surah", "ayah" and "verse" repeat for every ayah, so it shrinks
+# several times under any general-purpose codec. The client advertises the
+# content codings urllib3 can decode here (zstd and br only when zstandard /
+# brotli are installed, gzip and deflate always) and counts the bytes that
+# crossed the wire against the decoded body. The same codecs compress cached
+# response bodies (cache.py) and edition files (bundle.py) on disk.
+
+import gzip
+import threading
+import zlib
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:  # brotli is optional
+    brotli = None
+try:
+    import zstandard
+except ImportError:  # zstandard is optional
+    zstandard = None
+
+# Content codings in order of preference (best ratio and decode speed first)
+PREFERRED_ENCODINGS = ('zstd', 'br', 'gzip', 'deflate')
+IDENTITY = 'identity'
+DEFAULT_STORAGE_CODEC = 'zstd' if zstandard is not None else 'gzip'
+
+
+def _zstd_decompress(data: bytes) -> bytes:
+    # Frames written by streaming encoders may omit the content size
+    return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+
+
+# name -> (compress(data, level), decompress(data), default level)
+CODECS: Dict[str, Tuple[Callable[[bytes, int], bytes], Callable[[bytes], bytes], int]] = {
+    IDENTITY: (lambda data, level: bytes(data), bytes, 0),
+    'gzip': (lambda data, level: gzip.compress(data, compresslevel=level, mtime=0),
+             gzip.decompress, 6),
+    'deflate': (lambda data, level: zlib.compress(data, level), zlib.decompress, 6),
+}
+if brotli is not None:
+    CODECS['br'] = (lambda data, level: brotli.compress(data, quality=level),
+                    brotli.decompress, 5)
+if zstandard is not None:
+    CODECS['zstd'] = (lambda data, level: zstandard.ZstdCompressor(level=level).compress(data),
+                      _zstd_decompress, 6)
+
+
+def available_codecs() -> List[str]:
+    """Codecs usable in this process, most preferred first"""
+    return [name for name in PREFERRED_ENCODINGS if name in CODECS]
+
+
+def compress(data: bytes, codec: str = DEFAULT_STORAGE_CODEC, level: Optional[int] = None) -> bytes:
+    """
+    Compress bytes with a named codec
+
+    Args:
+        data (bytes): Bytes to compress
+        codec (str): 'zstd', 'br', 'gzip', 'deflate' or 'identity'
+        level (int): Codec-specific level (default: a fast one)
+
+    Raises:
+        ValueError: If the codec is not available
+    """
+    try:
+        encoder, _, default_level = CODECS[codec]
+    except KeyError:
+        raise ValueError(f"Codec {codec!r} is not available "
+                         f"(have: {', '.join(CODECS)})") from None
+    return encoder(data, default_level if level is None else level)
+
+
+class _Identity:
+    def compress(self, data: bytes) -> bytes:
+        return bytes(data)
+
+    def flush(self) -> bytes:
+        return b''
+
+
+class _Brotli:
+    def __init__(self, level: int):
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.finish()
+
+
+def compressor(codec: str = DEFAULT_STORAGE_CODEC, level: Optional[int] = None):
+    """
+    Incremental encoder for codec with compress(chunk) and flush() methods,
+    for bodies written as they download; the output reads back with
+    decompress()
+
+    Raises:
+        ValueError: If the codec is not available
+    """
+    if codec not in CODECS:
+        raise ValueError(f"Codec {codec!r} is not available (have: {', '.join(CODECS)})")
+    level = CODECS[codec][2] if level is None else level
+    if codec == 'gzip':
+        return zlib.compressobj(level, zlib.DEFLATED, 31)  # wbits 31: gzip container
+    if codec == 'deflate':
+        return zlib.compressobj(level)
+    if codec == 'br':
+        return _Brotli(level)
+    if codec == 'zstd':
+        return zstandard.ZstdCompressor(level=level).compressobj()
+    return _Identity()
+
+
+def decompress(data: bytes, codec: str) -> bytes:
+    """
+    Decompress bytes written by compress()
+
+    Raises:
+        ValueError: If the codec is not available
+    """
+    try:
+        _, decoder, _ = CODECS[codec]
+    except KeyError:
+        raise ValueError(f"Codec {codec!r} is not available to read this data") from None
+    return decoder(data)
+
+
+def accept_encoding(encodings: Optional[Tuple[str, ...]] = None) -> str:
+    """
+    Accept-Encoding header value for the codings the HTTP stack can decode
+
+    Args:
+        encodings (tuple): Codings to offer, most preferred first (default:
+            PREFERRED_ENCODINGS); an empty tuple asks for 'identity'
+    """
+    try:
+        from urllib3.response import HTTPResponse
+        decodable = set(HTTPResponse.CONTENT_DECODERS)
+    except (ImportError, AttributeError):
+        decodable = {'gzip', 'deflate'}
+    offered = [name for name in (PREFERRED_ENCODINGS if encodings is None else encodings)
+               if name in decodable]
+    return ', '.join(offered) or IDENTITY
+
+
+class TransferMetrics:
+    """Bytes received on the wire against decoded body bytes, per content coding"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Zero every counter"""
+        with self._lock:
+            self.responses = 0
+            self.wire_bytes = 0      # Body bytes as sent (compressed if encoded)
+            self.body_bytes = 0      # Body bytes after decoding
+            self.encodings: Counter = Counter()  # Content-Encoding -> responses
+
+    def record(self, encoding: str, wire_bytes: int, body_bytes: int) -> None:
+        with self._lock:
+            self.responses += 1
+            self.wire_bytes += wire_bytes
+            self.body_bytes += body_bytes
+            self.encodings[encoding] += 1
+
+    def snapshot(self) -> Dict[str, object]:
+        """Current counters as a plain dict"""
+        with self._lock:
+            return {'responses': self.responses, 'wire_bytes': self.wire_bytes,
+                    'body_bytes': self.body_bytes,
+                    'ratio': round(self.body_bytes / self.wire_bytes, 2) if self.wire_bytes else None,
+                    'encodings': dict(self.encodings)}
@@ -0,0 +1,110 @@
+# GlobalQuran Python Helpers: JSON Decoding Backend
+# response.json() first decodes the body to str (guessing its charset when
+# the header has none) and then runs the stdlib parser over it. For sweeps
+# such as every translation's complete edition, parsing is a real share of
+# the run. loads() parses the raw body bytes with the fastest backend found
+# at import time: orjson, then ujson, then the stdlib json module. Every
+# backend raises json.JSONDecodeError on bad input, so existing
+# `except json.JSONDecodeError` handlers keep working. On translations
+# orjson parses about twice as fast as the stdlib; on fully vocalised Arabic
+# text the two are close (see benchmarks/bench_json_decoding.py).
+#
+# Set GLOBALQURAN_JSON=json (or ujson/orjson) to force a backend, or call
+# use_backend() at runtime, e.g. to compare them.
+
+import json
+import os
+from typing import Any, Callable, Dict, List, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+try:
+    import ujson
+except ImportError:  # ujson is optional
+    ujson = None
+
+BACKEND_PREFERENCE = ('orjson', 'ujson', 'json')
+
+JSONInput = Union[bytes, bytearray, memoryview, str]
+
+
+def _orjson_loads(data: JSONInput) -> Any:
+    return orjson.loads(data)  # Takes bytes, bytearray, memoryview and str as they are
+
+
+def _ujson_loads(data: JSONInput) -> Any:
+    if isinstance(data, (bytearray, memoryview)):
+        data = bytes(data)
+    try:
+        return ujson.loads(data)
+    except json.JSONDecodeError:
+        raise
+    except ValueError as e:
+        raise json.JSONDecodeError(str(e), data if isinstance(data, str) else '', 0) from None
+
+
+def _json_loads(data: JSONInput) -> Any:
+    if isinstance(data, memoryview):
+        data = bytes(data)
+    return json.loads(data)  # Detects UTF-8/16/32 from the bytes themselves
+
+
+_BACKENDS: Dict[str, Callable[[JSONInput], Any]] = {'json': _json_loads}
+if ujson is not None:
+    _BACKENDS['ujson'] = _ujson_loads
+if orjson is not None:
+    _BACKENDS['orjson'] = _orjson_loads
+
+
+def available_backends() -> List[str]:
+    """Backends importable in this process, fastest first"""
+    return [name for name in BACKEND_PREFERENCE if name in _BACKENDS]
+
+
+def use_backend(name: str) -> str:
+    """
+    Switch the backend loads() uses
+
+    Args:
+        name (str): 'orjson', 'ujson' or 'json'
+
+    Returns:
+        str: The backend previously in use
+
+    Raises:
+        ValueError: If the backend is not installed
+    """
+    global BACKEND, _loads
+    if name not in _BACKENDS:
+        raise ValueError(f"JSON backend {name!r} is not available "
+                         f"(have: {', '.join(available_backends())})")
+    previous, BACKEND, _loads = BACKEND, name, _BACKENDS[name]
+    return previous
+
+
+BACKEND = available_backends()[0]
+_loads = _BACKENDS[BACKEND]
+if os.environ.get('GLOBALQURAN_JSON') in _BACKENDS:
+    use_backend(os.environ['GLOBALQURAN_JSON'])
+
+
+def loads(data: JSONInput) -> Any:
+    """
+    Parse JSON from bytes (or str) with the selected backend
+
+    Raises:
+        json.JSONDecodeError: If the data is not valid JSON
+    """
+    return _loads(data)
+
+
+def response_json(response) -> Any:
+    """
+    Parse a requests.Response body from its raw bytes (use instead of response.json())
+
+    Raises:
+        json.JSONDecodeError: If the body is not valid JSON
+    """
+    return _loads(response.content)
@@ -0,0 +1,156 @@
+# GlobalQuran Python Helpers: Hedged Requests
+# A few slow upstream responses dominate p99 for small lookups such as
+# fetch_ayah. A Hedger sends the request, and if no answer has arrived by
+# the recent p95 latency it sends one duplicate and takes whichever answers
+# first. Hedges are capped at a fraction of all requests so that a slow API
+# is not hit with twice the load.
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Deque, Dict, Optional
+
+import requests
+
+DEFAULT_QUANTILE = 0.95
+DEFAULT_WINDOW = 256       # Recent latencies the quantile is taken over
+DEFAULT_MIN_SAMPLES = 20   # No hedging until this many latencies are known
+DEFAULT_BUDGET = 0.1       # Hedges allowed per request sent
+DEFAULT_WORKERS = 32
+
+
+class LatencyTracker:
+    """Rolling window of recent request latencies"""
+
+    def __init__(self, window: int = DEFAULT_WINDOW):
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """The q-quantile of the window (nearest rank), or None if empty"""
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+
+class Hedger:
+    """Sends a duplicate request when the first one is slower than usual"""
+
+    def __init__(self, quantile: float = DEFAULT_QUANTILE,
+                 min_samples: int = DEFAULT_MIN_SAMPLES, budget: float = DEFAULT_BUDGET,
+                 min_delay: float = 0.0, max_delay: Optional[float] = None,
+                 workers: int = DEFAULT_WORKERS):
+        """
+        Args:
+            quantile (float): Latency quantile to wait for before hedging
+            min_samples (int): Latencies to observe before hedging at all
+            budget (float): Maximum hedges per request (0.1 = at most 10% extra)
+            min_delay (float): Never hedge sooner than this many seconds
+            max_delay (float): Never wait longer than this before hedging
+            workers (int): Threads sending requests (two per hedged request)
+        """
+        self.quantile = quantile
+        self.min_samples = min_samples
+        self.budget = budget
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.latencies = LatencyTracker()
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=workers,
+                                            thread_name_prefix='globalquran-hedge')
+
+    def delay(self) -> Optional[float]:
+        """Seconds to wait before hedging, or None if hedging is off for now"""
+        if len(self.latencies) < self.min_samples:
+            return None
+        delay = max(self.min_delay, self.latencies.quantile(self.quantile))
+        return delay if self.max_delay is None else min(delay, self.max_delay)
+
+    def _timed(self, send: Callable[[], requests.Response]) -> requests.Response:
+        start = time.monotonic()
+        response = send()
+        self.latencies.record(time.monotonic() - start)
+        return response
+
+    def _take_hedge(self) -> bool:
+        with self._lock:
+            if self.hedges + 1 > self.budget * self.requests:
+                return False
+            self.hedges += 1
+            return True
+
+    def run(self, send: Callable[[], requests.Response]) -> requests.Response:
+        """
+        Call send(), hedging with a second call if the first is slow
+
+        Returns:
+            requests.Response: Whichever call answered first; the other
+                response is closed when it arrives
+
+        Raises:
+            requests.RequestException: If every call sent failed
+        """
+        with self._lock:
+            self.requests += 1
+        delay = self.delay()
+        started = threading.Event()
+
+        def primary() -> requests.Response:
+            started.set()
+            return self._timed(send)
+
+        first = self._executor.submit(primary)
+        if delay is None:
+            return first.result()
+        # Time queued behind other requests in the shared pool is not the
+        # API being slow, so the hedge delay counts from when the call starts
+        started.wait()
+        if wait([first], timeout=delay).done or not self._take_hedge():
+            return first.result()
+
+        second = self._executor.submit(self._timed, send)
+        pending = {first, second}
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is not None:
+                    error = future.exception()
+                    continue
+                if future is second:
+                    with self._lock:
+                        self.hedge_wins += 1
+                for loser in pending:
+                    loser.add_done_callback(_close_response)
+                for other in done - {future}:
+                    _close_response(other)
+                return future.result()
+        raise error
+
+    def stats(self) -> Dict[str, object]:
+        """Requests, hedges sent and hedges that answered first"""
+        with self._lock:
+            return {'requests': self.requests, 'hedges': self.hedges,
+                    'hedge_wins': self.hedge_wins, 'delay': self.delay()}
+
+    def close(self) -> None:
+        """Stop the sending threads"""
+        self._executor.shutdown(wait=False)
+
+
+def _close_response(future: Future) -> None:
+    if future.exception() is None:
+        future.result().close()
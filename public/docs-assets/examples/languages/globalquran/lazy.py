@@ -0,0 +1,273 @@
+# GlobalQuran Python Helpers: Lazy JSON Responses
+# An /all response carries every section (quran, translation, recitor,
+# quranList) for a whole surah, page or juz, and json.loads builds every
+# dict and string in it before the caller reads anything. lazy_json keeps
+# the raw body and hands out LazyObjects instead: read-only mappings that
+# scan their own level of the buffer only as far as a lookup needs, so
+# data['quran']['1']['1'] touches the first record and nothing after it.
+# Objects whose values are all scalars (verse records) are decoded with
+# decoding.loads when first read and then kept; nested objects stay lazy.
+#
+# Scanning is done with regular expressions, which walk bytes more slowly
+# than the C json parser: a caller that reads every verse, or takes len()
+# of every edition, spends two to three times what json.loads would. This is
+# for callers that read part of a response. The body is not validated up
+# front: malformed JSON raises json.JSONDecodeError from whichever lookup
+# reaches it.
+
+import json
+import re
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from .decoding import loads
+
+_WS = rb'[ \t\n\r]*'
+_STRING_SOURCE = rb'"(?:[^"\\]|\\.)*"'
+# An object of scalars whose strings have no escapes (a verse record)
+_FLAT_OBJECT_SOURCE = rb'{[^{}\[\]"\\]*(?:"[^"\\]*"[^{}\[\]"\\]*)*}'
+_SCALAR_SOURCE = rb'[^,}\]\s{\["]+'
+# One member's separator and key, up to its value: (comma, raw key)
+_MEMBER_SOURCE = _WS + rb'(,?)' + _WS + rb'"((?:[^"\\]|\\.)*)"' + _WS + rb':' + _WS
+_SIMPLE_VALUE_SOURCE = rb'(?:' + _FLAT_OBJECT_SOURCE + rb'|' + _STRING_SOURCE + rb'|' + _SCALAR_SOURCE + rb')'
+
+_WHITESPACE = re.compile(_WS)
+_MEMBER = re.compile(_MEMBER_SOURCE, re.DOTALL)
+# A member whose value needs no further scanning, in one match: (comma, raw key, value)
+_SIMPLE_MEMBER = re.compile(_MEMBER_SOURCE + rb'(' + _SIMPLE_VALUE_SOURCE + rb')', re.DOTALL)
+_CLOSE = re.compile(_WS + rb'}')
+_FLAT_OBJECT = re.compile(_FLAT_OBJECT_SOURCE)
+_STRING = re.compile(_STRING_SOURCE, re.DOTALL)
+_SCALAR = re.compile(_SCALAR_SOURCE)
+# Strings are matched whole, so brackets inside them are never seen
+_TOKEN = re.compile(_STRING_SOURCE + rb'|[{}\[\]]', re.DOTALL)
+
+_OPEN_OBJECT, _CLOSE_OBJECT, _OPEN_ARRAY = ord('{'), ord('}'), ord('[')
+_QUOTE = ord('"')
+
+
+def _error(message: str, buffer: bytes, position: int) -> json.JSONDecodeError:
+    return json.JSONDecodeError(message, buffer[:position + 64].decode('utf-8', 'replace'), position)
+
+
+def _leaf_end(buffer: bytes, start: int) -> Optional[int]:
+    """End of the object at start if none of its values is an object or array, else None"""
+    match = _FLAT_OBJECT.match(buffer, start)
+    if match is not None:
+        return match.end()
+    position = start + 1  # Escaped strings: walk the tokens
+    while True:
+        match = _TOKEN.search(buffer, position)
+        if match is None:
+            raise _error("Unterminated object", buffer, start)
+        token = buffer[match.start()]
+        if token == _CLOSE_OBJECT:
+            return match.end()
+        if token != _QUOTE:
+            return None
+        position = match.end()
+
+
+def _container_end(buffer: bytes, start: int) -> int:
+    """End of the object or array at start"""
+    depth = 0
+    position = start
+    while True:
+        match = _TOKEN.search(buffer, position)
+        if match is None:
+            raise _error("Unterminated container", buffer, start)
+        token = buffer[match.start()]
+        if token in (_OPEN_OBJECT, _OPEN_ARRAY):
+            depth += 1
+        elif token != _QUOTE:
+            depth -= 1
+            if depth == 0:
+                return match.end()
+        position = match.end()
+
+
+class LazyObject(Mapping):
+    """A JSON object read from its raw bytes one member at a time"""
+
+    __slots__ = ('_buffer', '_start', '_position', '_end', '_members', '_keys', '_pending')
+
+    def __init__(self, buffer: bytes, start: int = 0):
+        """
+        Args:
+            buffer (bytes): The whole JSON document
+            start (int): Offset of this object's '{'
+        """
+        self._buffer = buffer
+        self._start = start
+        self._position = start + 1   # Just after the last member scanned
+        self._end: Optional[int] = None
+        # key -> LazyObject, (start, end) of an undecoded value, or the value
+        self._members: Dict[str, Any] = {}
+        self._keys: List[str] = []
+        self._pending: Optional[LazyObject] = None  # Last member, possibly unscanned
+
+    def _advance(self) -> Optional[str]:
+        """Scan the next member; its key, or None at the end of the object"""
+        if self._end is not None:
+            return None
+        buffer = self._buffer
+        if self._pending is not None:
+            self._position = self._pending._skip()
+            self._pending = None
+        match = _SIMPLE_MEMBER.match(buffer, self._position)
+        if match is not None:
+            if bool(match.group(1)) != bool(self._keys):
+                raise _error("Expecting ',' delimiter" if self._keys else "Unexpected ','",
+                             buffer, match.start())
+            raw_key = match.group(2)
+            key = loads(b'"' + raw_key + b'"') if b'\\' in raw_key else raw_key.decode('utf-8')
+            value = match.span(3)
+            self._position = value[1]
+            if key not in self._members:
+                self._keys.append(key)
+            self._members[key] = value
+            return key
+
+        match = _MEMBER.match(buffer, self._position)
+        if match is None:
+            close = _CLOSE.match(buffer, self._position)
+            if close is None:
+                raise _error("Expecting property name enclosed in double quotes or '}'",
+                             buffer, self._position)
+            self._end = close.end()
+            return None
+        if bool(match.group(1)) != bool(self._keys):
+            raise _error("Expecting ',' delimiter" if self._keys else "Unexpected ','",
+                         buffer, match.start())
+        raw_key = match.group(2)
+        key = loads(b'"' + raw_key + b'"') if b'\\' in raw_key else raw_key.decode('utf-8')
+        start = match.end()
+        first = buffer[start] if start < len(buffer) else None
+
+        if first == _OPEN_OBJECT:
+            end = _leaf_end(buffer, start)
+            if end is None:
+                value = self._pending = LazyObject(buffer, start)
+            else:
+                value = (start, end)
+        elif first == _OPEN_ARRAY:
+            end = _container_end(buffer, start)
+            value = (start, end)
+        elif first == _QUOTE:
+            match = _STRING.match(buffer, start)
+            if match is None:
+                raise _error("Unterminated string", buffer, start)
+            end = match.end()
+            value = (start, end)
+        else:
+            match = _SCALAR.match(buffer, start)
+            if match is None:
+                raise _error("Expecting value", buffer, start)
+            end = match.end()
+            value = (start, end)
+        if self._pending is None:
+            self._position = end
+        if key not in self._members:
+            self._keys.append(key)
+        self._members[key] = value
+        return key
+
+    def _finish(self) -> int:
+        """Scan to the closing brace; the offset just after it"""
+        while self._advance() is not None:
+            pass
+        return self._end
+
+    def _skip(self) -> int:
+        """
+        Offset just after the closing brace, for a parent moving past this
+        object; when the rest of the members are simple they are stepped
+        over without being indexed, and a later lookup still scans them
+        """
+        if self._end is None and self._pending is None:
+            buffer, position, member = self._buffer, self._position, _SIMPLE_MEMBER.match
+            while True:
+                match = member(buffer, position)
+                if match is None:
+                    break
+                position = match.end()
+            close = _CLOSE.match(buffer, position)
+            if close is not None:
+                return close.end()
+        return self._finish()
+
+    def _value(self, key: str) -> Any:
+        value = self._members[key]
+        if type(value) is tuple:  # Decoded JSON never contains tuples
+            start, end = value
+            value = self._members[key] = loads(self._buffer[start:end])
+        return value
+
+    def _scan_to(self, key: object) -> bool:
+        """Scan until key has been seen; whether the object has it"""
+        if key in self._members:
+            return True
+        while True:
+            scanned = self._advance()
+            if scanned is None:
+                return False
+            if scanned == key:
+                return True
+
+    def __getitem__(self, key: str) -> Any:
+        if not self._scan_to(key):
+            raise KeyError(key)
+        return self._value(key)
+
+    def __contains__(self, key: object) -> bool:
+        return self._scan_to(key)
+
+    def __iter__(self) -> Iterator[str]:
+        index = 0
+        while True:
+            if index < len(self._keys):
+                yield self._keys[index]
+                index += 1
+            elif self._advance() is None:
+                return
+
+    def __bool__(self) -> bool:
+        return bool(self._keys) or self._advance() is not None
+
+    def __len__(self) -> int:
+        self._finish()
+        return len(self._keys)
+
+    def raw(self) -> bytes:
+        """This object's bytes exactly as received"""
+        return self._buffer[self._start:self._finish()]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Decode the whole object into plain dicts and lists"""
+        return loads(self.raw())
+
+    def __repr__(self) -> str:
+        state = f"{len(self._keys)} members" if self._end is not None \
+            else f"{len(self._keys)}+ members scanned"
+        return f"LazyObject({state})"
+
+
+def lazy_json(data: Union[bytes, bytearray, memoryview]) -> Union[LazyObject, Any]:
+    """
+    Wrap a JSON body for on-demand decoding
+
+    Args:
+        data (bytes): The raw JSON document, e.g. response.content
+
+    Returns:
+        LazyObject: If the document is an object; other documents are
+            decoded at once
+
+    Raises:
+        json.JSONDecodeError: If the document is empty or not JSON
+    """
+    buffer = bytes(data)
+    start = _WHITESPACE.match(buffer).end()
+    if start < len(buffer) and buffer[start] == _OPEN_OBJECT:
+        return LazyObject(buffer, start)
+    return loads(buffer)
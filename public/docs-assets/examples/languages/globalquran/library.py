@@ -0,0 +1,205 @@
+# GlobalQuran Python Helpers: Local Edition Library
+# Serves ayah, page, juz, surah (and hizb, rub, manzil, ruku) lookups from
+# editions held locally instead of the API, slicing them with the boundary
+# tables in metadata.py. Editions live in memory-mapped files, one per Quran
+# ID (<directory>/<quranId>.gqb, see bundle.py), in a combined mirror bundle,
+# or in memory, e.g. a VerseStore built from fetch_complete_quran.
+# Verse text stays in the OS page cache, shared by every worker process that
+# maps the same file; only the verses a lookup returns are ever decoded.
+# A library saving with a compression codec trades that sharing for a
+# several times smaller file, decompressed into memory on first use.
+# A file that cannot be read (truncated by a crash mid-copy, say) is dropped
+# with a warning and the edition counts as not held, so callers fall back to
+# the API.
+
+import os
+import threading
+import warnings
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from .bundle import BundleError, QuranBundle, write_bundle
+from .metadata import TOTAL_AYAHS, global_ayah_index, unit_range
+from .store import VerseStore
+
+EDITION_SUFFIX = '.gqb'
+
+
+class EditionLibrary:
+    """Locally held editions, looked up by Quran ID"""
+
+    def __init__(self, directory: Optional[str] = None, bundles: Iterable[QuranBundle] = (),
+                 compression: Optional[str] = None):
+        """
+        Args:
+            directory (str): Folder of per-edition files, mapped on first use
+            bundles (iterable): Open QuranBundles to serve editions from as well
+            compression (str): Codec save() writes edition files with, e.g.
+                'zstd' (default: uncompressed, so files are memory-mapped);
+                files of either kind are read regardless
+        """
+        self.directory = directory
+        self.compression = compression
+        self._bundles: List[QuranBundle] = list(bundles)
+        self._opened: Dict[str, QuranBundle] = {}
+        self._stores: Dict[str, VerseStore] = {}
+        self._unreadable: Set[str] = set()  # Quran IDs whose file failed to load
+        self._lock = threading.Lock()
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def _path(self, quran_id: str) -> str:
+        return os.path.join(self.directory, f"{quran_id}{EDITION_SUFFIX}")
+
+    def edition(self, quran_id: str) -> Optional[VerseStore]:
+        """
+        The edition's VerseStore, mapping its file on first use
+
+        Returns:
+            VerseStore: The edition, or None if it is not held locally or its
+                file cannot be read
+        """
+        store = self._stores.get(quran_id)
+        if store is not None:
+            return store
+        with self._lock:
+            store = self._stores.get(quran_id)
+            if store is not None or quran_id in self._unreadable:
+                return store
+            try:
+                store = self._load(quran_id)
+            except (BundleError, OSError) as e:
+                self._unreadable.add(quran_id)
+                bundle = self._opened.pop(quran_id, None)
+                if bundle is not None:
+                    bundle.close()
+                warnings.warn(f"Edition {quran_id} could not be read locally, "
+                              f"using the API instead: {e}", RuntimeWarning, stacklevel=2)
+                return None
+            if store is not None:
+                self._stores[quran_id] = store
+            return store
+
+    def _load(self, quran_id: str) -> Optional[VerseStore]:
+        # Caller holds the lock
+        for bundle in self._bundles:
+            if quran_id in bundle:
+                return bundle.edition(quran_id)
+        if not self.directory or '/' in quran_id or not os.path.exists(self._path(quran_id)):
+            return None
+        bundle = QuranBundle(self._path(quran_id))
+        self._opened[quran_id] = bundle
+        return bundle.edition(quran_id)
+
+    def __contains__(self, quran_id: str) -> bool:
+        return self.edition(quran_id) is not None
+
+    def add(self, store: VerseStore) -> None:
+        """Serve an in-memory edition (e.g. from fetch_verse_store) as well"""
+        with self._lock:
+            self._stores[store.quran_id] = store
+            self._unreadable.discard(store.quran_id)
+
+    def save(self, store: VerseStore, info: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Write a complete edition to its own file in the library directory
+
+        Returns:
+            str: Path of the written file
+        """
+        if not self.directory:
+            raise ValueError("EditionLibrary has no directory to save to")
+        path = self._path(store.quran_id)
+        write_bundle(path, [store], {store.quran_id: info or {}}, compression=self.compression)
+        with self._lock:
+            self._stores.pop(store.quran_id, None)
+            self._unreadable.discard(store.quran_id)  # Replaced by the file just written
+            previous = self._opened.pop(store.quran_id, None)
+        if previous is not None:
+            previous.close()
+        return path
+
+    def response(self, quran_id: str, indices: range) -> Optional[Dict[str, Any]]:
+        """
+        Build an API-shaped response for a range of global ayah indices
+
+        Args:
+            quran_id (str): Quran ID, or several separated by commas
+            indices (range): 0-based global ayah indices
+
+        Returns:
+            dict: {"quran": {quranId: {verseNo: verse}}}, or None if any
+                edition is not held locally
+        """
+        stores = []
+        for edition_id in quran_id.replace('|', ',').split(','):
+            store = self.edition(edition_id)
+            if store is None or indices.start not in store or indices.stop - 1 not in store:
+                return None
+            stores.append(store)
+        return {'quran': {store.quran_id: {str(index + 1): store.verse(index) for index in indices}
+                          for store in stores}}
+
+    def ayah(self, ayah_reference: str, quran_id: str = 'quran-simple') -> Optional[Dict[str, Any]]:
+        """Local /v1/ayah/{surah:ayah}/{quranId} response, or None"""
+        try:
+            surah, ayah = (int(part) for part in ayah_reference.split(':'))
+            index = global_ayah_index(surah, ayah)
+        except ValueError:
+            return None
+        return self.response(quran_id, range(index, index + 1))
+
+    def unit(self, unit: str, number: int, quran_id: str = 'quran-simple') -> Optional[Dict[str, Any]]:
+        """
+        Local response for one unit, e.g. unit('hizb', 3)
+
+        Args:
+            unit (str): Any key of metadata.UNIT_STARTS
+            number (int): 1-based unit number
+            quran_id (str): Quran ID, or several separated by commas
+
+        Returns:
+            dict: {"quran": {quranId: {verseNo: verse}}}, or None if the unit
+                does not exist or is not held locally
+        """
+        try:
+            return self.response(quran_id, unit_range(unit, int(number)))
+        except ValueError:
+            return None
+
+    def page(self, page_number: int, quran_id: str = 'quran-simple') -> Optional[Dict[str, Any]]:
+        """Local /v1/page/{page}/{quranId} response, or None"""
+        return self.unit('page', page_number, quran_id)
+
+    def juz(self, juz_number: int, quran_id: str = 'quran-simple') -> Optional[Dict[str, Any]]:
+        """Local /v1/juz/{juz}/{quranId} response, or None"""
+        return self.unit('juz', juz_number, quran_id)
+
+    def surah(self, surah_number: int, quran_id: str = 'quran-simple') -> Optional[Dict[str, Any]]:
+        """Local /v1/surah/{surah}/{quranId} response, or None"""
+        return self.unit('surah', surah_number, quran_id)
+
+    def complete(self, quran_id: str = 'quran-simple') -> Optional[Dict[str, Any]]:
+        """Local /v1/quran/{quranId} response, or None unless the whole edition is held"""
+        return self.response(quran_id, range(TOTAL_AYAHS))
+
+    def verse_bytes(self, quran_id: str, indices: Iterable[int]) -> Optional[List[memoryview]]:
+        """Zero-copy UTF-8 slices of verse text, or None if the edition is not held"""
+        store = self.edition(quran_id)
+        if store is None:
+            return None
+        return [store.text_bytes(index) for index in indices]
+
+    def close(self) -> None:
+        """Unmap every file this library opened (bundles passed in stay open)"""
+        with self._lock:
+            self._stores.clear()
+            self._unreadable.clear()
+            opened, self._opened = list(self._opened.values()), {}
+        for bundle in opened:
+            bundle.close()
+
+    def __enter__(self) -> 'EditionLibrary':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,138 @@
+# GlobalQuran Python Helpers: In-Memory Catalog Cache
+# The translation, recitor and Quran lists change rarely but are requested on
+# every page render to populate pickers. Results are memoized per process with
+# time-based expiry, and concurrent callers for the same key wait on a single
+# in-flight fetch instead of each hitting the API.
+
+import functools
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+DEFAULT_CATALOG_TTL = 3600  # seconds
+DEFAULT_CATALOG_MAXSIZE = 128
+
+
+class _Flight:
+    """A fetch in progress that other callers can wait on"""
+
+    __slots__ = ('event', 'value', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class TTLCache:
+    """A thread-safe LRU memo with per-entry expiry and single-flight loading"""
+
+    def __init__(self, ttl: float = DEFAULT_CATALOG_TTL, maxsize: int = DEFAULT_CATALOG_MAXSIZE):
+        """
+        Args:
+            ttl (float): Seconds a loaded value stays valid
+            maxsize (int): Maximum number of keys kept (least recently used go first)
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.waits = 0
+        self._data: 'OrderedDict[Hashable, Tuple[float, Any]]' = OrderedDict()
+        self._inflight: Dict[Hashable, _Flight] = {}
+        self._lock = threading.Lock()
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for key, calling loader at most once per expiry
+
+        A loader result of None (the fetchers' error value) is handed to the
+        callers waiting on that fetch but is not cached. Exceptions raised by
+        the loader propagate to every waiting caller.
+        """
+        with self._lock:
+            cached = self._data.get(key)
+            if cached is not None and cached[0] > time.monotonic():
+                self._data.move_to_end(key)
+                self.hits += 1
+                return cached[1]
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = _Flight()
+                self.misses += 1
+            else:
+                self.waits += 1
+
+        if not leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            flight.value = loader()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+                if flight.error is None and flight.value is not None:
+                    self._data[key] = (time.monotonic() + self.ttl, flight.value)
+                    self._data.move_to_end(key)
+                    while len(self._data) > self.maxsize:
+                        self._data.popitem(last=False)
+            flight.event.set()
+        return flight.value
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Drop one key, or every key when none is given"""
+        with self._lock:
+            if key is None:
+                self._data.clear()
+            else:
+                self._data.pop(key, None)
+
+    def stats(self) -> Dict[str, int]:
+        """Hits, misses (loads), waits (callers that joined an in-flight load) and size"""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses,
+                    'waits': self.waits, 'entries': len(self._data)}
+
+
+# One process-level cache shared by every v1 and v2 list fetcher
+catalog_cache = TTLCache()
+
+
+def memoize_catalog(func: Callable) -> Callable:
+    """
+    Decorator memoizing a catalog fetcher in the shared catalog_cache
+
+    The key is the function plus its arguments with defaults applied, so
+    fetch_v2_list() and fetch_v2_list('translation') share an entry. The
+    cached response object is shared between callers, so treat it as read-only.
+    """
+    signature = inspect.signature(func)
+    parameters = list(signature.parameters.values())
+    defaults = tuple(parameter.default for parameter in parameters)
+    positional = all(parameter.kind in (inspect.Parameter.POSITIONAL_ONLY,
+                                        inspect.Parameter.POSITIONAL_OR_KEYWORD)
+                     for parameter in parameters)
+    name = (func.__module__, func.__qualname__)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if positional and not kwargs and len(args) <= len(defaults):
+            # Fast path: pad positional arguments with the defaults
+            key = (name, args + defaults[len(args):])
+        else:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = (name, tuple(bound.arguments.values()))
+        return catalog_cache.get_or_load(key, lambda: func(*args, **kwargs))
+
+    wrapper.cache = catalog_cache
+    return wrapper
@@ -0,0 +1,298 @@
+# GlobalQuran Python Helpers: Quran Metadata
+# Fixed facts about the Quran's structure (Hafs, Madani mushaf numbering)
+# shared by the helper modules.
+
+from bisect import bisect_right
+from typing import Dict, List, Tuple
+
+TOTAL_SURAHS = 114
+TOTAL_AYAHS = 6236
+TOTAL_PAGES = 604
+TOTAL_JUZ = 30
+TOTAL_HIZB = 60
+TOTAL_RUB = 240
+TOTAL_MANZIL = 7
+TOTAL_RUKU = 556
+
+# Number of ayahs in each surah, index 0 is Surah 1 (Al-Fatiha)
+SURAH_AYAH_COUNTS: Tuple[int, ...] = (
+    7, 286, 200, 176, 120, 165, 206, 75, 129, 109, 123, 111, 43, 52, 99, 128,
+    111, 110, 98, 135, 112, 78, 118, 64, 77, 227, 93, 88, 69, 60, 34, 30, 73,
+    54, 45, 83, 182, 88, 75, 85, 54, 53, 89, 59, 37, 35, 38, 29, 18, 45, 60,
+    49, 62, 55, 78, 96, 29, 22, 24, 13, 14, 11, 11, 18, 12, 12, 30, 52, 52, 44,
+    28, 28, 20, 56, 40, 31, 50, 40, 46, 42, 29, 19, 36, 25, 22, 17, 19, 26, 30,
+    20, 15, 21, 11, 8, 8, 19, 5, 8, 8, 11, 11, 8, 3, 9, 5, 4, 7, 3, 6, 3, 5, 4,
+    5, 6
+)
+
+
+def _surah_offsets() -> List[int]:
+    offsets = [0]
+    for count in SURAH_AYAH_COUNTS:
+        offsets.append(offsets[-1] + count)
+    return offsets
+
+
+# SURAH_OFFSETS[s - 1] is the 0-based global index of ayah s:1;
+# SURAH_OFFSETS[114] == TOTAL_AYAHS
+SURAH_OFFSETS: Tuple[int, ...] = tuple(_surah_offsets())
+
+
+def global_ayah_index(surah: int, ayah: int) -> int:
+    """
+    Convert a surah:ayah reference to a 0-based global ayah index
+
+    Args:
+        surah (int): Surah number (1-114)
+        ayah (int): Ayah number within the surah
+
+    Returns:
+        int: Global index (0-6235)
+
+    Raises:
+        ValueError: If the reference does not exist
+    """
+    if not 1 <= surah <= TOTAL_SURAHS or not 1 <= ayah <= SURAH_AYAH_COUNTS[surah - 1]:
+        raise ValueError(f"Invalid ayah reference {surah}:{ayah}")
+    return SURAH_OFFSETS[surah - 1] + ayah - 1
+
+
+def ayah_reference(index: int) -> Tuple[int, int]:
+    """
+    Convert a 0-based global ayah index back to (surah, ayah)
+
+    Raises:
+        ValueError: If the index is out of range
+    """
+    if not 0 <= index < TOTAL_AYAHS:
+        raise ValueError(f"Invalid global ayah index {index}")
+    surah = bisect_right(SURAH_OFFSETS, index)
+    return surah, index - SURAH_OFFSETS[surah - 1] + 1
+
+
+# 0-based global index of the first ayah of each page (Madani mushaf);
+# PAGE_STARTS[p - 1] starts page p
+PAGE_STARTS: Tuple[int, ...] = (
+    0, 7, 12, 23, 31, 36, 44, 55, 64, 68, 76, 83, 90, 95, 100, 108, 112,
+    119, 126, 133, 141, 148, 152, 160, 170, 176, 183, 188, 193, 197, 203,
+    209, 217, 222, 226, 231, 237, 240, 244, 252, 255, 259, 263, 266, 271,
+    276, 281, 288, 289, 293, 302, 308, 315, 322, 330, 338, 345, 354, 363,
+    370, 376, 384, 393, 401, 408, 414, 425, 433, 441, 446, 450, 458, 466,
+    473, 479, 487, 493, 499, 504, 507, 512, 516, 519, 526, 530, 537, 544,
+    552, 558, 567, 572, 579, 584, 587, 594, 598, 606, 614, 620, 627, 633,
+    640, 647, 655, 663, 668, 671, 674, 678, 682, 686, 692, 700, 705, 710,
+    714, 719, 726, 733, 739, 745, 751, 758, 764, 772, 777, 782, 789, 797,
+    807, 816, 824, 833, 841, 848, 857, 862, 870, 879, 883, 890, 899, 907,
+    913, 920, 926, 931, 935, 940, 946, 954, 965, 976, 984, 991, 997, 1005,
+    1011, 1021, 1027, 1035, 1041, 1049, 1058, 1074, 1084, 1091, 1097, 1103,
+    1109, 1113, 1117, 1124, 1132, 1141, 1149, 1160, 1168, 1176, 1185, 1193,
+    1200, 1205, 1212, 1221, 1229, 1235, 1241, 1248, 1255, 1261, 1266, 1271,
+    1275, 1282, 1289, 1296, 1303, 1307, 1314, 1321, 1328, 1334, 1341, 1346,
+    1352, 1357, 1364, 1370, 1378, 1384, 1389, 1397, 1406, 1417, 1425, 1434,
+    1442, 1452, 1461, 1470, 1478, 1485, 1492, 1501, 1510, 1518, 1526, 1535,
+    1544, 1554, 1561, 1570, 1581, 1590, 1600, 1610, 1618, 1626, 1633, 1639,
+    1648, 1659, 1665, 1674, 1682, 1691, 1699, 1707, 1712, 1720, 1725, 1735,
+    1741, 1749, 1755, 1760, 1768, 1774, 1783, 1792, 1802, 1817, 1833, 1853,
+    1872, 1892, 1907, 1915, 1927, 1935, 1943, 1955, 1965, 1973, 1980, 1988,
+    1994, 2003, 2011, 2019, 2029, 2036, 2046, 2056, 2067, 2078, 2087, 2095,
+    2104, 2115, 2125, 2133, 2144, 2155, 2160, 2167, 2174, 2185, 2193, 2201,
+    2214, 2223, 2237, 2250, 2261, 2275, 2288, 2301, 2314, 2326, 2345, 2360,
+    2385, 2399, 2412, 2424, 2435, 2446, 2461, 2473, 2483, 2493, 2507, 2518,
+    2527, 2540, 2555, 2564, 2573, 2584, 2595, 2600, 2610, 2618, 2625, 2633,
+    2641, 2650, 2659, 2667, 2673, 2690, 2700, 2715, 2732, 2747, 2762, 2777,
+    2791, 2801, 2811, 2818, 2822, 2827, 2834, 2844, 2849, 2852, 2857, 2866,
+    2875, 2887, 2898, 2910, 2922, 2932, 2951, 2971, 2992, 3015, 3043, 3068,
+    3091, 3115, 3138, 3159, 3172, 3181, 3194, 3203, 3214, 3222, 3235, 3247,
+    3257, 3265, 3273, 3280, 3287, 3295, 3302, 3311, 3322, 3329, 3336, 3346,
+    3354, 3363, 3370, 3378, 3385, 3392, 3403, 3414, 3424, 3433, 3441, 3450,
+    3459, 3469, 3480, 3488, 3497, 3503, 3514, 3523, 3533, 3539, 3548, 3555,
+    3563, 3568, 3576, 3583, 3587, 3595, 3606, 3613, 3620, 3628, 3637, 3645,
+    3654, 3663, 3671, 3678, 3690, 3698, 3704, 3717, 3732, 3745, 3759, 3775,
+    3788, 3812, 3839, 3864, 3890, 3914, 3941, 3970, 3986, 3996, 4012, 4031,
+    4053, 4063, 4068, 4079, 4089, 4098, 4105, 4114, 4125, 4132, 4140, 4149,
+    4158, 4166, 4173, 4182, 4191, 4199, 4210, 4218, 4229, 4238, 4247, 4256,
+    4264, 4272, 4282, 4287, 4294, 4303, 4316, 4323, 4335, 4347, 4358, 4372,
+    4385, 4398, 4414, 4432, 4453, 4473, 4486, 4495, 4505, 4515, 4524, 4530,
+    4538, 4545, 4556, 4564, 4574, 4583, 4592, 4598, 4606, 4611, 4616, 4623,
+    4630, 4645, 4665, 4681, 4705, 4726, 4749, 4766, 4784, 4810, 4828, 4852,
+    4873, 4895, 4917, 4941, 4968, 4995, 5029, 5055, 5078, 5086, 5093, 5099,
+    5104, 5110, 5115, 5125, 5129, 5135, 5142, 5150, 5155, 5161, 5168, 5177,
+    5185, 5192, 5199, 5208, 5217, 5222, 5229, 5236, 5241, 5253, 5267, 5286,
+    5313, 5331, 5357, 5385, 5414, 5429, 5447, 5460, 5475, 5494, 5512, 5542,
+    5570, 5596, 5616, 5641, 5672, 5702, 5727, 5758, 5800, 5829, 5854, 5882,
+    5909, 5931, 5963, 5993, 6016, 6043, 6072, 6098, 6125, 6137, 6155, 6176,
+    6193, 6207, 6221
+)
+
+# 0-based global index of the first ayah of each juz
+JUZ_STARTS: Tuple[int, ...] = (
+    0, 148, 259, 385, 516, 640, 750, 899, 1041, 1200, 1327, 1478, 1648,
+    1802, 2029, 2214, 2483, 2673, 2875, 3214, 3385, 3563, 3732, 4089, 4264,
+    4510, 4705, 5104, 5241, 5672
+)
+
+# 0-based global index of the first ayah of each hizb (half a juz)
+HIZB_STARTS: Tuple[int, ...] = (
+    0, 81, 148, 209, 259, 307, 385, 463, 516, 580, 640, 695, 750, 824, 899,
+    954, 1041, 1124, 1200, 1268, 1327, 1389, 1478, 1556, 1648, 1725, 1802,
+    1951, 2029, 2127, 2214, 2348, 2483, 2595, 2673, 2811, 2875, 3042, 3214,
+    3302, 3385, 3490, 3563, 3629, 3732, 3932, 4089, 4173, 4264, 4348, 4510,
+    4600, 4705, 4901, 5104, 5177, 5241, 5447, 5672, 5948
+)
+
+# 0-based global index of the first ayah of each rub' al-hizb (quarter hizb)
+RUB_STARTS: Tuple[int, ...] = (
+    0, 32, 50, 66, 81, 98, 112, 130, 148, 164, 183, 195, 209, 225, 239, 249,
+    259, 269, 278, 289, 307, 325, 344, 367, 385, 405, 425, 445, 463, 478,
+    493, 504, 516, 528, 550, 566, 580, 592, 606, 627, 640, 655, 669, 680,
+    695, 709, 719, 735, 750, 765, 777, 801, 824, 847, 862, 883, 899, 915,
+    929, 939, 954, 984, 1000, 1018, 1041, 1070, 1095, 1109, 1124, 1142,
+    1160, 1181, 1200, 1220, 1235, 1253, 1268, 1280, 1294, 1309, 1327, 1345,
+    1356, 1374, 1389, 1416, 1434, 1453, 1478, 1496, 1513, 1533, 1556, 1580,
+    1602, 1625, 1648, 1672, 1696, 1711, 1725, 1741, 1759, 1777, 1802, 1851,
+    1901, 1930, 1951, 1975, 1990, 2011, 2029, 2051, 2078, 2098, 2127, 2156,
+    2171, 2190, 2214, 2238, 2271, 2308, 2348, 2402, 2430, 2458, 2483, 2511,
+    2533, 2565, 2595, 2613, 2632, 2654, 2673, 2708, 2747, 2791, 2811, 2825,
+    2843, 2855, 2875, 2907, 2932, 2983, 3042, 3112, 3159, 3185, 3214, 3240,
+    3263, 3280, 3302, 3327, 3340, 3365, 3385, 3409, 3439, 3462, 3490, 3513,
+    3533, 3550, 3563, 3583, 3592, 3615, 3629, 3651, 3674, 3700, 3732, 3764,
+    3809, 3870, 3932, 3990, 4021, 4065, 4089, 4110, 4133, 4153, 4173, 4198,
+    4226, 4242, 4264, 4284, 4298, 4322, 4348, 4381, 4430, 4484, 4510, 4530,
+    4554, 4577, 4600, 4612, 4625, 4656, 4705, 4758, 4809, 4854, 4901, 4979,
+    5053, 5090, 5104, 5117, 5136, 5156, 5177, 5191, 5217, 5229, 5241, 5271,
+    5323, 5393, 5447, 5494, 5551, 5609, 5672, 5758, 5829, 5884, 5948, 6023,
+    6090, 6154
+)
+
+# 0-based global index of the first ayah of each manzil (seven-day reading)
+MANZIL_STARTS: Tuple[int, ...] = (
+    0, 669, 1364, 2029, 2932, 3788, 4630
+)
+
+# 0-based global index of the first ayah of each ruku (numbered across the
+# whole Quran, not per surah)
+RUKU_STARTS: Tuple[int, ...] = (
+    0, 7, 14, 27, 36, 46, 53, 66, 68, 78, 89, 93, 103, 110, 119, 128, 136,
+    148, 154, 159, 170, 174, 183, 189, 195, 203, 217, 223, 228, 235, 238,
+    242, 249, 255, 260, 264, 267, 273, 280, 288, 290, 293, 302, 313, 323,
+    334, 347, 356, 364, 373, 384, 394, 402, 413, 422, 436, 441, 448, 464,
+    473, 482, 493, 503, 507, 515, 518, 526, 535, 543, 552, 563, 569, 580,
+    584, 589, 593, 597, 605, 608, 619, 627, 634, 645, 655, 664, 669, 674,
+    680, 688, 695, 703, 712, 719, 725, 735, 746, 755, 762, 769, 777, 784,
+    789, 799, 809, 819, 830, 839, 844, 849, 859, 871, 879, 883, 889, 899,
+    910, 918, 929, 933, 939, 943, 954, 964, 979, 985, 993, 1001, 1007, 1012,
+    1018, 1026, 1038, 1047, 1053, 1062, 1080, 1083, 1095, 1101, 1105, 1111,
+    1116, 1125, 1135, 1142, 1160, 1170, 1179, 1188, 1197, 1204, 1208, 1218,
+    1224, 1229, 1235, 1241, 1251, 1259, 1264, 1272, 1277, 1294, 1301, 1307,
+    1315, 1324, 1334, 1345, 1353, 1357, 1364, 1374, 1384, 1394, 1404, 1417,
+    1424, 1434, 1446, 1456, 1467, 1473, 1481, 1497, 1508, 1522, 1533, 1541,
+    1556, 1568, 1582, 1596, 1602, 1616, 1625, 1631, 1638, 1645, 1653, 1664,
+    1675, 1689, 1700, 1707, 1714, 1725, 1733, 1738, 1744, 1750, 1756, 1762,
+    1771, 1777, 1784, 1791, 1802, 1817, 1827, 1846, 1862, 1881, 1901, 1910,
+    1922, 1926, 1935, 1941, 1951, 1961, 1966, 1971, 1977, 1984, 1990, 2001,
+    2011, 2020, 2029, 2039, 2051, 2059, 2069, 2081, 2089, 2099, 2106, 2113,
+    2122, 2129, 2140, 2152, 2157, 2162, 2171, 2184, 2189, 2193, 2199, 2210,
+    2222, 2241, 2250, 2265, 2290, 2300, 2315, 2332, 2348, 2372, 2402, 2424,
+    2437, 2452, 2463, 2476, 2483, 2493, 2512, 2524, 2533, 2558, 2576, 2595,
+    2605, 2617, 2620, 2628, 2633, 2643, 2652, 2659, 2667, 2673, 2695, 2705,
+    2723, 2750, 2765, 2791, 2801, 2811, 2817, 2825, 2831, 2841, 2848, 2852,
+    2855, 2864, 2875, 2889, 2899, 2915, 2932, 2941, 2965, 2984, 3001, 3036,
+    3054, 3072, 3091, 3107, 3123, 3159, 3173, 3190, 3203, 3217, 3225, 3241,
+    3252, 3265, 3273, 3280, 3294, 3302, 3312, 3327, 3340, 3353, 3362, 3370,
+    3384, 3391, 3403, 3409, 3419, 3428, 3436, 3449, 3462, 3469, 3480, 3488,
+    3503, 3514, 3525, 3533, 3541, 3553, 3560, 3567, 3573, 3585, 3591, 3601,
+    3606, 3615, 3627, 3636, 3642, 3651, 3660, 3667, 3674, 3686, 3697, 3705,
+    3717, 3737, 3755, 3772, 3788, 3809, 3862, 3901, 3926, 3970, 3984, 3996,
+    4010, 4034, 4058, 4067, 4079, 4089, 4099, 4110, 4121, 4128, 4133, 4142,
+    4153, 4160, 4170, 4183, 4193, 4201, 4211, 4218, 4226, 4236, 4243, 4250,
+    4262, 4272, 4281, 4291, 4301, 4315, 4325, 4340, 4350, 4360, 4370, 4381,
+    4392, 4414, 4443, 4456, 4473, 4484, 4494, 4499, 4510, 4520, 4530, 4536,
+    4545, 4556, 4564, 4573, 4583, 4593, 4600, 4609, 4612, 4622, 4630, 4645,
+    4659, 4675, 4698, 4721, 4735, 4763, 4784, 4809, 4816, 4846, 4868, 4886,
+    4901, 4926, 4946, 4979, 5017, 5053, 5075, 5085, 5094, 5100, 5104, 5110,
+    5117, 5126, 5136, 5143, 5150, 5156, 5163, 5172, 5177, 5185, 5188, 5196,
+    5199, 5209, 5217, 5224, 5229, 5236, 5241, 5255, 5271, 5304, 5323, 5360,
+    5375, 5410, 5419, 5439, 5447, 5466, 5475, 5494, 5495, 5526, 5551, 5581,
+    5591, 5613, 5622, 5662, 5672, 5702, 5712, 5738, 5758, 5800, 5829, 5848,
+    5884, 5909, 5931, 5948, 5967, 5993, 6023, 6043, 6058, 6079, 6090, 6098,
+    6106, 6125, 6130, 6138, 6146, 6157, 6168, 6176, 6179, 6188, 6193, 6197,
+    6204, 6207, 6213, 6216, 6221, 6225, 6230
+)
+
+# Unit name -> global index where each unit starts. Every unit is a
+# contiguous ayah range, so unit n covers starts[n - 1] up to starts[n]
+# (or the end of the Quran).
+UNIT_STARTS: Dict[str, Tuple[int, ...]] = {
+    'surah': SURAH_OFFSETS[:-1],
+    'juz': JUZ_STARTS,
+    'hizb': HIZB_STARTS,
+    'rub': RUB_STARTS,
+    'manzil': MANZIL_STARTS,
+    'ruku': RUKU_STARTS,
+    'page': PAGE_STARTS,
+}
+
+
+def _unit_range(starts: Tuple[int, ...], number: int, name: str) -> range:
+    if not 1 <= number <= len(starts):
+        raise ValueError(f"Invalid {name} number {number}")
+    end = starts[number] if number < len(starts) else TOTAL_AYAHS
+    return range(starts[number - 1], end)
+
+
+def unit_range(unit: str, number: int) -> range:
+    """
+    Global ayah indices in one unit, e.g. unit_range('hizb', 3)
+
+    Args:
+        unit (str): Any key of UNIT_STARTS
+        number (int): 1-based unit number
+
+    Raises:
+        ValueError: If the unit kind or number does not exist
+    """
+    if unit not in UNIT_STARTS:
+        raise ValueError(f"Unknown unit {unit!r}")
+    return _unit_range(UNIT_STARTS[unit], number, unit)
+
+
+def page_range(page: int) -> range:
+    """
+    Global ayah indices on a mushaf page
+
+    Raises:
+        ValueError: If the page does not exist
+    """
+    return _unit_range(PAGE_STARTS, page, 'page')
+
+
+def juz_range(juz: int) -> range:
+    """
+    Global ayah indices in a juz
+
+    Raises:
+        ValueError: If the juz does not exist
+    """
+    return _unit_range(JUZ_STARTS, juz, 'juz')
+
+
+def page_of(index: int) -> int:
+    """Page number (1-604) of a 0-based global ayah index"""
+    return bisect_right(PAGE_STARTS, index)
+
+
+def juz_of(index: int) -> int:
+    """Juz number (1-30) of a 0-based global ayah index"""
+    return bisect_right(JUZ_STARTS, index)
+
+
+def unit_of(unit: str, index: int) -> int:
+    """
+    Number of the unit containing a 0-based global ayah index
+
+    Raises:
+        ValueError: If the unit kind does not exist
+    """
+    if unit not in UNIT_STARTS:
+        raise ValueError(f"Unknown unit {unit!r}")
+    return bisect_right(UNIT_STARTS[unit], index)
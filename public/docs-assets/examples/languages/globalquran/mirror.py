@@ -0,0 +1,133 @@
+# GlobalQuran Python Helpers: Offline Mirror Builder
+# Downloads every text edition listed by /v1/quran, checks each one is
+# complete, and writes them all into one bundle file (see bundle.py) that the
+# fetchers can serve from without touching the network. Meant for deployments
+# far from the API, where each round trip costs hundreds of milliseconds.
+#
+# Usage: python -m globalquran.mirror quran.gqb [--ids quran-simple,en.sahih]
+
+import argparse
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+import requests
+
+from .bundle import BundleError, check_complete, write_bundle
+from .client import QuranClient, configure_client, get_client
+from .store import VerseStore
+
+DEFAULT_CONCURRENCY = 8
+
+
+def build_mirror(path: str, quran_ids: Optional[Iterable[str]] = None,
+                 fetch_list: Optional[Callable[[], Optional[Dict]]] = None,
+                 fetch_edition: Optional[Callable[[str], Optional[Dict]]] = None,
+                 client: Optional[QuranClient] = None, concurrency: int = DEFAULT_CONCURRENCY,
+                 version: Optional[str] = None, allow_partial: bool = False,
+                 lists: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """
+    Snapshot text editions into a bundle file
+
+    Args:
+        path (str): Bundle file to write
+        quran_ids (iterable): Editions to mirror (default: every text edition
+            in the Quran list)
+        fetch_list (callable): Returns the /v1/quran response, e.g.
+            fetch_quran_list (default: the client's GET /v1/quran)
+        fetch_edition (callable): Quran ID -> /v1/quran/{quranId} response, e.g.
+            CompleteQuranFetcher.fetch_complete_quran (default: the client's GET)
+        client (QuranClient): Client for the default fetchers (default: shared client)
+        concurrency (int): Editions downloaded in parallel
+        version (str): Bundle version label (default: today's UTC date)
+        allow_partial (bool): Write the editions that succeeded even if some failed
+        lists (dict): List responses to store whole as well, name -> API path,
+            e.g. {'translation': '/v1/list/translation'}; when given, the
+            Quran list is stored too, as 'quran' (see snapshot.py)
+
+    Returns:
+        dict: path, version, editions written, failures (Quran ID -> reason), bytes
+
+    Raises:
+        BundleError: If an edition failed and allow_partial is False, or the
+            Quran list could not be fetched
+        requests.RequestException: If one of lists could not be fetched
+    """
+    client = client or get_client()
+
+    def get_list() -> Optional[Dict]:
+        return client.get_json('/v1/quran')
+
+    def get_edition(quran_id: str) -> Optional[Dict]:
+        return client.get_json(f'/v1/quran/{quran_id}', timeout=60)
+
+    fetch_list = fetch_list or get_list
+    fetch_edition = fetch_edition or get_edition
+
+    listing = fetch_list()
+    if not listing or 'quranList' not in listing:
+        raise BundleError("Could not fetch the Quran list")
+    catalog = listing['quranList']
+    if quran_ids is None:
+        quran_ids = [quran_id for quran_id, info in catalog.items() if info.get('format') == 'text']
+    quran_ids = list(quran_ids)
+    stored_lists = None
+    if lists is not None:
+        stored_lists = {'quran': listing}
+        stored_lists.update((name, client.get_json(list_path)) for name, list_path in lists.items())
+
+    def load(quran_id: str) -> Tuple[str, Optional[VerseStore], Optional[str]]:
+        try:
+            data = fetch_edition(quran_id)
+            store = VerseStore.from_response(data, quran_id) if data else None
+            if store is None:
+                return quran_id, None, "no data returned"
+            check_complete(store)
+            return quran_id, store, None
+        except (requests.exceptions.RequestException, ValueError) as e:
+            return quran_id, None, str(e)
+
+    stores, failures = [], {}
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for quran_id, store, error in pool.map(load, quran_ids):
+            if error is None:
+                stores.append(store)
+            else:
+                failures[quran_id] = error
+
+    if failures and not allow_partial:
+        raise BundleError("Editions failed: " + ", ".join(
+            f"{quran_id} ({reason})" for quran_id, reason in failures.items()))
+    header = write_bundle(path, stores, catalog, version=version, source=client.base_url,
+                          lists=stored_lists)
+    return {'path': path, 'version': header['version'],
+            'editions': [store.quran_id for store in stores],
+            'failures': failures, 'bytes': os.path.getsize(path)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Mirror GlobalQuran text editions into a bundle file")
+    parser.add_argument('path', help="Bundle file to write, e.g. quran.gqb")
+    parser.add_argument('--ids', help="Comma-separated Quran IDs (default: every text edition)")
+    parser.add_argument('--api-key', help="API key (default: the shared client's key)")
+    parser.add_argument('--base-url', help="API base URL (default: the public API)")
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument('--version', help="Bundle version label (default: today's date)")
+    parser.add_argument('--allow-partial', action='store_true',
+                        help="Write the bundle even if some editions fail")
+    args = parser.parse_args()
+
+    settings = {name: value for name, value in
+                (('api_key', args.api_key), ('base_url', args.base_url)) if value}
+    client = configure_client(**settings) if settings else get_client()
+    summary = build_mirror(args.path, args.ids.split(',') if args.ids else None,
+                           client=client, concurrency=args.concurrency,
+                           version=args.version, allow_partial=args.allow_partial)
+    print(f"Wrote {len(summary['editions'])} editions to {summary['path']} "
+          f"({summary['bytes'] / 1024 / 1024:.1f}MB, version {summary['version']})")
+    for quran_id, reason in summary['failures'].items():
+        print(f"Failed: {quran_id}: {reason}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+# GlobalQuran Python Helpers: Response Shapes
+# Text responses nest verse records two levels deep under "quran". The outer
+# key is the Quran ID ({"quran": {"quran-simple": {"1": {...}}}}), or the
+# surah number in single-edition examples ({"quran": {"1": {"1": {...}}}}).
+# These helpers walk either shape and rely on each record's surah/ayah fields.
+
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+Verse = Dict[str, Any]
+
+
+def _is_surah_keyed(section: Dict[str, Any]) -> bool:
+    return bool(section) and all(str(key).isdigit() for key in section)
+
+
+def iter_editions(data: Optional[Dict[str, Any]],
+                  section: str = 'quran') -> Iterator[Tuple[Optional[str], List[Verse]]]:
+    """
+    Split a text response into its editions
+
+    Args:
+        data (dict): API response data
+        section (str): Top-level key holding verse data (default: 'quran')
+
+    Yields:
+        tuple: (quran_id or None for surah-keyed responses, list of verse records)
+    """
+    if not data or not isinstance(data.get(section), dict):
+        return
+    body = data[section]
+    if _is_surah_keyed(body):
+        yield None, [verse for surah in body.values() for verse in surah.values()]
+        return
+    for quran_id, verses in body.items():
+        if isinstance(verses, dict):
+            yield quran_id, list(verses.values())
+
+
+def iter_verses(data: Optional[Dict[str, Any]], section: str = 'quran') -> Iterable[Verse]:
+    """Yield every verse record of every edition in a text response"""
+    for _, verses in iter_editions(data, section):
+        yield from verses
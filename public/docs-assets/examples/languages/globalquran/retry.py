@@ -0,0 +1,186 @@
+# GlobalQuran Python Helpers: Retry Policy and Rate Limiting
+# A bulk sweep sends thousands of requests, and one transient 429 or 503
+# used to surface as a None result and a missing page. QuranClient.get now
+# retries those with jittered exponential backoff (or exactly as long as a
+# Retry-After header asks), paces every request through a shared token bucket
+# so sweeps stay inside the API's rate limit instead of tripping it, and
+# counts what happened in RetryMetrics.
+
+import email.utils
+import random
+import threading
+import time
+from collections import Counter
+from typing import Dict, FrozenSet, Iterable, Optional
+
+import requests
+
+# The public API asks for fair use without publishing a number; this keeps a
+# single client well inside it. Clients pointed at another base URL (a local
+# mirror or test server) are not limited unless given a RateLimiter.
+API_RATE_LIMIT = 10.0  # Requests per second
+API_BURST = 20         # Requests that may go out back to back after idling
+
+DEFAULT_MAX_RETRIES = 5
+DEFAULT_BACKOFF_BASE = 0.5    # Seconds; attempt n waits up to base * 2**n
+DEFAULT_BACKOFF_MAX = 30.0    # Cap on a single backoff delay
+DEFAULT_MAX_RETRY_AFTER = 120.0  # Longer Retry-After values are not waited out
+RETRY_STATUSES: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+
+
+def parse_retry_after(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """
+    Seconds to wait from a Retry-After header (delta-seconds or HTTP-date)
+
+    Returns:
+        float: Non-negative delay, or None if the header is missing or invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when is None:
+        return None
+    return max(0.0, when.timestamp() - (time.time() if now is None else now))
+
+
+class RateLimiter:
+    """Token bucket shared by every thread sending through one client"""
+
+    def __init__(self, rate: float = API_RATE_LIMIT, burst: int = API_BURST):
+        """
+        Args:
+            rate (float): Requests per second allowed on average
+            burst (int): Requests allowed back to back when the bucket is full
+        """
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be positive and burst at least 1")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Take one token, sleeping until it is available
+
+        Callers queue in arrival order: each one reserves a token (the count
+        may go negative) and sleeps until the bucket refills to it.
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now > self._last:
+                self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+            self._tokens -= 1
+            wait = (self._last - now) + max(0.0, -self._tokens) / self.rate
+        if wait > 0:
+            time.sleep(wait)
+        return max(wait, 0.0)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every caller for seconds, e.g. after a 429, then refill from empty"""
+        with self._lock:
+            until = time.monotonic() + seconds
+            if until > self._last:
+                self._last = until
+                self._tokens = min(self._tokens, 0.0)
+
+
+class RetryMetrics:
+    """Counts of requests, retries and time spent waiting, shared across threads"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Zero every counter"""
+        with self._lock:
+            self.requests = 0        # HTTP attempts sent, including retries
+            self.retries = 0
+            self.giveups = 0         # Retryable failures returned or raised to the caller
+            self.backoff_seconds = 0.0
+            self.throttle_seconds = 0.0  # Time spent waiting on the rate limiter
+            self.reasons: Counter = Counter()  # Status code or exception name -> retries
+
+    def record_request(self, throttled: float) -> None:
+        with self._lock:
+            self.requests += 1
+            self.throttle_seconds += throttled
+
+    def record_retry(self, reason: str, delay: float) -> None:
+        with self._lock:
+            self.retries += 1
+            self.backoff_seconds += delay
+            self.reasons[reason] += 1
+
+    def record_giveup(self) -> None:
+        with self._lock:
+            self.giveups += 1
+
+    def snapshot(self) -> Dict[str, object]:
+        """Current counters as a plain dict"""
+        with self._lock:
+            return {'requests': self.requests, 'retries': self.retries,
+                    'giveups': self.giveups,
+                    'backoff_seconds': round(self.backoff_seconds, 3),
+                    'throttle_seconds': round(self.throttle_seconds, 3),
+                    'reasons': dict(self.reasons)}
+
+
+class RetryPolicy:
+    """Which failures to retry, and how long to wait before each attempt"""
+
+    def __init__(self, max_retries: int = DEFAULT_MAX_RETRIES,
+                 backoff_base: float = DEFAULT_BACKOFF_BASE,
+                 backoff_max: float = DEFAULT_BACKOFF_MAX,
+                 statuses: Iterable[int] = RETRY_STATUSES,
+                 max_retry_after: float = DEFAULT_MAX_RETRY_AFTER):
+        """
+        Args:
+            max_retries (int): Retries after the first attempt (0 disables retrying)
+            backoff_base (float): First backoff ceiling in seconds, doubled per retry
+            backoff_max (float): Largest backoff ceiling in seconds
+            statuses (iterable): HTTP status codes worth retrying
+            max_retry_after (float): Give up instead of honoring a longer Retry-After
+        """
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.statuses = frozenset(statuses)
+        self.max_retry_after = max_retry_after
+
+    def backoff(self, retry: int) -> float:
+        """Full-jitter delay before retry number `retry` (0-based)"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** retry))
+
+    def retryable_error(self, error: Exception) -> bool:
+        """Connection failures and timeouts are retried; bad URLs and the like are not"""
+        return isinstance(error, (requests.exceptions.ConnectionError,
+                                  requests.exceptions.Timeout))
+
+    def response_delay(self, response: requests.Response, retry: int) -> Optional[float]:
+        """
+        Delay before retrying a response, or None if it should be returned as is
+
+        A Retry-After header wins over backoff (plus a little jitter so that
+        waiting threads do not all return at once).
+        """
+        if response.status_code not in self.statuses:
+            return None
+        retry_after = parse_retry_after(response.headers.get('Retry-After'))
+        if retry_after is None:
+            return self.backoff(retry)
+        if retry_after > self.max_retry_after:
+            return None
+        return retry_after + random.uniform(0, self.backoff_base)
@@ -0,0 +1,221 @@
+# GlobalQuran Python Helpers: Verse Search Index
+# A token-level inverted index over one edition, built once and reused for
+# every query. Each posting records the verse and the word position inside
+# it, which is what phrase queries need; a sorted vocabulary answers prefix
+# queries with a binary search, and an n-gram index over the vocabulary
+# (built on the first substring query) narrows substring queries to the
+# tokens sharing the query's rarest n-gram instead of scanning every token.
+# An optional normalize step (see arabic.py) is applied to the edition once
+# at build time and to each query.
+
+import re
+import string
+from array import array
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from .store import VerseStore
+
+# Stripped from token edges. Arabic harakat are combining marks rather than
+# word characters, so tokens are split on whitespace instead of \W.
+_PUNCTUATION = string.punctuation + '،؛؟«»“”‘’'
+
+# Length of the vocabulary n-grams; shorter query words scan the vocabulary
+GRAM_LENGTH = 3
+
+
+def default_tokenize(text: str) -> List[str]:
+    """Split on whitespace, strip surrounding punctuation and casefold"""
+    tokens = (token.strip(_PUNCTUATION) for token in text.casefold().split())
+    return [token for token in tokens if token]
+
+
+class SearchIndex:
+    """Inverted index with positional postings over a VerseStore"""
+
+    def __init__(self, store: VerseStore,
+                 tokenize: Callable[[str], List[str]] = default_tokenize,
+                 normalize: Optional[Callable[[str], str]] = None):
+        """
+        Build the index
+
+        Args:
+            store (VerseStore): Edition to index
+            tokenize (callable): Text -> list of tokens; queries are tokenized
+                the same way
+            normalize (callable): Optional text -> text step applied before
+                tokenizing, e.g. globalquran.arabic.normalize_arabic. The
+                edition is normalized once here; queries are normalized as
+                they arrive.
+        """
+        self.store = store
+        self.tokenize = tokenize
+        self.normalize = normalize
+        # The text the postings were built from, kept alongside the original
+        self.normalized = self._normalize_store(store, normalize) if normalize else store
+        # token -> (local verse numbers, word positions), parallel 'H' arrays
+        self.postings: Dict[str, Tuple[array, array]] = {}
+        for local, (_, _, text) in enumerate(self.normalized):
+            for position, token in enumerate(tokenize(text)):
+                entry = self.postings.get(token)
+                if entry is None:
+                    entry = self.postings[token] = (array('H'), array('H'))
+                entry[0].append(local)
+                entry[1].append(position)
+        self.vocabulary = sorted(self.postings)
+        self._grams: Optional[Dict[str, array]] = None
+
+    @staticmethod
+    def _normalize_store(store: VerseStore, normalize: Callable[[str], str]) -> VerseStore:
+        """Copy of store with every verse normalized into a new buffer"""
+        offsets = array('I', [0])
+        parts = []
+        size = 0
+        for _, _, text in store:
+            encoded = normalize(text).encode('utf-8')
+            parts.append(encoded)
+            size += len(encoded)
+            offsets.append(size)
+        return VerseStore(store.quran_id, store.start, store.surahs, store.ayahs,
+                          offsets, b''.join(parts))
+
+    def _tokens(self, text: str) -> List[str]:
+        """Tokenize a query the way the edition was tokenized"""
+        return self.tokenize(self.normalize(text) if self.normalize else text)
+
+    def _verses(self, tokens: Iterable[str]) -> Set[int]:
+        verses: Set[int] = set()
+        for token in tokens:
+            verses.update(self.postings[token][0])
+        return verses
+
+    def _results(self, locals_: Iterable[int]) -> List[int]:
+        start = self.store.start
+        return [start + local for local in sorted(locals_)]
+
+    def term(self, token: str) -> List[int]:
+        """Global indices of verses containing an exact token"""
+        tokens = self._tokens(token)
+        if len(tokens) != 1 or tokens[0] not in self.postings:
+            return []
+        return self._results(self._verses(tokens))
+
+    def prefix_tokens(self, prefix: str) -> List[str]:
+        """Vocabulary tokens starting with prefix"""
+        tokens = self._tokens(prefix)
+        if len(tokens) != 1:
+            return []
+        prefix = tokens[0]
+        matches = []
+        for token in self.vocabulary[bisect_left(self.vocabulary, prefix):]:
+            if not token.startswith(prefix):
+                break
+            matches.append(token)
+        return matches
+
+    def _gram_index(self) -> Dict[str, array]:
+        """n-gram -> vocabulary positions of the tokens containing it, built on first use"""
+        grams = self._grams
+        if grams is None:
+            grams = {}
+            for position, token in enumerate(self.vocabulary):
+                for gram in {token[i:i + GRAM_LENGTH]
+                             for i in range(len(token) - GRAM_LENGTH + 1)}:
+                    entry = grams.get(gram)
+                    if entry is None:
+                        entry = grams[gram] = array('I')
+                    entry.append(position)
+            self._grams = grams
+        return grams
+
+    def substring_tokens(self, fragment: str) -> List[str]:
+        """
+        Vocabulary tokens containing fragment, in vocabulary order
+
+        Only the tokens holding the fragment's rarest n-gram are checked;
+        fragments shorter than GRAM_LENGTH scan the whole vocabulary.
+        """
+        if len(fragment) < GRAM_LENGTH:
+            return [token for token in self.vocabulary if fragment in token]
+        grams = self._gram_index()
+        rarest = None
+        for i in range(len(fragment) - GRAM_LENGTH + 1):
+            positions = grams.get(fragment[i:i + GRAM_LENGTH])
+            if positions is None:
+                return []
+            if rarest is None or len(positions) < len(rarest):
+                rarest = positions
+        vocabulary = self.vocabulary
+        return [vocabulary[position] for position in rarest
+                if fragment in vocabulary[position]]
+
+    def prefix(self, prefix: str) -> List[int]:
+        """Global indices of verses containing a token that starts with prefix"""
+        return self._results(self._verses(self.prefix_tokens(prefix)))
+
+    def _phrase(self, candidates: List[List[str]]) -> Set[int]:
+        """Verses where a token from candidates[i] sits at position p + i"""
+        # (verse, position) pairs where the phrase could start
+        starts: Optional[Set[Tuple[int, int]]] = None
+        for offset, tokens in enumerate(candidates):
+            pairs = set()
+            for token in tokens:
+                verses, positions = self.postings[token]
+                pairs.update(zip(verses, (p - offset for p in positions)))
+            starts = pairs if starts is None else starts & pairs
+            if not starts:
+                return set()
+        return {verse for verse, _ in starts or ()}
+
+    def phrase(self, text: str) -> List[int]:
+        """Global indices of verses containing the exact token sequence"""
+        tokens = self._tokens(text)
+        if not tokens or any(token not in self.postings for token in tokens):
+            return []
+        return self._results(self._phrase([[token] for token in tokens]))
+
+    def contains(self, text: str) -> List[int]:
+        """
+        Global indices of verses whose text contains text as a substring
+
+        Matches what a plain `term in verse` scan finds, at token granularity:
+        the first query word may end a token, the last may start one, and the
+        words in between must match whole tokens. The vocabulary tokens a
+        word can sit inside come from substring_tokens, so a query costs the
+        tokens sharing its rarest n-gram rather than a pass over every token,
+        except for words shorter than GRAM_LENGTH.
+        """
+        tokens = self._tokens(text)
+        if not tokens:
+            return []
+        if len(tokens) == 1:
+            return self._results(self._verses(self.substring_tokens(tokens[0])))
+        first = [t for t in self.substring_tokens(tokens[0]) if t.endswith(tokens[0])]
+        last = self.prefix_tokens(tokens[-1])
+        middle = [[token] if token in self.postings else [] for token in tokens[1:-1]]
+        return self._results(self._phrase([first] + middle + [last]))
+
+    def query(self, text: str) -> List[int]:
+        """
+        Run a query: words are ANDed, `word*` is a prefix, "quoted words" a phrase
+
+        Returns:
+            list: Global indices of matching verses in mushaf order
+        """
+        result: Optional[Set[int]] = None
+        for match in re.finditer(r'"([^"]+)"|(\S+)', text):
+            phrase, word = match.groups()
+            if phrase is not None:
+                hits = self.phrase(phrase)
+            elif word.endswith('*'):
+                hits = self.prefix(word[:-1])
+            else:
+                hits = self.term(word)
+            result = set(hits) if result is None else result & set(hits)
+            if not result:
+                return []
+        return sorted(result or ())
+
+    def verses(self, indices: Iterable[int]) -> List[Dict]:
+        """Verse records in the API shape for a list of global indices"""
+        return [self.store.verse(index) for index in indices]
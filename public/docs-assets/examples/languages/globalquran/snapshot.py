@@ -0,0 +1,161 @@
+# GlobalQuran Python Helpers: Warm-Start Snapshot
+# A short-lived process (a serverless handler, a cron job) that fetches the
+# Quran list and a complete edition on every cold start spends seconds on
+# round trips, JSON parsing and building VerseStores before its first answer.
+# A snapshot is a bundle file (see bundle.py) built ahead of time that also
+# holds the list responses whole. Opening one maps the file and parses its
+# JSON header, nothing else: editions are VerseStores over the mapping and
+# a list's Catalog is built the first time it is asked for.
+#
+# This module imports only the bundle, catalog and store modules. requests,
+# and the client built on it, are imported when a snapshot is built, or by a
+# caller that falls back to the API, so a process served from the snapshot
+# never pays for them; the same goes for the command-line parser below.
+#
+# Usage: python -m globalquran.snapshot quran.gqs [--ids quran-simple,en.sahih]
+#            [--lists translation,recitor]
+#        then point GLOBALQURAN_SNAPSHOT at the file for open_snapshot()
+
+import os
+import threading
+import warnings
+from typing import Any, Dict, Iterable, List, Optional
+
+from .bundle import BundleError, QuranBundle
+from .catalog import Catalog, catalog_of
+
+SNAPSHOT_ENV = 'GLOBALQURAN_SNAPSHOT'
+DEFAULT_EDITIONS = ('quran-simple',)
+
+
+class Snapshot(QuranBundle):
+    """A bundle that also serves the list responses it was built with"""
+
+    @property
+    def list_names(self) -> List[str]:
+        """Names of the stored list responses, e.g. ['quran', 'translation']"""
+        return list(self.header.get('lists', {}))
+
+    def catalog(self, name: str = 'quran', list_type: Optional[str] = None) -> Optional[Catalog]:
+        """
+        Indexed Catalog of a stored list, built once per snapshot
+
+        Args:
+            name (str): The stored list, e.g. 'quran' or 'translation'
+            list_type (str): Passed to parse_catalog for v1 /list/<type> responses
+
+        Returns:
+            Catalog: The list's records, or None if the snapshot has no such list
+        """
+        data = self.list_response(name)
+        if data is None:
+            return None
+        return catalog_of(data, list_type)
+
+    def __repr__(self) -> str:
+        return (f"Snapshot({self.path!r}, version={self.version!r}, "
+                f"{len(self.header['editions'])} editions, lists={self.list_names})")
+
+
+def build_snapshot(path: str, quran_ids: Iterable[str] = DEFAULT_EDITIONS,
+                   lists: Optional[Dict[str, str]] = None, client=None,
+                   **kwargs: Any) -> Dict[str, Any]:
+    """
+    Fetch editions and list responses into a snapshot file
+
+    Args:
+        path (str): Snapshot file to write
+        quran_ids (iterable): Complete editions to include
+        lists (dict): List responses to include besides the Quran list,
+            name -> API path, e.g. {'translation': '/v1/list/translation'}
+        client (QuranClient): Client to fetch with (default: shared client)
+        **kwargs: Passed to mirror.build_mirror, e.g. version or concurrency
+
+    Returns:
+        dict: build_mirror's summary
+
+    Raises:
+        BundleError: If an edition or the Quran list could not be fetched
+        requests.RequestException: If one of lists could not be fetched
+    """
+    from .mirror import build_mirror  # Imports requests; only builders need it
+    return build_mirror(path, list(quran_ids), client=client, lists=lists or {}, **kwargs)
+
+
+_default_snapshot: Optional[Snapshot] = None
+_default_failed = False     # The configured file could not be opened
+_default_lock = threading.Lock()
+
+
+def open_snapshot(path: Optional[str] = None) -> Optional[Snapshot]:
+    """
+    The process-wide snapshot, opened on first use
+
+    A file that is missing or unreadable is reported once with a
+    RuntimeWarning and then treated as no snapshot, so the fetchers fall
+    back to the API.
+
+    Args:
+        path (str): Snapshot file (default: the GLOBALQURAN_SNAPSHOT
+            environment variable); ignored once a snapshot is open
+
+    Returns:
+        Snapshot: The open snapshot, or None if none is configured or it
+            could not be opened
+    """
+    global _default_snapshot, _default_failed
+    if _default_snapshot is None and not _default_failed:
+        path = path or os.environ.get(SNAPSHOT_ENV)
+        if not path:
+            return None
+        with _default_lock:
+            if _default_snapshot is None and not _default_failed:
+                try:
+                    _default_snapshot = Snapshot(path)
+                except (OSError, BundleError) as e:
+                    _default_failed = True
+                    warnings.warn(f"Snapshot {path} could not be opened, using the API "
+                                  f"instead: {e}", RuntimeWarning, stacklevel=2)
+    return _default_snapshot
+
+
+def snapshot_list(name: str) -> Optional[Dict[str, Any]]:
+    """
+    A list response from the process-wide snapshot (see open_snapshot)
+
+    Args:
+        name (str): The stored list, e.g. 'quran', 'translation' or 'recitor'
+
+    Returns:
+        dict: The response as fetched, or None if there is no snapshot or it
+            does not hold that list
+    """
+    snapshot = open_snapshot()
+    return snapshot.list_response(name) if snapshot is not None else None
+
+
+def main() -> None:
+    import argparse  # Not imported with the module: it alone costs a handler ~10ms
+    parser = argparse.ArgumentParser(description="Build a warm-start snapshot of GlobalQuran data")
+    parser.add_argument('path', help="Snapshot file to write, e.g. quran.gqs")
+    parser.add_argument('--ids', default=','.join(DEFAULT_EDITIONS),
+                        help="Comma-separated Quran IDs (default: quran-simple)")
+    parser.add_argument('--lists', default='',
+                        help="Comma-separated /v1/list/<type> responses to include, "
+                             "e.g. translation,recitor (the Quran list is always included)")
+    parser.add_argument('--api-key', help="API key (default: the shared client's key)")
+    parser.add_argument('--base-url', help="API base URL (default: the public API)")
+    args = parser.parse_args()
+
+    from .client import configure_client, get_client
+    settings = {name: value for name, value in
+                (('api_key', args.api_key), ('base_url', args.base_url)) if value}
+    client = configure_client(**settings) if settings else get_client()
+    lists = {name: f'/v1/list/{name}' for name in args.lists.split(',') if name}
+    summary = build_snapshot(args.path, args.ids.split(','), lists, client=client)
+    print(f"Wrote {len(summary['editions'])} editions and {len(lists) + 1} lists to "
+          f"{summary['path']} ({summary['bytes'] / 1024 / 1024:.1f}MB, version {summary['version']})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+# GlobalQuran Python Helpers: Edition Statistics
+# Word, character and verse counts per surah, juz and page, computed in one
+# pass over a VerseStore's UTF-8 buffer rather than with str.split() per verse
+# dict. With NumPy installed the pass is vectorized over the whole buffer;
+# without it the same counts come from a plain loop over the byte slices.
+#
+# Words are split on the same whitespace as str.split(), including the
+# multi-byte Unicode spaces (no-break, ideographic, U+2000-U+200A...), and
+# characters are Unicode code points, so the counts match str.split() and
+# len() on the decoded verse.
+
+from array import array
+from itertools import accumulate
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+from .metadata import TOTAL_AYAHS, UNIT_STARTS
+from .store import VerseStore
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+# Unit name -> global index where each unit starts, plus the end of the Quran.
+# Every unit is a contiguous ayah range, so its counts are differences of
+# running totals taken at these boundaries.
+UNIT_BOUNDARIES: Dict[str, Tuple[int, ...]] = {
+    unit: starts + (TOTAL_AYAHS,) for unit, starts in UNIT_STARTS.items()
+}
+
+
+class UnitCounts:
+    """Verse, word and character counts for every surah, juz or page"""
+
+    __slots__ = ('unit', 'verses', 'words', 'characters')
+
+    def __init__(self, unit: str, verses: Sequence[int], words: Sequence[int],
+                 characters: Sequence[int]):
+        """
+        Args:
+            unit (str): A key of UNIT_BOUNDARIES, e.g. 'surah', 'juz' or 'page'
+            verses, words, characters: One count per unit (index 0 is unit 1);
+                NumPy int64 arrays when NumPy is available, array('Q') otherwise
+        """
+        self.unit = unit
+        self.verses = verses
+        self.words = words
+        self.characters = characters
+
+    def totals(self) -> Tuple[int, int, int]:
+        """(verses, words, characters) summed over every unit"""
+        return int(sum(self.verses)), int(sum(self.words)), int(sum(self.characters))
+
+    def __repr__(self) -> str:
+        verses, words, characters = self.totals()
+        return (f"UnitCounts({self.unit!r}, {len(self.verses)} units, {verses:,} verses, "
+                f"{words:,} words, {characters:,} characters)")
+
+
+def verse_counts(store: VerseStore) -> Tuple[Sequence[int], Sequence[int]]:
+    """
+    Word and character count of every verse in a store, in one pass
+
+    Returns:
+        tuple: (words, characters), one entry per verse held
+    """
+    if np is not None:
+        return _verse_counts_numpy(store)
+    buffer, offsets = store.buffer, store.offsets
+    words, characters = array('Q'), array('Q')
+    for local in range(len(store)):
+        text = bytes(buffer[offsets[local]:offsets[local + 1]]).decode('utf-8')
+        words.append(len(text.split()))
+        characters.append(len(text))
+    return words, characters
+
+
+def _verse_counts_numpy(store: VerseStore):
+    data = np.frombuffer(store.buffer, dtype=np.uint8)
+    offsets = np.frombuffer(store.offsets, dtype=np.uint32).astype(np.intp)
+    lengths = np.diff(offsets)
+    if not len(data):
+        return lengths.astype(np.int64), lengths.astype(np.int64)
+
+    # ASCII whitespace is space, \t\n\v\f\r and \x1c-\x1f. Other control
+    # bytes do not occur in verse text, so the cheap test is exact unless
+    # some byte below 0x20 shows up.
+    space = data <= 0x20
+    if (data < 0x20).any():
+        space = ((data == 0x20) | ((data >= 0x09) & (data <= 0x0D))
+                 | ((data >= 0x1C) & (data <= 0x1F)))
+    # Multi-byte whitespace starts with 0xC2 or 0xE1-0xE3; Arabic letters and
+    # marks (0xD8-0xDB) never do, so most buffers skip the check below
+    if (data == 0xC2).any() or ((data >= 0xE1) & (data <= 0xE3)).any():
+        space |= _unicode_spaces(data)
+    # A word starts at a non-space byte preceded by a space or a verse boundary
+    after_space = np.empty_like(space)
+    after_space[0] = True
+    after_space[1:] = space[:-1]
+    # Empty verses hold no bytes and would clip the range of the verse before
+    # them if their start (possibly the end of the buffer) were reduced at
+    nonempty = lengths > 0
+    starts = offsets[:-1][nonempty]
+    after_space[starts] = True
+    word_starts = ~space & after_space
+    # Every byte that is not a UTF-8 continuation byte starts a code point
+    char_starts = (data & 0xC0) != 0x80
+
+    def per_verse(flags):
+        # int32 accumulation is several times faster than int64 here, and no
+        # single verse comes near 2**31 bytes
+        counts = np.zeros(len(lengths), dtype=np.int64)
+        counts[nonempty] = np.add.reduceat(flags.view(np.uint8), starts, dtype=np.int32)
+        return counts
+
+    return per_verse(word_starts), per_verse(char_starts)
+
+
+def _unicode_spaces(data):
+    """Mask of every byte belonging to a multi-byte UTF-8 whitespace character"""
+    mask = np.zeros(len(data), dtype=bool)
+    # U+0085 (next line) and U+00A0 (no-break space)
+    lead, second = data[:-1], data[1:]
+    two = (lead == 0xC2) & ((second == 0x85) | (second == 0xA0))
+    mask[:-1] |= two
+    mask[1:] |= two
+    if len(data) < 3:
+        return mask
+    # U+1680, U+2000-U+200A, U+2028, U+2029, U+202F, U+205F and U+3000
+    lead, second, third = data[:-2], data[1:-1], data[2:]
+    general = (second == 0x80) & ((third <= 0x8A) | (third == 0xA8) | (third == 0xA9)
+                                  | (third == 0xAF))
+    three = (lead == 0xE2) & (general | ((second == 0x81) & (third == 0x9F)))
+    three |= (lead == 0xE1) & (second == 0x9A) & (third == 0x80)
+    three |= (lead == 0xE3) & (second == 0x80) & (third == 0x80)
+    for shift in range(3):
+        mask[shift:len(data) - 2 + shift] |= three
+    return mask
+
+
+def _local_boundaries(store: VerseStore, unit: str):
+    """Unit boundaries as positions within the store, clipped to what it holds"""
+    count = len(store)
+    return [min(max(boundary - store.start, 0), count)
+            for boundary in UNIT_BOUNDARIES[unit]]
+
+
+def edition_statistics(store: VerseStore,
+                       units: Iterable[str] = ('surah', 'juz', 'page')) -> Dict[str, UnitCounts]:
+    """
+    Counts per surah, juz and page for one edition
+
+    Partial stores (a single page or surah) are fine; units they do not
+    touch are zero.
+
+    Args:
+        store (VerseStore): The edition
+        units (iterable): Any of 'surah', 'juz', 'page', 'hizb', 'rub',
+            'manzil', 'ruku'
+
+    Returns:
+        dict: Unit name -> UnitCounts
+    """
+    words, characters = verse_counts(store)
+    result = {}
+    if np is not None:
+        word_totals = np.concatenate(([0], np.cumsum(words)))
+        char_totals = np.concatenate(([0], np.cumsum(characters)))
+        for unit in units:
+            bounds = np.asarray(_local_boundaries(store, unit))
+            result[unit] = UnitCounts(unit, np.diff(bounds).astype(np.int64),
+                                      np.diff(word_totals[bounds]), np.diff(char_totals[bounds]))
+        return result
+
+    word_totals = array('Q', accumulate(words, initial=0))
+    char_totals = array('Q', accumulate(characters, initial=0))
+    for unit in units:
+        bounds = _local_boundaries(store, unit)
+        pairs = list(zip(bounds, bounds[1:]))
+        result[unit] = UnitCounts(
+            unit,
+            array('Q', (end - start for start, end in pairs)),
+            array('Q', (word_totals[end] - word_totals[start] for start, end in pairs)),
+            array('Q', (char_totals[end] - char_totals[start] for start, end in pairs)))
+    return result
+
+
+def batch_statistics(stores: Iterable[VerseStore],
+                     units: Iterable[str] = ('surah', 'juz', 'page')
+                     ) -> Dict[Optional[str], Dict[str, UnitCounts]]:
+    """
+    edition_statistics for many editions
+
+    Returns:
+        dict: Quran ID -> unit name -> UnitCounts
+    """
+    units = tuple(units)
+    return {store.quran_id: edition_statistics(store, units) for store in stores}
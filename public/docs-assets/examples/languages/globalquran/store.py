@@ -0,0 +1,155 @@
+# GlobalQuran Python Helpers: Compact Verse Store
+# Keeps one edition's verses in contiguous arrays instead of one dict per
+# verse: surah and ayah numbers in unsigned 16-bit arrays, and all verse text
+# in a single UTF-8 buffer addressed by an offset table. A full edition is a
+# handful of objects rather than tens of thousands. The arrays and buffer may
+# also be memoryviews over a memory-mapped bundle (see bundle.py).
+
+from array import array
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence, Tuple, Union
+
+from .metadata import SURAH_AYAH_COUNTS, TOTAL_AYAHS, global_ayah_index
+from .responses import Verse, iter_editions
+
+
+class VerseStore:
+    """Array-backed verses of one edition, covering a contiguous ayah range"""
+
+    __slots__ = ('quran_id', 'start', 'surahs', 'ayahs', 'offsets', 'buffer')
+
+    def __init__(self, quran_id: Optional[str], start: int, surahs: Sequence[int],
+                 ayahs: Sequence[int], offsets: Sequence[int], buffer: Union[bytes, memoryview]):
+        """
+        Use from_response() or from_verses() rather than calling this directly
+
+        Args:
+            quran_id (str): Edition ID, e.g. 'quran-simple'
+            start (int): 0-based global index of the first verse held
+            surahs (array): Surah number of each verse ('H')
+            ayahs (array): Ayah number of each verse ('H')
+            offsets (array): len + 1 byte offsets into buffer ('I')
+            buffer (bytes): Concatenated UTF-8 verse text (or a memoryview)
+        """
+        self.quran_id = quran_id
+        self.start = start
+        self.surahs = surahs
+        self.ayahs = ayahs
+        self.offsets = offsets
+        self.buffer = buffer
+
+    @classmethod
+    def from_verses(cls, verses: Iterable[Verse], quran_id: Optional[str] = None,
+                    text_field: str = 'verse') -> 'VerseStore':
+        """
+        Build a store from verse records ({'surah', 'ayah', 'verse'})
+
+        Raises:
+            ValueError: If the verses do not form a contiguous ayah range
+        """
+        ordered = sorted(((global_ayah_index(int(v['surah']), int(v['ayah'])), v)
+                          for v in verses), key=lambda item: item[0])
+        start = ordered[0][0] if ordered else 0
+        surahs, ayahs, offsets = array('H'), array('H'), array('I', [0])
+        parts = []
+        size = 0
+        for position, (index, verse) in enumerate(ordered):
+            if index != start + position:
+                raise ValueError(f"Verses are not contiguous at {verse['surah']}:{verse['ayah']}")
+            encoded = str(verse.get(text_field) or '').encode('utf-8')
+            parts.append(encoded)
+            size += len(encoded)
+            surahs.append(int(verse['surah']))
+            ayahs.append(int(verse['ayah']))
+            offsets.append(size)
+        return cls(quran_id, start, surahs, ayahs, offsets, b''.join(parts))
+
+    @classmethod
+    def from_response(cls, data: Optional[Dict[str, Any]], quran_id: Optional[str] = None,
+                      section: str = 'quran') -> Optional['VerseStore']:
+        """
+        Build a store for one edition of an API text response
+
+        Args:
+            data (dict): API response data
+            quran_id (str): Edition to take (default: the first one)
+            section (str): Top-level key holding verse data
+
+        Returns:
+            VerseStore: The edition, or None if it is not in the response
+        """
+        for edition_id, verses in iter_editions(data, section):
+            if quran_id is None or edition_id is None or edition_id == quran_id:
+                return cls.from_verses(verses, edition_id or quran_id)
+        return None
+
+    @classmethod
+    def editions_from_response(cls, data: Optional[Dict[str, Any]],
+                               section: str = 'quran') -> Dict[Optional[str], 'VerseStore']:
+        """Build one store per edition of a (multi-ID) API text response"""
+        return {edition_id: cls.from_verses(verses, edition_id)
+                for edition_id, verses in iter_editions(data, section)}
+
+    def __len__(self) -> int:
+        return len(self.surahs)
+
+    def __contains__(self, index: int) -> bool:
+        return self.start <= index < self.start + len(self.surahs)
+
+    @property
+    def is_complete(self) -> bool:
+        """True if the store holds all 6,236 ayahs"""
+        return self.start == 0 and len(self.surahs) == TOTAL_AYAHS
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held in the arrays and text buffer"""
+        return (len(self.buffer) + self.surahs.itemsize * len(self.surahs)
+                + self.ayahs.itemsize * len(self.ayahs)
+                + self.offsets.itemsize * len(self.offsets))
+
+    def _local(self, index: int) -> int:
+        local = index - self.start
+        if not 0 <= local < len(self.surahs):
+            raise IndexError(f"Global ayah index {index} is not in this store")
+        return local
+
+    def text_bytes(self, index: int) -> memoryview:
+        """UTF-8 bytes of the verse at a 0-based global ayah index, without copying"""
+        local = self._local(index)
+        return memoryview(self.buffer)[self.offsets[local]:self.offsets[local + 1]]
+
+    def text(self, index: int) -> str:
+        """Verse text at a 0-based global ayah index"""
+        local = self._local(index)
+        return str(self.buffer[self.offsets[local]:self.offsets[local + 1]], 'utf-8')
+
+    def get(self, surah: int, ayah: int) -> Optional[str]:
+        """Verse text for surah:ayah, or None if it is not held"""
+        try:
+            return self.text(global_ayah_index(surah, ayah))
+        except (ValueError, IndexError):
+            return None
+
+    def verse(self, index: int) -> Verse:
+        """Verse record in the API shape ({'surah', 'ayah', 'verse'})"""
+        local = self._local(index)
+        return {'surah': self.surahs[local], 'ayah': self.ayahs[local],
+                'verse': str(self.buffer[self.offsets[local]:self.offsets[local + 1]], 'utf-8')}
+
+    def surah_range(self, surah: int) -> range:
+        """Global indices of a surah's ayahs that this store holds"""
+        first = global_ayah_index(surah, 1)
+        last = first + SURAH_AYAH_COUNTS[surah - 1]
+        end = self.start + len(self.surahs)
+        return range(max(first, self.start), min(last, end))
+
+    def __iter__(self) -> Iterator[Tuple[int, int, str]]:
+        """Yield (surah, ayah, text) in mushaf order"""
+        buffer, offsets = self.buffer, self.offsets
+        for local in range(len(self.surahs)):
+            yield (self.surahs[local], self.ayahs[local],
+                   str(buffer[offsets[local]:offsets[local + 1]], 'utf-8'))
+
+    def __repr__(self) -> str:
+        return (f"VerseStore({self.quran_id!r}, {len(self)} verses, "
+                f"{self.nbytes:,} bytes)")
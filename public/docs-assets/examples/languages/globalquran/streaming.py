@@ -0,0 +1,168 @@
+# GlobalQuran Python Helpers: Streaming Response Parser
+# A complete edition is several megabytes of JSON. response.json() holds the
+# raw bytes, the decoded text and the whole object tree at once, and nothing
+# can be computed until the last byte arrives. This parser consumes the body
+# chunk by chunk and yields each verse record as soon as its closing brace is
+# read, so memory stays flat and callers can start work during the download.
+
+import re
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from .decoding import loads
+from .responses import Verse
+
+# Bytes that change parser state outside and inside strings. UTF-8 continuation
+# bytes are all >= 0x80, so scanning raw bytes for these is safe.
+_STRUCTURE = re.compile(rb'[{}\[\]",]')
+_STRING_END = re.compile(rb'["\\]')
+
+
+class _Frame:
+    """An open object or array"""
+
+    __slots__ = ('is_object', 'key', 'start', 'leaf')
+
+    def __init__(self, is_object: bool, key: Optional[str], start: int):
+        self.is_object = is_object
+        self.key = key
+        self.start = start
+        self.leaf = True  # No nested object or array seen yet
+
+
+class StreamParser:
+    """
+    Incremental parser yielding the innermost objects of a JSON document
+
+    Verse records are the only objects in a text response without nested
+    containers, so every leaf object found under the section key is a verse.
+    Only the bytes of the object currently being read are buffered.
+    """
+
+    def __init__(self, section: str = 'quran'):
+        """
+        Args:
+            section (str): Top-level key holding verse data (default: 'quran')
+        """
+        self.section = section
+        self._buffer = bytearray()
+        self._pos = 0
+        self._stack: List[_Frame] = []
+        self._string_start: Optional[int] = None
+        self._expect_key = False
+        self._key: Optional[str] = None
+
+    def feed(self, chunk: bytes) -> Iterator[Tuple[Optional[str], Verse]]:
+        """
+        Parse the next chunk of the body
+
+        Yields:
+            tuple: (quran_id or None for surah-keyed responses, verse record)
+                for every record completed by this chunk
+
+        Raises:
+            ValueError: If the body is not well-formed JSON
+        """
+        self._buffer += chunk
+        buffer = self._buffer
+        while True:
+            if self._string_start is not None:
+                match = _STRING_END.search(buffer, self._pos)
+                if match is None:
+                    self._pos = len(buffer)
+                    break
+                if match.group() == b'\\':
+                    if match.end() >= len(buffer):
+                        self._pos = match.start()
+                        break
+                    self._pos = match.end() + 1
+                    continue
+                self._pos = match.end()
+                if self._expect_key:
+                    self._key = loads(buffer[self._string_start:self._pos])
+                    self._expect_key = False
+                self._string_start = None
+                continue
+
+            match = _STRUCTURE.search(buffer, self._pos)
+            if match is None:
+                self._pos = len(buffer)
+                break
+            token, position = match.group(), match.start()
+            self._pos = match.end()
+            if token == b'"':
+                self._string_start = position
+            elif token == b',':
+                self._expect_key = bool(self._stack) and self._stack[-1].is_object
+            elif token in (b'{', b'['):
+                if self._stack:
+                    self._stack[-1].leaf = False
+                parent_is_object = bool(self._stack) and self._stack[-1].is_object
+                self._stack.append(_Frame(token == b'{',
+                                          self._key if parent_is_object else None, position))
+                self._key = None
+                self._expect_key = token == b'{'
+            else:
+                if not self._stack or self._stack[-1].is_object != (token == b'}'):
+                    raise ValueError(f"Unbalanced {token.decode()} in JSON stream")
+                frame = self._stack.pop()
+                if frame.is_object and frame.leaf:
+                    record = self._record(frame, buffer[frame.start:self._pos])
+                    if record is not None:
+                        yield record
+        self._compact()
+
+    def _record(self, frame: _Frame, raw: bytearray) -> Optional[Tuple[Optional[str], Verse]]:
+        path = [parent.key for parent in self._stack[1:]] + [frame.key]
+        if len(path) < 3 or path[0] != self.section:
+            return None
+        edition_id = None if str(path[1]).isdigit() else path[1]
+        return edition_id, loads(raw)
+
+    def _compact(self) -> None:
+        """Drop bytes that no open record or string still needs"""
+        keep = self._pos
+        if self._stack and self._stack[-1].is_object and self._stack[-1].leaf:
+            keep = min(keep, self._stack[-1].start)
+        if self._string_start is not None:
+            keep = min(keep, self._string_start)
+        if keep:
+            del self._buffer[:keep]
+            self._pos -= keep
+            if self._stack:
+                self._stack[-1].start -= keep
+            if self._string_start is not None:
+                self._string_start -= keep
+
+    def close(self) -> None:
+        """
+        Check the document ended cleanly
+
+        Raises:
+            ValueError: If the body stopped inside an object or string
+        """
+        if self._stack or self._string_start is not None:
+            raise ValueError("JSON stream ended before the document was complete")
+
+
+def stream_editions(chunks: Iterable[bytes],
+                    section: str = 'quran') -> Iterator[Tuple[Optional[str], Verse]]:
+    """
+    Yield (quran_id, verse record) pairs from a text response body
+
+    Args:
+        chunks (iterable): Body bytes in pieces, e.g. response.iter_content()
+        section (str): Top-level key holding verse data (default: 'quran')
+
+    Raises:
+        ValueError: If the body is not well-formed JSON
+    """
+    parser = StreamParser(section)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    parser.close()
+
+
+def stream_verses(chunks: Iterable[bytes], section: str = 'quran') -> Iterator[Verse]:
+    """Yield every verse record of every edition in a text response body"""
+    for _, verse in stream_editions(chunks, section):
+        yield verse
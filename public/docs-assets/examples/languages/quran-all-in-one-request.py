@@ -3,11 +3,15 @@
 
 import requests
 import json
+from itertools import islice
+from globalquran import get_client
+from globalquran.decoding import response_json
+from globalquran.lazy import lazy_json
 
 # API Endpoint
 endpoint = 'https://api.globalquran.com/v1/all/surah/1/quran-simple/en?key=REPLACE_WITH_YOUR_KEY'
 
-def fetch_all_data(data_in='surah', data_in_no=1, quran_id='quran-simple', lang_code='en'):
+def fetch_all_data(data_in='surah', data_in_no=1, quran_id='quran-simple', lang_code='en', lazy=False):
     """
     Function to fetch multiple data types in a single request
     
@@ -16,16 +20,21 @@ def fetch_all_data(data_in='surah', data_in_no=1, quran_id='quran-simple', lang_
         data_in_no (int): Number for the data type
         quran_id (str): Quran ID (default: 'quran-simple')
         lang_code (str): Language code (default: 'en')
+        lazy (bool): Keep the raw body and decode each section, surah and
+            ayah on first access (for callers that read only part of it)
     
     Returns:
-        dict: API response data or None if error
+        dict: API response data (a read-only LazyObject mapping when lazy)
+            or None if error
     """
     try:
         url = f"https://api.globalquran.com/v1/all/{data_in}/{data_in_no}/{quran_id}/{lang_code}?key=REPLACE_WITH_YOUR_KEY"
-        response = requests.get(url)
+        response = get_client().get(url)
         response.raise_for_status()  # Raises an HTTPError for bad responses
         
-        data = response.json()
+        if lazy:
+            return lazy_json(response.content)
+        data = response_json(response)
         return data
         
     except requests.exceptions.RequestException as e:
@@ -56,7 +65,7 @@ def display_all_data(data):
         for surah_key, surah_data in quran_data.items():
             print(f"  Surah {surah_key}: {len(surah_data)} ayahs")
             # Show first few ayahs
-            for ayah_key, ayah_data in list(surah_data.items())[:3]:
+            for ayah_key, ayah_data in islice(surah_data.items(), 3):
                 print(f"    Ayah {ayah_key}: {ayah_data.get('verse', 'N/A')[:50]}...")
         print()
     
@@ -67,7 +76,7 @@ def display_all_data(data):
         for surah_key, surah_data in translation_data.items():
             print(f"  Surah {surah_key}: {len(surah_data)} translations")
             # Show first few translations
-            for ayah_key, ayah_data in list(surah_data.items())[:3]:
+            for ayah_key, ayah_data in islice(surah_data.items(), 3):
                 print(f"    Ayah {ayah_key}: {ayah_data.get('text', 'N/A')[:50]}...")
         print()
     
@@ -82,6 +91,8 @@ def display_all_data(data):
 # Main execution
 if __name__ == "__main__":
     print("Fetching all-in-one data for Surah 1...")
+    # display_all_data counts every edition, so a full json decode is cheapest
+    # here; lazy=True pays off for callers that read only a few ayahs
     data = fetch_all_data('surah', 1, 'quran-simple', 'en')
     
     if data:
@@ -3,14 +3,23 @@
 
 import requests
 import json
-from typing import Dict, Optional
+from typing import Dict, Iterable, Optional
+from globalquran import QuranClient, get_client
+from globalquran.batching import AyahBatcher
+from globalquran.decoding import response_json
+from globalquran.library import EditionLibrary
 
 class GlobalQuranAPI:
     """A simple wrapper class for GlobalQuran API calls"""
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, client: Optional[QuranClient] = None,
+                 batcher: Optional[AyahBatcher] = None,
+                 library: Optional[EditionLibrary] = None):
         self.api_key = api_key
-        self.base_url = "https://api.globalquran.com"
+        self.client = client or get_client()  # Shared keep-alive connection pool
+        self.base_url = self.client.base_url
+        self.batcher = batcher  # Coalesces concurrent lookups into page/surah requests
+        self.library = library  # Locally held editions, served without the API
     
     def fetch_ayah(self, ayah_reference: str, quran_id: str = 'quran-simple') -> Optional[Dict]:
         """
@@ -23,12 +32,23 @@ class GlobalQuranAPI:
         Returns:
             Dict: API response data or None if error
         """
+        if self.library is not None:
+            data = self.library.ayah(ayah_reference, quran_id)
+            if data is not None:
+                return data
+        if self.batcher is not None:
+            try:
+                return self.batcher.fetch_ayah(ayah_reference, quran_id)
+            except ValueError as e:
+                print(f"Invalid ayah reference {ayah_reference!r}: {e}")
+                return None
+        
         url = f"{self.base_url}/v1/ayah/{ayah_reference}/{quran_id}?key={self.api_key}"
         
         try:
-            response = requests.get(url, timeout=30)
+            response = self.client.get(url, timeout=30)
             response.raise_for_status()
-            return response.json()
+            return response_json(response)
         except requests.exceptions.RequestException as e:
             print(f"Request error: {e}")
             return None
@@ -36,6 +56,23 @@ class GlobalQuranAPI:
             print(f"JSON decode error: {e}")
             return None
     
+    def fetch_ayahs(self, ayah_references: Iterable[str],
+                    quran_ids: Iterable[str] = ('quran-simple',)) -> Dict:
+        """
+        Fetch many Ayahs in several editions with as few requests as possible
+        
+        Args:
+            ayah_references (iterable): References such as '2:255'
+            quran_ids (iterable): Quran IDs to fetch each Ayah in
+        
+        Returns:
+            Dict: (ayah_reference, quran_id) -> verse record, or None if it failed
+        """
+        if self.batcher is not None:
+            return self.batcher.fetch_many(ayah_references, quran_ids)
+        with AyahBatcher(self.client) as batcher:
+            return batcher.fetch_many(ayah_references, quran_ids)
+    
     def display_ayah(self, data: Dict) -> None:
         """Display Ayah data in a formatted way"""
         if not data or 'quran' not in data:
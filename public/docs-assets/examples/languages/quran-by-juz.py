@@ -4,13 +4,19 @@
 import requests
 import json
 from typing import Dict, List, Optional
+from globalquran import QuranClient, get_client
+from globalquran.decoding import response_json
+from globalquran.library import EditionLibrary
 
 class QuranJuzFetcher:
     """A class to fetch Quran content by Juz (Para) numbers"""
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, client: Optional[QuranClient] = None,
+                 library: Optional[EditionLibrary] = None):
         self.api_key = api_key
-        self.base_url = "https://api.globalquran.com"
+        self.client = client or get_client()  # Shared keep-alive connection pool
+        self.base_url = self.client.base_url
+        self.library = library  # Locally held editions, served without the API
     
     def fetch_juz(self, juz_number: int, quran_id: str = 'quran-simple') -> Optional[Dict]:
         """
@@ -23,12 +29,17 @@ class QuranJuzFetcher:
         Returns:
             Dict: API response data or None if error
         """
+        if self.library is not None:
+            data = self.library.juz(juz_number, quran_id)
+            if data is not None:
+                return data
+        
         url = f"{self.base_url}/v1/juz/{juz_number}/{quran_id}?key={self.api_key}"
         
         try:
-            response = requests.get(url, timeout=30)
+            response = self.client.get(url, timeout=30)
             response.raise_for_status()
-            return response.json()
+            return response_json(response)
         except requests.exceptions.RequestException as e:
             print(f"Request error: {e}")
             return None
@@ -3,28 +3,40 @@
 
 import requests
 import json
+from typing import Optional
+from globalquran import get_client
+from globalquran.aligned import fetch_aligned
+from globalquran.decoding import response_json
+from globalquran.library import EditionLibrary
 
 # API Endpoint
 endpoint = 'https://api.globalquran.com/v1/surah/1/quran-simple?key=REPLACE_WITH_YOUR_KEY'
 
-def fetch_surah(surah_number=1, quran_id='quran-simple'):
+def fetch_surah(surah_number=1, quran_id='quran-simple', library: Optional[EditionLibrary] = None):
     """
     Function to fetch Surah data
     
     Args:
         surah_number (int): Surah number (1-114)
         quran_id (str): Quran ID (default: 'quran-simple')
+        library (EditionLibrary): Locally held editions to serve from first
     
     Returns:
         dict: API response data or None if error
     """
-    url = f"https://api.globalquran.com/v1/surah/{surah_number}/{quran_id}?key=REPLACE_WITH_YOUR_KEY"
+    if library is not None:
+        data = library.surah(surah_number, quran_id)
+        if data is not None:
+            return data
+    
+    client = get_client()  # Honours configure_client(base_url=..., api_key=...)
+    url = f"{client.base_url}/v1/surah/{surah_number}/{quran_id}"  # The client adds the key
     
     try:
-        response = requests.get(url, timeout=30)
+        response = client.get(url, timeout=30)
         response.raise_for_status()  # Raises an HTTPError for bad responses
         
-        data = response.json()
+        data = response_json(response)
         return data
         
     except requests.exceptions.RequestException as e:
@@ -50,6 +62,36 @@ def display_surah(data):
         for verse in surah.values():
             print(f"{verse['surah']}:{verse['ayah']} {verse['verse']}")
 
+def fetch_surah_parallel(surah_number=1, quran_ids=('quran-simple', 'en.sahih'),
+                         library: Optional[EditionLibrary] = None, combined=True):
+    """
+    Function to fetch several editions of a Surah side by side
+    
+    Args:
+        surah_number (int): Surah number (1-114)
+        quran_ids (sequence): Quran IDs in column order
+        library (EditionLibrary): Locally held editions to serve from first
+        combined (bool): One comma-separated request (False: one per edition, in parallel)
+    
+    Returns:
+        AlignedTable: One row per ayah, one column per edition
+    """
+    return fetch_aligned(quran_ids, 'surah', surah_number, library=library, combined=combined)
+
+def display_parallel(table):
+    """
+    Function to display editions side by side
+    
+    Args:
+        table (AlignedTable): Result of fetch_surah_parallel
+    """
+    for _, surah, ayah, texts in table:
+        print(f"{surah}:{ayah}")
+        for quran_id, text in zip(table.quran_ids, texts):
+            print(f"  [{quran_id}] {text}")
+    if table.missing:
+        print(f"Could not fetch: {', '.join(table.missing)}")
+
 # Usage example
 if __name__ == "__main__":
     surah_data = fetch_surah(1)  # Al-Fatiha
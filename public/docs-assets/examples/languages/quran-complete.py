@@ -3,15 +3,35 @@
 
 import requests
 import json
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Union
 import time
+from globalquran import QuranClient, get_client
+from globalquran.arabic import normalize_arabic
+from globalquran.bundle import QuranBundle
+from globalquran.cache import DiskCache
+from globalquran.library import EditionLibrary
+from globalquran.mirror import build_mirror
+from globalquran.responses import Verse, iter_editions
+from globalquran.search import SearchIndex
+from globalquran.snapshot import open_snapshot
+from globalquran.stats import edition_statistics
+from globalquran.store import VerseStore
+from globalquran.streaming import stream_verses
 
 class CompleteQuranFetcher:
     """A class to fetch the complete Quran"""
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, client: Optional[QuranClient] = None,
+                 cache: Optional[DiskCache] = None, bundle: Optional[QuranBundle] = None,
+                 library: Optional[EditionLibrary] = None):
         self.api_key = api_key
-        self.base_url = "https://api.globalquran.com"
+        self.client = client or get_client()  # Shared keep-alive connection pool
+        self.base_url = self.client.base_url
+        self.cache = cache  # Quran text never changes, so cache the full download
+        # Offline mirror, or the warm-start snapshot from GLOBALQURAN_SNAPSHOT;
+        # bundled editions need no network calls
+        self.bundle = bundle if bundle is not None else open_snapshot()
+        self.library = library  # Editions fetched here are kept for local page/juz/surah lookups
     
     def fetch_complete_quran(self, quran_id: str = 'quran-simple') -> Optional[Dict]:
         """
@@ -23,22 +43,154 @@ class CompleteQuranFetcher:
         Returns:
             Dict: API response data or None if error
         """
+        if self.bundle is not None and quran_id in self.bundle:
+            return self.bundle.response(quran_id)
+        if self.library is not None:
+            data = self.library.complete(quran_id)
+            if data is not None:
+                return data
+        
         url = f"{self.base_url}/v1/quran/{quran_id}?key={self.api_key}"
         
         try:
             print("Fetching complete Quran... This may take a moment.")
-            response = requests.get(url, timeout=60)
-            response.raise_for_status()
-            return response.json()
+            data = self.client.get_json(url, timeout=60, cache=self.cache)
         except requests.exceptions.RequestException as e:
             print(f"Request error: {e}")
             return None
         except json.JSONDecodeError as e:
             print(f"JSON decode error: {e}")
             return None
+        
+        if data and self.library is not None:
+            store = VerseStore.from_response(data, quran_id)
+            if store is not None:
+                self.library.add(store)  # Page/juz/surah fetchers sharing the library slice it
+        return data
+    
+    def fetch_verse_store(self, quran_id: str = 'quran-simple') -> Optional[VerseStore]:
+        """
+        Fetch the complete Quran into a compact array-backed VerseStore
+        
+        Args:
+            quran_id (str): Quran ID (default: 'quran-simple')
+        
+        Returns:
+            VerseStore: All 6,236 verses in contiguous arrays, or None if error
+        """
+        if self.bundle is not None and quran_id in self.bundle:
+            return self.bundle.edition(quran_id)  # Backed by the mapped file
+        if self.library is not None:
+            store = self.library.edition(quran_id)
+            if store is not None and store.is_complete:
+                return store
+        
+        data = self.fetch_complete_quran(quran_id)
+        if not data:
+            return None
+        if self.library is not None:
+            store = self.library.edition(quran_id)  # Added by fetch_complete_quran
+            if store is not None:
+                return store
+        return VerseStore.from_response(data, quran_id)
+    
+    def build_mirror(self, path: str, quran_ids: Optional[List[str]] = None) -> Dict:
+        """
+        Download every text edition (or quran_ids) into an offline bundle file
+        
+        Open it with QuranBundle(path) and pass it as bundle= to serve
+        fetch_complete_quran and fetch_verse_store without the API.
+        
+        Returns:
+            Dict: Summary with the editions written and any failures
+        """
+        return build_mirror(path, quran_ids, fetch_edition=self.fetch_complete_quran,
+                            client=self.client)
     
-    def get_quran_statistics(self, data: Dict) -> Dict:
-        """Get comprehensive statistics about the Quran"""
+    def stream_complete_quran(self, quran_id: str = 'quran-simple') -> Iterator[Verse]:
+        """
+        Stream the complete Quran verse by verse while it downloads
+        
+        Only the verse being parsed is held in memory, so this suits
+        one-pass work such as get_quran_statistics. The cache is not used.
+        
+        Args:
+            quran_id (str): Quran ID (default: 'quran-simple')
+        
+        Yields:
+            dict: Verse records ({'surah', 'ayah', 'verse'}) in response order
+        """
+        url = f"{self.base_url}/v1/quran/{quran_id}?key={self.api_key}"
+        
+        try:
+            yield from stream_verses(self.client.iter_content(url, timeout=60))
+        except requests.exceptions.RequestException as e:
+            print(f"Request error: {e}")
+        except ValueError as e:
+            print(f"JSON decode error: {e}")
+    
+    def get_quran_statistics(self, data: Union[Dict, Iterable[Verse]]) -> Dict:
+        """
+        Get comprehensive statistics about the Quran
+        
+        Response dicts are counted in one pass per edition over a compact
+        VerseStore (see globalquran.stats for per-juz and per-page arrays).
+        Editions are never added together: when the response holds several,
+        the top-level counts are the first edition's and 'editions' maps
+        every Quran ID to its own statistics.
+        
+        Args:
+            data: API response data, or verse records such as those yielded
+                by stream_complete_quran (consumed in a single pass)
+        """
+        editions: Dict[Optional[str], Dict[int, Dict]] = {}
+        stores = None
+        if isinstance(data, dict):
+            try:
+                stores = VerseStore.editions_from_response(data)
+            except ValueError:
+                pass  # Not a contiguous ayah range; count record by record
+        
+        if stores is not None:
+            for quran_id, store in stores.items():
+                per_surah = editions[quran_id] = {}
+                counts = edition_statistics(store, units=('surah',))['surah']
+                for surah_index, verse_count in enumerate(counts.verses):
+                    if not verse_count:
+                        continue
+                    per_surah[surah_index + 1] = {
+                        'surah': surah_index + 1,
+                        'verses': int(verse_count),
+                        'words': int(counts.words[surah_index]),
+                        'characters': int(counts.characters[surah_index])
+                    }
+        else:
+            records = iter_editions(data) if isinstance(data, dict) else [(None, data or ())]
+            for quran_id, verses in records:
+                per_surah = editions.setdefault(quran_id, {})
+                for verse in verses:
+                    surah_num = int(verse['surah'])
+                    surah_info = per_surah.get(surah_num)
+                    if surah_info is None:
+                        surah_info = per_surah[surah_num] = {
+                            'surah': surah_num, 'verses': 0, 'words': 0, 'characters': 0
+                        }
+                    surah_info['verses'] += 1
+                    surah_info['words'] += len(verse['verse'].split())
+                    surah_info['characters'] += len(verse['verse'])
+        
+        summaries = {quran_id: self._summarize_surahs(per_surah)
+                     for quran_id, per_surah in editions.items()}
+        if not summaries:
+            return self._summarize_surahs({})
+        stats = dict(next(iter(summaries.values())))
+        if len(summaries) > 1:
+            stats['editions'] = summaries
+        return stats
+    
+    @staticmethod
+    def _summarize_surahs(per_surah: Dict[int, Dict]) -> Dict:
+        """Totals and the ordered surah list for one edition's per-surah counts"""
         stats = {
             'total_surahs': 0,
             'total_verses': 0,
@@ -46,30 +198,13 @@ class CompleteQuranFetcher:
             'total_characters': 0,
             'surahs': []
         }
-        
-        if data and 'quran' in data:
-            for surah_num, surah in data['quran'].items():
-                surah_verses = len(surah)
-                surah_words = 0
-                surah_chars = 0
-                
-                for verse in surah.values():
-                    words = len(verse['verse'].split())
-                    chars = len(verse['verse'])
-                    surah_words += words
-                    surah_chars += chars
-                
-                stats['total_surahs'] += 1
-                stats['total_verses'] += surah_verses
-                stats['total_words'] += surah_words
-                stats['total_characters'] += surah_chars
-                
-                stats['surahs'].append({
-                    'surah': int(surah_num),
-                    'verses': surah_verses,
-                    'words': surah_words,
-                    'characters': surah_chars
-                })
+        for surah_num in sorted(per_surah):
+            surah_info = per_surah[surah_num]
+            stats['total_surahs'] += 1
+            stats['total_verses'] += surah_info['verses']
+            stats['total_words'] += surah_info['words']
+            stats['total_characters'] += surah_info['characters']
+            stats['surahs'].append(surah_info)
         
         return stats
     
@@ -79,22 +214,43 @@ class CompleteQuranFetcher:
         
         print("Complete Quran Overview")
         print("=" * 50)
-        print(f"Total Surahs: {stats['total_surahs']}")
-        print(f"Total Verses: {stats['total_verses']}")
-        print(f"Total Words: {stats['total_words']:,}")
-        print(f"Total Characters: {stats['total_characters']:,}")
-        
-        print("\nSurah Breakdown:")
-        print("-" * 30)
-        for surah_info in stats['surahs'][:10]:  # Show first 10 surahs
-            print(f"Surah {surah_info['surah']}: {surah_info['verses']} verses, "
-                  f"{surah_info['words']} words, {surah_info['characters']} characters")
-        
-        if len(stats['surahs']) > 10:
-            print(f"... and {len(stats['surahs']) - 10} more surahs")
+        for quran_id, edition in stats.get('editions', {None: stats}).items():
+            if quran_id is not None:
+                print(f"\nEdition: {quran_id}")
+            print(f"Total Surahs: {edition['total_surahs']}")
+            print(f"Total Verses: {edition['total_verses']}")
+            print(f"Total Words: {edition['total_words']:,}")
+            print(f"Total Characters: {edition['total_characters']:,}")
+            
+            print("\nSurah Breakdown:")
+            print("-" * 30)
+            for surah_info in edition['surahs'][:10]:  # Show first 10 surahs
+                print(f"Surah {surah_info['surah']}: {surah_info['verses']} verses, "
+                      f"{surah_info['words']} words, {surah_info['characters']} characters")
+            
+            if len(edition['surahs']) > 10:
+                print(f"... and {len(edition['surahs']) - 10} more surahs")
+    
+    def build_search_index(self, data: Dict, quran_id: str = 'quran-simple',
+                           normalize: bool = True) -> Optional[SearchIndex]:
+        """
+        Build a reusable search index for one edition
+        
+        Build it once per edition and pass it to search_verses for every query.
+        With normalize=True tashkeel, tatweel and hamza/alef variants are
+        ignored on both sides, so "رحمة" also finds "رَحْمَةً".
+        """
+        store = VerseStore.from_response(data, quran_id)
+        if not store:
+            return None
+        return SearchIndex(store, normalize=normalize_arabic if normalize else None)
     
-    def search_verses(self, data: Dict, search_term: str) -> List[Dict]:
-        """Search for verses containing a specific term"""
+    def search_verses(self, data: Dict, search_term: str,
+                      index: Optional[SearchIndex] = None) -> List[Dict]:
+        """Search for verses containing a specific term (uses index when given)"""
+        if index is not None:
+            return index.verses(index.contains(search_term))
+        
         results = []
         search_term_lower = search_term.lower()
         
@@ -108,8 +264,9 @@ class CompleteQuranFetcher:
 
 # Usage example
 def main():
-    # Initialize Quran fetcher
-    fetcher = CompleteQuranFetcher("REPLACE_WITH_YOUR_KEY")
+    # Initialize Quran fetcher with an on-disk cache (~/.cache/globalquran),
+    # storing the multi-megabyte JSON bodies gzip-compressed
+    fetcher = CompleteQuranFetcher("REPLACE_WITH_YOUR_KEY", cache=DiskCache(compression='gzip'))
     
     # Fetch complete Quran
     quran_data = fetcher.fetch_complete_quran()
@@ -117,9 +274,10 @@ def main():
     if quran_data:
         fetcher.display_quran_overview(quran_data)
         
-        # Example search
+        # Example search (the index is built once and reused for every query)
+        search_index = fetcher.build_search_index(quran_data)
         print("\nSearching for verses containing 'رحمة' (mercy):")
-        mercy_verses = fetcher.search_verses(quran_data, "رحمة")
+        mercy_verses = fetcher.search_verses(quran_data, "رحمة", index=search_index)
         print(f"Found {len(mercy_verses)} verses containing 'رحمة'")
         
         if mercy_verses:
@@ -128,6 +286,8 @@ def main():
                 print(f"{verse['surah']}:{verse['ayah']} {verse['verse']}")
     else:
         print("Failed to fetch Quran data")
+    
+    print(f"\nCache stats: {fetcher.cache.stats()}")
 
 if __name__ == "__main__":
     main()
@@ -3,10 +3,16 @@
 
 import requests
 import json
+from globalquran import get_client
+from globalquran.catalog import parse_catalog
+from globalquran.decoding import response_json
+from globalquran.memo import memoize_catalog
+from globalquran.snapshot import snapshot_list
 
 # API Endpoint
 endpoint = 'https://api.globalquran.com/v1/list/recitor?key=REPLACE_WITH_YOUR_KEY'
 
+@memoize_catalog  # Cached per process; concurrent callers share one fetch
 def fetch_recitors():
     """
     Function to fetch available recitors
@@ -14,11 +20,15 @@ def fetch_recitors():
     Returns:
         dict: API response data or None if error
     """
+    data = snapshot_list('recitor')  # Set GLOBALQURAN_SNAPSHOT to skip the request on cold starts
+    if data is not None:
+        return data
+    
     try:
-        response = requests.get(endpoint)
+        response = get_client().get(endpoint)
         response.raise_for_status()  # Raises an HTTPError for bad responses
         
-        data = response.json()
+        data = response_json(response)
         return data
         
     except requests.exceptions.RequestException as e:
@@ -35,19 +45,19 @@ def display_recitors(data):
     Args:
         data (dict): API response data
     """
-    if not data or 'recitor' not in data:
+    recitors = parse_catalog(data, 'recitor')
+    if not recitors:
         print("No recitor data available")
         return
     
-    recitors = data['recitor']
     print(f"Found {len(recitors)} recitors:")
     print("-" * 50)
     
     for recitor_id, recitor_info in recitors.items():
         print(f"ID: {recitor_id}")
-        print(f"Name: {recitor_info.get('name', 'N/A')}")
-        print(f"Language: {recitor_info.get('language', 'N/A')}")
-        print(f"Style: {recitor_info.get('style', 'N/A')}")
+        print(f"Name: {recitor_info.name or 'N/A'}")
+        print(f"Language: {recitor_info.language_code or 'N/A'}")
+        print(f"Style: {recitor_info.extra.get('style', 'N/A')}")
         print("-" * 30)
 
 # Main execution
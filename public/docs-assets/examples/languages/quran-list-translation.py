@@ -3,10 +3,16 @@
 
 import requests
 import json
+from globalquran import get_client
+from globalquran.catalog import parse_catalog
+from globalquran.decoding import response_json
+from globalquran.memo import memoize_catalog
+from globalquran.snapshot import snapshot_list
 
 # API Endpoint
 endpoint = 'https://api.globalquran.com/v1/list/translation?key=REPLACE_WITH_YOUR_KEY'
 
+@memoize_catalog  # Cached per process; concurrent callers share one fetch
 def fetch_translations():
     """
     Function to fetch available translations
@@ -14,11 +20,15 @@ def fetch_translations():
     Returns:
         dict: API response data or None if error
     """
+    data = snapshot_list('translation')  # Set GLOBALQURAN_SNAPSHOT to skip the request on cold starts
+    if data is not None:
+        return data
+    
     try:
-        response = requests.get(endpoint)
+        response = get_client().get(endpoint)
         response.raise_for_status()  # Raises an HTTPError for bad responses
         
-        data = response.json()
+        data = response_json(response)
         return data
         
     except requests.exceptions.RequestException as e:
@@ -35,19 +45,19 @@ def display_translations(data):
     Args:
         data (dict): API response data
     """
-    if not data or 'translation' not in data:
+    translations = parse_catalog(data, 'translation')
+    if not translations:
         print("No translation data available")
         return
     
-    translations = data['translation']
     print(f"Found {len(translations)} translations:")
     print("-" * 50)
     
     for translation_id, translation_info in translations.items():
         print(f"ID: {translation_id}")
-        print(f"Name: {translation_info.get('name', 'N/A')}")
-        print(f"Language: {translation_info.get('language', 'N/A')}")
-        print(f"Author: {translation_info.get('author', 'N/A')}")
+        print(f"Name: {translation_info.name or 'N/A'}")
+        print(f"Language: {translation_info.language_code or 'N/A'}")
+        print(f"Author: {translation_info.author or 'N/A'}")
         print("-" * 30)
 
 # Main execution
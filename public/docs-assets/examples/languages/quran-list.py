@@ -3,10 +3,16 @@
 
 import requests
 import json
+from globalquran import get_client
+from globalquran.catalog import catalog_of
+from globalquran.decoding import response_json
+from globalquran.memo import memoize_catalog
+from globalquran.snapshot import snapshot_list
 
 # API Endpoint
 endpoint = 'https://api.globalquran.com/v1/quran?key=REPLACE_WITH_YOUR_KEY'
 
+@memoize_catalog  # Cached per process; concurrent callers share one fetch
 def fetch_quran_list():
     """
     Function to fetch Quran list
@@ -14,13 +20,17 @@ def fetch_quran_list():
     Returns:
         dict: API response data or None if error
     """
+    data = snapshot_list('quran')  # Set GLOBALQURAN_SNAPSHOT to skip the request on cold starts
+    if data is not None:
+        return data
+    
     url = 'https://api.globalquran.com/v1/quran?key=REPLACE_WITH_YOUR_KEY'
     
     try:
-        response = requests.get(url, timeout=30)
+        response = get_client().get(url, timeout=30)
         response.raise_for_status()  # Raises an HTTPError for bad responses
         
-        data = response.json()
+        data = response_json(response)
         return data
         
     except requests.exceptions.RequestException as e:
@@ -44,13 +54,13 @@ def display_quran_list(data):
     print("Available Quran Resources:")
     print("========================")
     
-    for quran_id, quran_data in data['quranList'].items():
-        if quran_data['format'] == 'text' and quran_data['type'] == 'quran':
-            print(f"ID: {quran_id}")
-            print(f"Name: {quran_data['english_name']}")
-            print(f"Native Name: {quran_data['native_name']}")
-            print(f"Language: {quran_data['language']}")
-            print("---")
+    # Indexed by format/type once per fetched list
+    for quran_id, quran_data in catalog_of(data).items(format='text', type='quran'):
+        print(f"ID: {quran_id}")
+        print(f"Name: {quran_data['english_name']}")
+        print(f"Native Name: {quran_data['native_name']}")
+        print(f"Language: {quran_data['language']}")
+        print("---")
 
 def display_translations(data):
     """
@@ -66,13 +76,12 @@ def display_translations(data):
     print("\nAvailable Translations:")
     print("=====================")
     
-    for quran_id, quran_data in data['quranList'].items():
-        if quran_data['format'] == 'text' and quran_data['type'] == 'translation':
-            print(f"ID: {quran_id}")
-            print(f"Name: {quran_data['english_name']}")
-            print(f"Native Name: {quran_data['native_name']}")
-            print(f"Language: {quran_data['language']}")
-            print("---")
+    for quran_id, quran_data in catalog_of(data).items(format='text', type='translation'):
+        print(f"ID: {quran_id}")
+        print(f"Name: {quran_data['english_name']}")
+        print(f"Native Name: {quran_data['native_name']}")
+        print(f"Language: {quran_data['language']}")
+        print("---")
 
 def display_recitors(data):
     """
@@ -88,13 +97,12 @@ def display_recitors(data):
     print("\nAvailable Recitors:")
     print("==================")
     
-    for quran_id, quran_data in data['quranList'].items():
-        if quran_data['format'] == 'audio':
-            print(f"ID: {quran_id}")
-            print(f"Name: {quran_data['english_name']}")
-            print(f"Native Name: {quran_data['native_name']}")
-            print(f"Language: {quran_data['language']}")
-            print("---")
+    for quran_id, quran_data in catalog_of(data).items(format='audio'):
+        print(f"ID: {quran_id}")
+        print(f"Name: {quran_data['english_name']}")
+        print(f"Native Name: {quran_data['native_name']}")
+        print(f"Language: {quran_data['language']}")
+        print("---")
 
 # Usage example
 if __name__ == "__main__":
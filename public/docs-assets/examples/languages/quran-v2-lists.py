@@ -3,12 +3,17 @@
 
 import requests
 import json
+from globalquran import get_client
+from globalquran.catalog import parse_catalog
+from globalquran.decoding import response_json
+from globalquran.memo import memoize_catalog
 
 # API Endpoints
 translation_endpoint = 'https://api.globalquran.com/v2/list/translation?key=REPLACE_WITH_YOUR_KEY'
 recitor_endpoint = 'https://api.globalquran.com/v2/list/recitor?key=REPLACE_WITH_YOUR_KEY'
 quran_endpoint = 'https://api.globalquran.com/v2/list/quran?key=REPLACE_WITH_YOUR_KEY'
 
+@memoize_catalog  # Cached per process; concurrent callers share one fetch
 def fetch_v2_list(list_type='translation'):
     """
     Function to fetch v2 API lists
@@ -21,10 +26,10 @@ def fetch_v2_list(list_type='translation'):
     """
     try:
         url = f"https://api.globalquran.com/v2/list/{list_type}?key=REPLACE_WITH_YOUR_KEY"
-        response = requests.get(url)
+        response = get_client().get(url)
         response.raise_for_status()  # Raises an HTTPError for bad responses
         
-        data = response.json()
+        data = response_json(response)
         return data
         
     except requests.exceptions.RequestException as e:
@@ -42,11 +47,13 @@ def display_v2_list(data, list_type):
         data (dict): API response data
         list_type (str): Type of list being displayed
     """
-    if not data or list_type not in data:
+    # v2 responses keep entries under 'list'; parse_catalog also reads the
+    # older per-type key and normalizes language/language_code
+    items = parse_catalog(data, list_type)
+    if not items:
         print(f"No {list_type} data available")
         return
     
-    items = data[list_type]
     print(f"v2 API - {list_type.title()} List:")
     print("=" * 50)
     print(f"Found {len(items)} {list_type}s:")
@@ -54,12 +61,12 @@ def display_v2_list(data, list_type):
     
     for item_id, item_info in items.items():
         print(f"ID: {item_id}")
-        print(f"Name: {item_info.get('name', 'N/A')}")
-        print(f"Language: {item_info.get('language', 'N/A')}")
-        if 'author' in item_info:
-            print(f"Author: {item_info.get('author', 'N/A')}")
-        if 'style' in item_info:
-            print(f"Style: {item_info.get('style', 'N/A')}")
+        print(f"Name: {item_info.name or 'N/A'}")
+        print(f"Language: {item_info.language_code or 'N/A'}")
+        if item_info.author is not None:
+            print(f"Author: {item_info.author}")
+        if 'style' in item_info.extra:
+            print(f"Style: {item_info.extra['style']}")
         print("-" * 20)
 
 def compare_v1_v2():
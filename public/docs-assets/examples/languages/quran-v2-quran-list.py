@@ -3,12 +3,17 @@
 
 import requests
 import json
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Union
+from globalquran import get_client
+from globalquran.catalog import Catalog, CatalogRecord, catalog_of
+from globalquran.decoding import response_json
+from globalquran.memo import memoize_catalog
 
 # Configuration
 API_BASE = 'https://api.globalquran.com/v2'
 API_KEY = 'REPLACE_WITH_YOUR_KEY'  # Replace with your actual API key
 
+@memoize_catalog  # Cached per process; concurrent callers share one fetch
 def fetch_quran_formats(api_key: str) -> Dict[str, Any]:
     """
     Fetch Quran formats from the v2 API
@@ -32,10 +37,10 @@ def fetch_quran_formats(api_key: str) -> Dict[str, Any]:
     }
     
     try:
-        response = requests.get(url, params=params, headers=headers, timeout=30)
+        response = get_client().get(url, params=params, headers=headers, timeout=30)
         response.raise_for_status()
         
-        data = response.json()
+        data = response_json(response)
         return data
         
     except requests.exceptions.RequestException as e:
@@ -85,42 +90,54 @@ def display_quran_formats(data: Dict[str, Any]) -> List[Dict[str, Any]]:
         print("No Quran format data found")
         return []
 
-def filter_by_language(quran_formats: List[Dict[str, Any]], language_code: str) -> List[Dict[str, Any]]:
+def filter_by_language(quran_formats: Union[List[Dict[str, Any]], Catalog],
+                       language_code: str) -> Union[List[Dict[str, Any]], List[CatalogRecord]]:
     """
     Filter Quran formats by language code
     
     Args:
-        quran_formats: List of Quran format objects
+        quran_formats: List of Quran format objects, or a Catalog (indexed lookup)
         language_code: Language code to filter by
         
     Returns:
-        Filtered list of Quran formats
+        Filtered list of Quran formats: the dicts given, or CatalogRecords when
+        given a Catalog
     """
+    if isinstance(quran_formats, Catalog):
+        return quran_formats.query(language_code=language_code)
     return [f for f in quran_formats if f.get('language_code') == language_code]
 
-def get_default_formats(quran_formats: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def get_default_formats(quran_formats: Union[List[Dict[str, Any]], Catalog]
+                        ) -> Union[List[Dict[str, Any]], List[CatalogRecord]]:
     """
     Get default Quran formats
     
     Args:
-        quran_formats: List of Quran format objects
+        quran_formats: List of Quran format objects, or a Catalog (indexed lookup)
         
     Returns:
-        List of default Quran formats
+        List of default Quran formats: the dicts given, or CatalogRecords when
+        given a Catalog
     """
+    if isinstance(quran_formats, Catalog):
+        return quran_formats.query(default=True)
     return [f for f in quran_formats if f.get('default') == True]
 
-def get_formats_by_type(quran_formats: List[Dict[str, Any]], format_type: str) -> List[Dict[str, Any]]:
+def get_formats_by_type(quran_formats: Union[List[Dict[str, Any]], Catalog],
+                        format_type: str) -> Union[List[Dict[str, Any]], List[CatalogRecord]]:
     """
     Get Quran formats by type
     
     Args:
-        quran_formats: List of Quran format objects
+        quran_formats: List of Quran format objects, or a Catalog (indexed lookup)
         format_type: Type to filter by
         
     Returns:
-        List of Quran formats of specified type
+        List of Quran formats of specified type: the dicts given, or
+        CatalogRecords when given a Catalog
     """
+    if isinstance(quran_formats, Catalog):
+        return quran_formats.query(type=format_type)
     return [f for f in quran_formats if f.get('type') == format_type]
 
 def main():
@@ -134,21 +151,22 @@ def main():
         # Example: Filter by language
         if quran_formats:
             print("=== FILTERING EXAMPLES ===")
+            catalog = catalog_of(data)  # Indexed once per fetched list
             
             # Get Arabic formats
-            arabic_formats = filter_by_language(quran_formats, 'ar')
+            arabic_formats = filter_by_language(catalog, 'ar')
             print(f"Arabic formats: {len(arabic_formats)}")
             
             # Get English formats
-            english_formats = filter_by_language(quran_formats, 'en')
+            english_formats = filter_by_language(catalog, 'en')
             print(f"English formats: {len(english_formats)}")
             
             # Get default formats
-            default_formats = get_default_formats(quran_formats)
+            default_formats = get_default_formats(catalog)
             print(f"Default formats: {len(default_formats)}")
             
             # Get translation formats
-            translation_formats = get_formats_by_type(quran_formats, 'translation')
+            translation_formats = get_formats_by_type(catalog, 'translation')
             print(f"Translation formats: {len(translation_formats)}")
         
     except Exception as e:
@@ -4,11 +4,18 @@
 import requests
 import json
 from typing import Dict, List, Optional, Any
+from globalquran import get_client
+from globalquran.abr import AbrSelector, choose_format
+from globalquran.archive import AudioArchive
+from globalquran.audio import AudioPrefetcher, audio_url
+from globalquran.decoding import response_json
+from globalquran.memo import memoize_catalog
 
 # Configuration
 API_BASE = 'https://api.globalquran.com/v2'
 API_KEY = 'REPLACE_WITH_YOUR_KEY'  # Replace with your actual API key
 
+@memoize_catalog  # Cached per process; concurrent callers share one fetch
 def fetch_recitors(api_key: str) -> Dict[str, Any]:
     """
     Fetch recitors from the v2 API
@@ -32,10 +39,10 @@ def fetch_recitors(api_key: str) -> Dict[str, Any]:
     }
     
     try:
-        response = requests.get(url, params=params, headers=headers, timeout=30)
+        response = get_client().get(url, params=params, headers=headers, timeout=30)
         response.raise_for_status()
         
-        data = response.json()
+        data = response_json(response)
         return data
         
     except requests.exceptions.RequestException as e:
@@ -92,12 +99,15 @@ def display_recitors(data: Dict[str, Any]) -> List[Dict[str, Any]]:
         print("No recitor data found")
         return []
 
-def get_best_audio_format(media_info: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+def get_best_audio_format(media_info: Dict[str, Any],
+                          throughput: Optional[float] = None) -> Optional[Dict[str, Any]]:
     """
     Get the best audio format based on available formats
     
     Args:
         media_info: Media information dictionary
+        throughput: Measured download speed in bits/sec; when given, the
+            highest bitrate that still downloads faster than it plays
         
     Returns:
         Best format details or None if no formats available
@@ -105,6 +115,9 @@ def get_best_audio_format(media_info: Dict[str, Any]) -> Optional[Dict[str, Any]
     if not media_info or not isinstance(media_info, dict):
         return None
 
+    if throughput is not None:
+        return choose_format(media_info, throughput)
+
     # Available formats in order of preference
     formats = []
 
@@ -122,25 +135,67 @@ def get_best_audio_format(media_info: Dict[str, Any]) -> Optional[Dict[str, Any]
 
     return formats[0] if formats else None
 
-def construct_audio_url(recitor_id: str, media_info: Dict[str, Any]) -> str:
+def construct_audio_url(recitor_id: str, media_info: Dict[str, Any], verse_number: int = 1) -> str:
     """
     Construct audio URL for a recitor
     
     Args:
         recitor_id: Recitor identifier
         media_info: Media information dictionary
+        verse_number: Global verse number (1-6236)
         
     Returns:
         Constructed audio URL
     """
     best_format = get_best_audio_format(media_info)
     
-    if best_format:
-        file_extension = 'ogg' if best_format['type'] == 'ogg' else 'mp3'
-        return f"https://audio.globalquran.com/{recitor_id}/{best_format['type']}/{best_format['kbs']}kbs/1.{file_extension}"
-    else:
-        # Fallback
-        return f"https://audio.globalquran.com/{recitor_id}/mp3/128kbs/1.mp3"
+    # Fallback to mp3-128 when the recitor lists no known format
+    return audio_url(recitor_id, best_format or {'type': 'mp3', 'kbs': '128'}, verse_number - 1)
+
+def prefetch_recitation(recitor_id: str, media_info: Dict[str, Any], unit: str = 'surah',
+                        number: int = 1, adaptive: bool = False, **kwargs) -> AudioPrefetcher:
+    """
+    Play through a surah, page or juz with the next ayahs downloading ahead
+    
+    Iterate the result to get (global index, local file path) in playback
+    order, Bismillah included; files are kept in a bounded on-disk cache.
+    
+    Args:
+        recitor_id: Recitor identifier
+        media_info: Media information dictionary
+        unit: 'surah', 'page', 'juz' (or 'hizb', 'rub', 'manzil', 'ruku')
+        number: Unit number
+        adaptive: Pick each file's bitrate from measured download speed
+        **kwargs: AudioPrefetcher options (prefetch, workers, cache, client)
+        
+    Returns:
+        AudioPrefetcher for the range
+    """
+    if adaptive and 'selector' not in kwargs:
+        kwargs['selector'] = AbrSelector(media_info)
+    best_format = get_best_audio_format(media_info) or {'type': 'mp3', 'kbs': '128'}
+    return AudioPrefetcher.for_unit(recitor_id, best_format, unit, number, **kwargs)
+
+def download_recitation(recitor_id: str, media_info: Dict[str, Any], directory: str,
+                        **kwargs) -> Dict[str, Any]:
+    """
+    Download every ayah of a recitation into a directory, resumably
+    
+    Rerunning after an interruption skips finished files and resumes
+    partial ones with HTTP Range requests (see globalquran.archive).
+    
+    Args:
+        recitor_id: Recitor identifier
+        media_info: Media information dictionary
+        directory: Target directory (holds the files and manifest.jsonl)
+        **kwargs: AudioArchive options (indices, workers, attempts, checksums, client)
+        
+    Returns:
+        Download stats, with files that kept failing under 'failed'
+    """
+    best_format = get_best_audio_format(media_info) or {'type': 'mp3', 'kbs': '128'}
+    with AudioArchive(recitor_id, best_format, directory, **kwargs) as archive:
+        return archive.run()
 
 def main():
     """Main function to demonstrate v2 recitors API usage"""
@@ -3,12 +3,17 @@
 
 import requests
 import json
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Union
+from globalquran import get_client
+from globalquran.catalog import Catalog, CatalogRecord, catalog_of
+from globalquran.decoding import response_json
+from globalquran.memo import memoize_catalog
 
 # Configuration
 API_BASE = 'https://api.globalquran.com/v2'
 API_KEY = 'REPLACE_WITH_YOUR_KEY'  # Replace with your actual API key
 
+@memoize_catalog  # Cached per process; concurrent callers share one fetch
 def fetch_translations(api_key: str) -> Dict[str, Any]:
     """
     Fetch translations from the v2 API
@@ -32,10 +37,10 @@ def fetch_translations(api_key: str) -> Dict[str, Any]:
     }
     
     try:
-        response = requests.get(url, params=params, headers=headers, timeout=30)
+        response = get_client().get(url, params=params, headers=headers, timeout=30)
         response.raise_for_status()
         
-        data = response.json()
+        data = response_json(response)
         return data
         
     except requests.exceptions.RequestException as e:
@@ -85,29 +90,37 @@ def display_translations(data: Dict[str, Any]) -> List[Dict[str, Any]]:
         print("No translation data found")
         return []
 
-def filter_by_language(translations: List[Dict[str, Any]], language_code: str) -> List[Dict[str, Any]]:
+def filter_by_language(translations: Union[List[Dict[str, Any]], Catalog],
+                       language_code: str) -> Union[List[Dict[str, Any]], List[CatalogRecord]]:
     """
     Filter translations by language code
     
     Args:
-        translations: List of translation objects
+        translations: List of translation objects, or a Catalog (indexed lookup)
         language_code: Language code to filter by
         
     Returns:
-        Filtered list of translations
+        Filtered list of translations: the dicts given, or CatalogRecords when
+        given a Catalog
     """
+    if isinstance(translations, Catalog):
+        return translations.query(language_code=language_code)
     return [t for t in translations if t.get('language_code') == language_code]
 
-def get_default_translations(translations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def get_default_translations(translations: Union[List[Dict[str, Any]], Catalog]
+                             ) -> Union[List[Dict[str, Any]], List[CatalogRecord]]:
     """
     Get default translations
     
     Args:
-        translations: List of translation objects
+        translations: List of translation objects, or a Catalog (indexed lookup)
         
     Returns:
-        List of default translations
+        List of default translations: the dicts given, or CatalogRecords when
+        given a Catalog
     """
+    if isinstance(translations, Catalog):
+        return translations.query(default=True)
     return [t for t in translations if t.get('default') == True]
 
 def main():
@@ -121,17 +134,18 @@ def main():
         # Example: Filter by language
         if translations:
             print("=== FILTERING EXAMPLES ===")
+            catalog = catalog_of(data)  # Indexed once per fetched list
             
             # Get English translations
-            english_translations = filter_by_language(translations, 'en')
+            english_translations = filter_by_language(catalog, 'en')
             print(f"English translations: {len(english_translations)}")
             
             # Get Arabic translations
-            arabic_translations = filter_by_language(translations, 'ar')
+            arabic_translations = filter_by_language(catalog, 'ar')
             print(f"Arabic translations: {len(arabic_translations)}")
             
             # Get default translations
-            default_translations = get_default_translations(translations)
+            default_translations = get_default_translations(catalog)
             print(f"Default translations: {len(default_translations)}")
         
     except Exception as e:
@@ -0,0 +1,21 @@
+# Shared setup for the tests: run with `python -m pytest tests` from the
+# examples folder. The helper package and the benchmarks' mock server are
+# imported from their folders, as the benchmark scripts do.
+
+import os
+import sys
+
+import pytest
+
+EXAMPLES_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(EXAMPLES_DIR, 'benchmarks'))
+sys.path.insert(0, EXAMPLES_DIR)
+
+from mock_server import MockQuranServer  # noqa: E402
+
+
+@pytest.fixture
+def mock():
+    """A fresh mock API server for one test"""
+    with MockQuranServer() as server:
+        yield server
@@ -0,0 +1,42 @@
+# Side-by-side editions (aligned.py) from combined and per-edition requests
+
+from globalquran.aligned import fetch_aligned
+
+
+class FakeClient:
+    """Answers surah-keyed for combined requests and edition-keyed for one ID"""
+
+    def __init__(self, verses):
+        self.verses = verses
+        self.paths = []
+
+    def get_json(self, path):
+        self.paths.append(path)
+        ids = path.rsplit('/', 1)[1].split(',')
+        if len(ids) > 1:
+            return {'quran': {'112': {'1': {'surah': 112, 'ayah': 1, 'verse': '?'}}}}
+        return {'quran': {ids[0]: {str(6222 + ayah): {'surah': 112, 'ayah': ayah,
+                                                      'verse': self.verses[ids[0]]}
+                                   for ayah in range(1, 5)}}}
+
+
+def test_surah_keyed_combined_response_is_not_given_to_the_first_id():
+    client = FakeClient({'quran-simple': 'ar', 'en.sahih': 'en'})
+    table = fetch_aligned(['quran-simple', 'en.sahih'], 'surah', 112, client=client)
+    assert not table.missing
+    assert table.column('quran-simple') == ['ar'] * 4
+    assert table.column('en.sahih') == ['en'] * 4
+    assert client.paths == ['/v1/surah/112/quran-simple,en.sahih',
+                            '/v1/surah/112/quran-simple', '/v1/surah/112/en.sahih']
+
+
+def test_non_contiguous_response_counts_as_missing(capsys):
+    class Gapped(FakeClient):
+        def get_json(self, path):
+            return {'quran': {'en.sahih': {
+                '1': {'surah': 1, 'ayah': 1, 'verse': 'a'},
+                '3': {'surah': 1, 'ayah': 3, 'verse': 'c'}}}}
+
+    table = fetch_aligned(['en.sahih'], 'surah', 1, client=Gapped({}))
+    assert table.missing == ['en.sahih']
+    assert 'Unexpected response' in capsys.readouterr().out
@@ -0,0 +1,162 @@
+# Resumable audio downloads (archive.py) against the mock audio host
+
+import hashlib
+import os
+import threading
+import time
+
+import pytest
+
+from mock_server import LAST_MODIFIED, MockQuranServer, audio_body
+
+from globalquran import QuranClient
+from globalquran.archive import JOURNAL_NAME, PART_SUFFIX, AudioArchive, file_sha256
+from globalquran.circuit import CLOSED, CircuitBreaker
+from globalquran.retry import RateLimiter, RetryPolicy
+
+RECITOR = 'ar.alafasy'
+MEDIA_FORMAT = {'type': 'mp3', 'kbs': '128'}
+INDEX = 0
+
+
+def body(index=INDEX):
+    """The file's bytes as served; the mock derives them from the path and the client's key"""
+    return audio_body(f"/{RECITOR}/mp3/128kbs/{index + 1}.mp3?key=test")
+
+
+def archive(mock, directory, indices=(INDEX,), **kwargs):
+    client = QuranClient(api_key='test', base_url=mock.base_url,
+                         retry=RetryPolicy(backoff_base=0.001))
+    return AudioArchive(RECITOR, MEDIA_FORMAT, directory, indices=indices, client=client,
+                        base_url=mock.base_url, **kwargs)
+
+
+def leave_part(downloader, data, validator=LAST_MODIFIED):
+    """Put a .part file and its journaled validator on disk, as a stopped run does"""
+    path = downloader.path(INDEX)
+    with open(path + PART_SUFFIX, 'wb') as f:
+        f.write(data)
+    downloader.journal.record(os.path.basename(path), validator=validator)
+    return path
+
+
+def test_downloads_every_file(mock, tmp_path):
+    indices = range(10)
+    with archive(mock, str(tmp_path), indices=indices, workers=4) as downloader:
+        stats = downloader.run()
+        assert stats['completed'] == 10 and not stats['failed']
+        for index in indices:
+            assert file_sha256(downloader.path(index)) == hashlib.sha256(body(index)).hexdigest()
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(PART_SUFFIX)]
+
+    with archive(mock, str(tmp_path), indices=indices) as again:
+        stats = again.run()
+    assert stats['skipped'] == 10 and stats['completed'] == 0
+
+
+def test_partial_file_resumes_with_range(mock, tmp_path):
+    payload = body()
+    half = len(payload) // 2
+    with archive(mock, str(tmp_path)) as downloader:
+        path = leave_part(downloader, payload[:half])
+        stats = downloader.run()
+    assert stats['resumed'] == 1 and stats['restarted'] == 0
+    assert stats['bytes_resumed'] == half
+    assert stats['bytes_downloaded'] == len(payload) - half
+    assert mock.ranged == 1
+    with open(path, 'rb') as f:
+        assert f.read() == payload
+
+
+def test_resume_asks_for_uncompressed_bytes(tmp_path):
+    payload = body()
+    half = len(payload) // 2
+    with MockQuranServer(audio_compression=True) as mock:
+        with archive(mock, str(tmp_path), attempts=2) as downloader:
+            path = leave_part(downloader, payload[:half])
+            stats = downloader.run()
+    assert stats['resumed'] == 1 and not stats['failed']
+    assert stats['bytes_downloaded'] == len(payload) - half
+    with open(path, 'rb') as f:
+        assert f.read() == payload
+
+
+def test_changed_file_restarts_when_if_range_fails(mock, tmp_path):
+    payload = body()
+    with archive(mock, str(tmp_path)) as downloader:
+        path = leave_part(downloader, b'x' * (len(payload) // 2),
+                          validator='Sat, 01 Jan 2000 00:00:00 GMT')
+        stats = downloader.run()
+    assert stats['resumed'] == 0 and stats['restarted'] == 1
+    assert stats['bytes_downloaded'] == len(payload)
+    assert mock.ranged == 0
+    with open(path, 'rb') as f:
+        assert f.read() == payload
+
+
+def test_part_longer_than_file_restarts_after_416(mock, tmp_path):
+    payload = body()
+    with archive(mock, str(tmp_path)) as downloader:
+        path = leave_part(downloader, payload + b'trailing bytes')
+        stats = downloader.run()
+    assert stats['restarted'] == 1 and stats['completed'] == 1 and not stats['failed']
+    with open(path, 'rb') as f:
+        assert f.read() == payload
+
+
+def test_416_on_last_attempt_reports_why(mock, tmp_path):
+    with archive(mock, str(tmp_path), attempts=1) as downloader:
+        leave_part(downloader, body() + b'trailing bytes')
+        stats = downloader.run()
+    assert '416' in stats['failed'][INDEX]
+    assert stats['failed'][INDEX] != 'None'
+
+
+def test_checksum_mismatch_fails_and_discards(mock, tmp_path):
+    with archive(mock, str(tmp_path), attempts=2, checksums={INDEX: '0' * 64}) as downloader:
+        stats = downloader.run()
+        path = downloader.path(INDEX)
+    assert 'checksum mismatch' in stats['failed'][INDEX]
+    assert stats['completed'] == 0
+    assert not os.path.exists(path) and not os.path.exists(path + PART_SUFFIX)
+    assert mock.requests == 2
+
+
+def test_api_rate_limit_does_not_pace_audio(mock, tmp_path):
+    breaker = CircuitBreaker()
+    client = QuranClient(api_key='test', base_url='http://api.invalid', breaker=breaker,
+                         rate_limiter=RateLimiter(rate=1, burst=1))
+    with AudioArchive(RECITOR, MEDIA_FORMAT, str(tmp_path), indices=range(20), client=client,
+                      base_url=mock.base_url, workers=4) as downloader:
+        stats = downloader.run()
+    assert stats['completed'] == 20 and not stats['failed']
+    assert client.metrics.snapshot()['throttle_seconds'] == 0
+    assert breaker.state == CLOSED
+
+
+def test_stopped_run_resumes_where_it_left_off(tmp_path):
+    indices = range(6)
+    size = sum(len(body(index)) for index in indices)
+    with MockQuranServer(bandwidth=1024 * 1024) as mock:
+        with archive(mock, str(tmp_path), indices=indices, workers=3) as first:
+            def stop_partway():
+                while first.stats()['bytes_downloaded'] < size // 3:
+                    time.sleep(0.002)
+                first.stop()
+            watcher = threading.Thread(target=stop_partway)
+            watcher.start()
+            stopped = first.run()
+            watcher.join()
+        assert stopped['completed'] < len(indices)
+
+        with archive(mock, str(tmp_path), indices=indices, workers=3) as second:
+            stats = second.run()
+            assert stats['skipped'] == stopped['completed']
+            assert stats['completed'] == len(indices) - stopped['completed']
+            assert stats['resumed'] > 0 and not stats['failed']
+            # Bytes already on disk are not fetched again
+            assert stopped['bytes_downloaded'] + stats['bytes_downloaded'] == pytest.approx(
+                size, rel=0.05)
+            for index in indices:
+                assert file_sha256(second.path(index)) == hashlib.sha256(body(index)).hexdigest()
+    assert os.path.exists(os.path.join(tmp_path, JOURNAL_NAME))
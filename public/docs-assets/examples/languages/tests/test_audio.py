@@ -0,0 +1,45 @@
+# Ayah audio prefetching (audio.py) against the mock audio host
+
+import time
+
+import pytest
+import requests
+
+from globalquran import QuranClient
+from globalquran.audio import AudioPrefetcher
+from globalquran.cache import DiskCache
+from globalquran.circuit import CLOSED, CircuitBreaker
+from globalquran.retry import RateLimiter, RetryPolicy
+
+RECITOR = 'ar.alafasy'
+MEDIA_FORMAT = {'type': 'mp3', 'kbs': '128'}
+
+
+def api_client(**kwargs):
+    """A client whose API is elsewhere, with a strict API rate limit"""
+    return QuranClient(api_key='test', base_url='http://api.invalid',
+                       rate_limiter=RateLimiter(rate=1, burst=1), **kwargs)
+
+
+def test_reading_ahead_does_not_spend_the_api_rate_limit(mock, tmp_path):
+    client = api_client()
+    start = time.monotonic()
+    with AudioPrefetcher(RECITOR, MEDIA_FORMAT, range(10), client=client,
+                         cache=DiskCache(str(tmp_path)), base_url=mock.base_url) as prefetcher:
+        paths = [path for _, path in prefetcher]
+    assert len(paths) == 10 and prefetcher.stats()['downloads'] == 10
+    assert client.metrics.snapshot()['throttle_seconds'] == 0
+    assert time.monotonic() - start < 2.0
+
+
+def test_audio_errors_do_not_open_the_api_breaker(mock, tmp_path):
+    mock.error_rate = 1.0
+    breaker = CircuitBreaker(failure_threshold=1)
+    client = api_client(breaker=breaker, retry=RetryPolicy(max_retries=0))
+    with AudioPrefetcher(RECITOR, MEDIA_FORMAT, range(3), client=client, prefetch=0,
+                         cache=DiskCache(str(tmp_path)), base_url=mock.base_url) as prefetcher:
+        for position in range(3):
+            with pytest.raises(requests.HTTPError):
+                prefetcher.fetch(position)
+    assert mock.requests == 3
+    assert breaker.state == CLOSED and breaker.failures == 0
@@ -0,0 +1,55 @@
+# Ayah request coalescing (batching.py)
+
+from bench_utils import load_example
+
+from globalquran import QuranClient
+from globalquran.batching import AyahBatcher, plan_requests
+from globalquran.metadata import global_ayah_index
+
+
+def wanted(references, quran_ids=('quran-simple',)):
+    return {global_ayah_index(*map(int, reference.split(':'))): set(quran_ids)
+            for reference in references}
+
+
+def test_page_shared_by_several_surahs_is_one_request():
+    plan = plan_requests(wanted(['112:1', '112:2', '112:3', '113:1', '113:2', '113:3',
+                                 '114:1', '114:2', '114:3']))
+    assert [unit for unit, _, _ in plan] == [('page', '604')]
+    assert len(plan[0][2]) == 9
+
+
+def test_whole_surah_beats_shared_page():
+    references = ['2:%d' % ayah for ayah in range(1, 287)] + ['3:1']
+    plan = plan_requests(wanted(references))
+    assert [unit for unit, _, _ in plan] == [('surah', '2'), ('ayah', '3:1')]
+
+
+def test_batched_lookups_across_surahs(mock):
+    client = QuranClient(api_key='test', base_url=mock.base_url)
+    with AyahBatcher(client) as batcher:
+        verses = batcher.fetch_many(['112:1', '113:1', '114:1'], ['quran-simple', 'en.sahih'])
+        assert batcher.stats() == {'lookups': 6, 'requests': 1}
+    for (reference, quran_id), verse in verses.items():
+        assert '%d:%d' % (verse['surah'], verse['ayah']) == reference
+
+
+def test_surah_keyed_response_is_not_given_to_the_first_id():
+    class SurahKeyed(AyahBatcher):
+        def _fetch(self, unit, quran_ids):
+            return {'quran': {'1': {'1': {'surah': 1, 'ayah': 1, 'verse': '?'}}}}
+
+    with SurahKeyed(client=object()) as batcher:
+        verses = batcher.fetch_many(['1:1'], ['quran-simple', 'en.sahih'])
+        assert verses == {('1:1', 'quran-simple'): None, ('1:1', 'en.sahih'): None}
+        assert batcher.fetch_many(['1:1'], ['en.sahih'])[('1:1', 'en.sahih')]['verse'] == '?'
+
+
+def test_invalid_reference_with_a_batcher_returns_none(mock, capsys):
+    example = load_example('quran-by-ayah')
+    client = QuranClient(api_key='test', base_url=mock.base_url)
+    with AyahBatcher(client) as batcher:
+        api = example.GlobalQuranAPI('test', client=client, batcher=batcher)
+        assert api.fetch_ayah('bogus') is None
+        assert api.fetch_ayah('1:1') is not None
+    assert 'Invalid ayah reference' in capsys.readouterr().out
@@ -0,0 +1,59 @@
+# Response caching and revalidation (cache.py, QuranClient.get_json)
+
+import os
+
+import pytest
+
+from globalquran import QuranClient
+from globalquran.cache import CacheEntry, DiskCache
+
+PATH = '/v1/ayah/1:1/quran-simple'
+
+
+@pytest.fixture
+def client(mock, tmp_path):
+    cache = DiskCache(str(tmp_path), ttl=0)  # Every lookup revalidates
+    with QuranClient(api_key='test', base_url=mock.base_url, cache=cache) as client:
+        yield client
+
+
+def test_not_modified_serves_the_cached_body(client, mock):
+    first = client.get_json(PATH)
+    assert client.get_json(PATH) == first
+    assert mock.requests == 2
+    assert client.cache.stats()['revalidations'] == 1
+
+
+def test_body_evicted_during_revalidation_is_fetched_again(client, mock, monkeypatch):
+    first = client.get_json(PATH)
+    key = client.cache.make_key(client.build_url(PATH))
+    body_path = client.cache.get(key).path
+
+    # Another process evicts the entry while the conditional request is in flight
+    send = client.get
+
+    def get_then_evict(path, **kwargs):
+        response = send(path, **kwargs)
+        if response.status_code == 304:
+            os.remove(body_path)
+        return response
+
+    monkeypatch.setattr(client, 'get', get_then_evict)
+    assert client.get_json(PATH) == first
+    assert mock.requests == 3  # The 304, then a full fetch without validators
+    assert os.path.exists(client.cache.get(key).path)
+
+
+def test_unreadable_fresh_entry_is_a_miss(mock, tmp_path, monkeypatch):
+    with QuranClient(api_key='test', base_url=mock.base_url,
+                     cache=DiskCache(str(tmp_path))) as client:
+        first = client.get_json(PATH)
+
+        def gone(entry):
+            raise FileNotFoundError(entry.path)
+
+        # Removed between the lookup and the read
+        monkeypatch.setattr(CacheEntry, 'read', gone)
+        assert client.get_json(PATH) == first
+        assert mock.requests == 2
+        assert client.cache.stats()['misses'] == 2
@@ -0,0 +1,59 @@
+# Local edition lookups (library.py) and falling back to the API
+
+import os
+
+import pytest
+
+from bench_utils import load_example
+
+from globalquran import QuranClient
+from globalquran.library import EditionLibrary
+from globalquran.store import VerseStore
+
+QURAN_ID = 'quran-simple'
+
+
+@pytest.fixture
+def saved(mock, tmp_path):
+    """A library directory holding one complete edition file"""
+    with QuranClient(api_key='test', base_url=mock.base_url) as client:
+        store = VerseStore.from_response(client.get_json(f'/v1/quran/{QURAN_ID}'), QURAN_ID)
+    with EditionLibrary(str(tmp_path)) as library:
+        path = library.save(store)
+    return path
+
+
+def test_saved_edition_serves_pages(saved, tmp_path):
+    with EditionLibrary(str(tmp_path)) as library:
+        page = library.page(604, QURAN_ID)
+    assert len(page['quran'][QURAN_ID]) == 15
+
+
+@pytest.mark.parametrize('damage', ['truncate', 'garble'])
+def test_unreadable_file_is_a_miss(saved, tmp_path, damage):
+    if damage == 'truncate':
+        with open(saved, 'r+b') as f:
+            f.truncate(os.path.getsize(saved) // 2)
+    else:
+        with open(saved, 'r+b') as f:
+            f.seek(20)
+            f.write(b'\xff' * 16)  # Inside the JSON header
+    with EditionLibrary(str(tmp_path)) as library:
+        with pytest.warns(RuntimeWarning, match='using the API instead'):
+            assert library.page(1, QURAN_ID) is None
+        assert library.juz(30, QURAN_ID) is None  # Remembered; no second warning
+
+
+def test_fetchers_fall_back_to_the_api(saved, tmp_path, mock):
+    with open(saved, 'r+b') as f:
+        f.truncate(os.path.getsize(saved) // 2)
+    client = QuranClient(api_key='test', base_url=mock.base_url)
+    with EditionLibrary(str(tmp_path)) as library, pytest.warns(RuntimeWarning):
+        page_fetcher = load_example('quran-by-page').QuranPageFetcher(
+            'test', client=client, library=library)
+        juz_fetcher = load_example('quran-by-juz').QuranJuzFetcher(
+            'test', client=client, library=library)
+        sent = mock.requests
+        assert page_fetcher.fetch_page(604, QURAN_ID)['quran']
+        assert juz_fetcher.fetch_juz(30, QURAN_ID)['quran']
+    assert mock.requests == sent + 2
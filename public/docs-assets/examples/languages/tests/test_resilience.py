@@ -0,0 +1,165 @@
+# Retry, circuit breaker and hedging behaviour against the mock API
+
+import threading
+import time
+
+import pytest
+
+from globalquran import QuranClient
+from globalquran.circuit import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError
+from globalquran.hedging import Hedger
+from globalquran.retry import RateLimiter, RetryPolicy
+
+PATH = '/v1/ayah/1:1/quran-simple'
+
+
+class FakeResponse:
+    """Stands in for requests.Response in the hedging tests"""
+
+    def __init__(self, name):
+        self.name = name
+        self.closed = threading.Event()
+
+    def close(self):
+        self.closed.set()
+
+
+def primed_hedger(**kwargs):
+    """A Hedger that hedges after 50ms from its first request on"""
+    hedger = Hedger(min_samples=1, budget=1.0, max_delay=0.05, **kwargs)
+    hedger.latencies.record(0.01)
+    return hedger
+
+
+def test_breaker_opens_after_threshold_and_fails_fast(mock):
+    mock.error_rate = 1.0
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30)
+    with QuranClient(api_key='test', base_url=mock.base_url, breaker=breaker,
+                     retry=RetryPolicy(max_retries=0)) as client:
+        for _ in range(2):
+            assert client.get(PATH).status_code == 503
+            assert breaker.state == CLOSED
+        assert client.get(PATH).status_code == 503
+        assert breaker.state == OPEN
+        sent = mock.requests
+        with pytest.raises(CircuitOpenError):
+            client.get(PATH)
+    assert mock.requests == sent
+    assert breaker.stats()['opened'] == 1
+    assert breaker.stats()['rejected'] == 1
+
+
+def test_breaker_half_opens_after_cooldown_and_closes_on_success(mock):
+    mock.error_rate = 1.0
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.2)
+    with QuranClient(api_key='test', base_url=mock.base_url, breaker=breaker,
+                     retry=RetryPolicy(max_retries=0)) as client:
+        client.get(PATH)
+        assert breaker.state == OPEN
+        time.sleep(0.25)
+        breaker.before_request()  # The cooldown has passed: one probe is let through
+        assert breaker.state == HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()  # ...and only one
+        breaker.record_failure()
+        assert breaker.state == OPEN  # A failed probe reopens at once
+
+        mock.error_rate = 0.0
+        time.sleep(0.25)
+        assert client.get(PATH).status_code == 200
+        assert breaker.state == CLOSED
+        assert breaker.failures == 0
+
+
+def test_other_hosts_bypass_rate_limiter_and_breaker(mock):
+    mock.error_rate = 1.0
+    breaker = CircuitBreaker(failure_threshold=1)
+    # The API lives elsewhere; the mock stands in for the audio CDN
+    with QuranClient(api_key='test', base_url='http://api.invalid', breaker=breaker,
+                     rate_limiter=RateLimiter(rate=0.5, burst=1),
+                     retry=RetryPolicy(max_retries=0)) as client:
+        start = time.monotonic()
+        for _ in range(3):
+            assert client.get(mock.base_url + PATH).status_code == 503
+        elapsed = time.monotonic() - start
+    assert elapsed < 1.0
+    assert client.metrics.snapshot()['throttle_seconds'] == 0
+    assert breaker.state == CLOSED and breaker.failures == 0
+
+
+def test_retry_after_is_honored(mock):
+    mock.rate_limit = 1
+    with QuranClient(api_key='test', base_url=mock.base_url,
+                     retry=RetryPolicy(max_retries=2, backoff_base=0.01)) as client:
+        time.sleep(1.01 - time.monotonic() % 1)  # Start of the mock's one-second window
+        assert client.get(PATH).status_code == 200
+        start = time.monotonic()
+        response = client.get(PATH)  # Same second: a 429 with Retry-After: 1
+        elapsed = time.monotonic() - start
+    assert response.status_code == 200
+    assert mock.throttled == 1
+    stats = client.metrics.snapshot()
+    assert stats['retries'] == 1
+    assert stats['reasons'] == {'429': 1}
+    assert 1.0 <= stats['backoff_seconds'] < 1.1
+    assert elapsed >= 1.0
+
+
+def test_retry_after_beyond_limit_is_returned(mock):
+    mock.rate_limit = 1
+    with QuranClient(api_key='test', base_url=mock.base_url,
+                     retry=RetryPolicy(max_retries=2, max_retry_after=0.5)) as client:
+        time.sleep(1.01 - time.monotonic() % 1)
+        client.get(PATH)
+        response = client.get(PATH)
+    assert response.status_code == 429
+    assert client.metrics.snapshot()['giveups'] == 1
+    assert client.metrics.snapshot()['retries'] == 0
+
+
+def test_losing_hedge_is_closed():
+    hedger = primed_hedger()
+    slow, fast = FakeResponse('slow'), FakeResponse('fast')
+    calls = iter([(0.3, slow), (0.0, fast)])
+    lock = threading.Lock()
+
+    def send():
+        with lock:
+            delay, response = next(calls)
+        time.sleep(delay)
+        return response
+
+    try:
+        assert hedger.run(send) is fast
+        assert hedger.stats()['hedges'] == 1
+        assert hedger.stats()['hedge_wins'] == 1
+        assert slow.closed.wait(1.0)  # Closed as soon as it arrives
+        assert not fast.closed.is_set()
+    finally:
+        hedger.close()
+
+
+def test_no_hedge_when_answer_is_fast():
+    hedger = primed_hedger()
+    try:
+        response = FakeResponse('only')
+        assert hedger.run(lambda: response) is response
+        assert hedger.stats()['hedges'] == 0
+    finally:
+        hedger.close()
+
+
+def test_queue_time_does_not_trigger_a_hedge():
+    hedger = primed_hedger(workers=2)
+    release = threading.Event()
+    try:
+        # Both sending threads are busy, so the next request waits in the queue
+        busy = [hedger._executor.submit(release.wait, 1.0) for _ in range(2)]
+        threading.Timer(0.2, release.set).start()
+        response = FakeResponse('queued')
+        assert hedger.run(lambda: response) is response
+        assert hedger.stats()['hedges'] == 0
+        for future in busy:
+            future.result()
+    finally:
+        hedger.close()
@@ -0,0 +1,33 @@
+# Verse search (search.py): substring queries through the vocabulary n-grams
+
+import pytest
+
+from globalquran.search import SearchIndex
+from globalquran.store import VerseStore
+
+TEXTS = ['In the name of Allah, the Entirely Merciful, the Especially Merciful',
+         'All praise is due to Allah, Lord of the worlds',
+         'The Entirely Merciful, the Especially Merciful',
+         'Sovereign of the Day of Recompense',
+         'It is You we worship and You we ask for help']
+
+
+@pytest.fixture(scope='module')
+def index():
+    store = VerseStore.from_verses([{'surah': 2, 'ayah': ayah, 'verse': text}
+                                    for ayah, text in enumerate(TEXTS, 1)], 'test')
+    return SearchIndex(store)
+
+
+@pytest.mark.parametrize('fragment', ['merci', 'erciful', 'o', 'of', 'ord', 'zzz', 'ful,'])
+def test_substring_tokens_match_a_vocabulary_scan(index, fragment):
+    assert index.substring_tokens(fragment) == [token for token in index.vocabulary
+                                                if fragment in token]
+
+
+@pytest.mark.parametrize('query', ['ercif', 'Merciful', 'y Merci', 'ful, the Esp', 'of th',
+                                   'we', 'xyz', 'e'])
+def test_contains_matches_a_verse_scan(index, query):
+    expected = [index.store.start + local for local, text in enumerate(TEXTS)
+                if query.casefold() in text.casefold()]
+    assert index.contains(query) == expected
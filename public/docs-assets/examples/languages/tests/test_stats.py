@@ -0,0 +1,47 @@
+# Word and character counts (stats.py) and the example's per-edition statistics
+
+import sys
+
+import pytest
+
+from bench_utils import load_example
+
+from globalquran import stats
+from globalquran.store import VerseStore
+
+# Every character str.split() splits on, ASCII and multi-byte alike
+WHITESPACE = [chr(code) for code in range(sys.maxunicode + 1) if chr(code).isspace()]
+TEXTS = (['word' + space + 'word' for space in WHITESPACE]
+         + ['بِسْمِ اللَّهِ الرَّحْمَٰنِ', 'زیر‌نویس دو', 'end　', ' ', 'a  b', ''])
+
+
+def store_of(texts, quran_id='test'):
+    return VerseStore.from_verses([{'surah': 2, 'ayah': ayah, 'verse': text}
+                                   for ayah, text in enumerate(texts, 1)], quran_id)
+
+
+@pytest.mark.parametrize('numpy', [True, False], ids=['numpy', 'loop'])
+def test_counts_match_str_split_and_len(numpy, monkeypatch):
+    if not numpy:
+        monkeypatch.setattr(stats, 'np', None)
+    elif stats.np is None:
+        pytest.skip('NumPy is not installed')
+    words, characters = stats.verse_counts(store_of(TEXTS))
+    assert [int(count) for count in words] == [len(text.split()) for text in TEXTS]
+    assert [int(count) for count in characters] == [len(text) for text in TEXTS]
+
+
+def test_statistics_are_reported_per_edition():
+    example = load_example('quran-complete')
+    fetcher = example.CompleteQuranFetcher('test')
+    data = {'quran': {
+        'quran-simple': {'1': {'surah': 1, 'ayah': 1, 'verse': 'one two three'}},
+        'en.sahih': {'1': {'surah': 1, 'ayah': 1, 'verse': 'one'}},
+    }}
+    result = fetcher.get_quran_statistics(data)
+    assert result['editions']['quran-simple']['total_words'] == 3
+    assert result['editions']['en.sahih']['total_words'] == 1
+    assert result['total_words'] == 3 and result['total_verses'] == 1
+
+    single = fetcher.get_quran_statistics({'quran': {'en.sahih': data['quran']['en.sahih']}})
+    assert 'editions' not in single and single['total_words'] == 1